@@ -4,9 +4,22 @@
 from andyfinder.version import gCurVerInfo, gCurVerDesc, MyVersionHistory
 from andyfinder.constants import *
 from andyfinder.models import SearchResult
-from andyfinder.main_window import MainWindow
-from andyfinder.tab_content import TabContent
-from andyfinder.theme import apply_light_theme
+
+
+def __getattr__(name):
+    # Qt 위젯 모듈은 처음 사용할 때 import (시작 시간 단축, 명령줄 검색은 Qt 없이 실행)
+    if name == 'MainWindow':
+        from andyfinder.main_window import MainWindow
+        return MainWindow
+    if name == 'apply_light_theme':
+        from andyfinder.theme import apply_light_theme
+        return apply_light_theme
+    if name == 'TabContent':
+        # TabContent(에디터/검색/워커 전체)는 첫 탭을 만들 때 import
+        from andyfinder.tab_content import TabContent
+        return TabContent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __version__ = gCurVerInfo
 __all__ = [
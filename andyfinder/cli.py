@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+명령줄 검색 (python main.py search ...) - Qt를 import하지 않음
+
+GUI와 같은 로더(text_loader: 인코딩 감지/디코딩)와 같은 매칭 함수(matcher.build_matcher)를 사용하고,
+결과는 찾는 즉시 text(grep 형식) 또는 JSONL로 출력한다.
+
+    python main.py search "type=activity_resumed" dumpstate.txt
+    python main.py search -r -C 2 "am_(crash|anr)" dumpstate.txt
+    python main.py search -f "dumpstate구조" --format jsonl dumpstate.txt
+
+종료 코드 (grep과 동일): 0 일치 있음, 1 일치 없음, 2 오류
+"""
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional, TextIO
+
+from andyfinder.favorites import QUERY_FAVORITES_PATH, find_favorite, load_favorite_nodes
+from andyfinder.matcher import Matcher, build_matcher
+from andyfinder.text_loader import read_text
+
+EXIT_MATCH = 0
+EXIT_NO_MATCH = 1
+EXIT_ERROR = 2
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog='main.py search',
+        description="AndyFinder 명령줄 검색 (GUI와 같은 로더/매칭 규칙)",
+    )
+    parser.add_argument('pattern', nargs='?', help="검색어 (-f 사용 시 생략)")
+    parser.add_argument('files', nargs='*', metavar='FILE', help="검색할 파일")
+    parser.add_argument('-r', '--regex', action='store_true', help="정규식 검색 (기본: 일반 문자열)")
+    parser.add_argument('-s', '--case-sensitive', action='store_true', help="대소문자 구분 (기본: 무시)")
+    parser.add_argument('-f', '--favorite', metavar='NAME',
+                        help="즐겨찾기 검색어 사용 (이름 또는 폴더/이름 경로, 정규식으로 검색)")
+    parser.add_argument('--favorites-file', default=QUERY_FAVORITES_PATH, help="즐겨찾기 파일 (기본: %(default)s)")
+    parser.add_argument('-B', '--before', type=int, default=0, metavar='N', help="매칭 라인 이전 N줄 함께 출력")
+    parser.add_argument('-A', '--after', type=int, default=0, metavar='N', help="매칭 라인 이후 N줄 함께 출력")
+    parser.add_argument('-C', '--context', type=int, metavar='N', help="-B N -A N과 같음")
+    parser.add_argument('--format', choices=('text', 'jsonl'), default='text', help="출력 형식")
+    parser.add_argument('-c', '--count', action='store_true', help="파일별 매칭 라인 수만 출력")
+    return parser
+
+
+def resolve_query(args, parser: argparse.ArgumentParser):
+    """(검색어, 모드, 파일 목록) - 즐겨찾기를 쓰면 첫 위치 인자도 파일"""
+    files = list(args.files)
+    if args.favorite:
+        if args.pattern:
+            files.insert(0, args.pattern)
+        nodes = load_favorite_nodes(args.favorites_file)
+        query = find_favorite(nodes, args.favorite)
+        if not query:
+            parser.exit(EXIT_ERROR, f"즐겨찾기를 찾을 수 없습니다: {args.favorite} ({args.favorites_file})\n")
+        mode = 'regex'
+    else:
+        query = args.pattern
+        mode = 'regex' if args.regex else 'plain'
+    if not query or not query.strip():
+        parser.exit(EXIT_ERROR, "검색어가 없습니다.\n")
+    if not files:
+        parser.exit(EXIT_ERROR, "검색할 파일이 없습니다.\n")
+    return query, mode, files
+
+
+class _TextWriter:
+    """grep 형식: 매칭 'N:라인', 컨텍스트 'N-라인', 떨어진 묶음 사이 '--' (NUL 문자는 제거)"""
+
+    def __init__(self, out: TextIO, with_name: bool, use_separator: bool):
+        self.out = out
+        self.with_name = with_name
+        self.use_separator = use_separator
+        self.path = ""
+        self._last_printed = -1
+        self._printed_any = False
+
+    def start_file(self, path: str):
+        self.path = path
+        self._last_printed = -1
+
+    def line(self, lines: List[str], index: int, is_match: bool):
+        if index <= self._last_printed:
+            return
+        if self.use_separator and self._printed_any and index != self._last_printed + 1:
+            self.out.write("--\n")
+        prefix = f"{self.path}:" if self.with_name else ""
+        mark = ':' if is_match else '-'
+        text = lines[index].replace('\x00', '')
+        self.out.write(f"{prefix}{index + 1}{mark}{text}\n")
+        self._last_printed = index
+        self._printed_any = True
+
+    def match(self, lines: List[str], index: int, spans, before: int, after: int):
+        for i in range(max(0, index - before, self._last_printed + 1), index):
+            self.line(lines, i, False)
+        self.line(lines, index, True)
+
+    def count(self, path: str, count: int):
+        prefix = f"{path}:" if self.with_name else ""
+        self.out.write(f"{prefix}{count}\n")
+
+
+class _JsonlWriter:
+    """매칭 1건당 JSON 1줄 (line은 1-based, matches는 라인 내 [start, end])"""
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self.path = ""
+
+    def start_file(self, path: str):
+        self.path = path
+
+    def line(self, lines: List[str], index: int, is_match: bool):
+        pass  # 컨텍스트는 매칭 레코드의 before/after에 포함
+
+    def match(self, lines: List[str], index: int, spans, before: int, after: int):
+        record = {'file': self.path, 'line': index + 1, 'text': lines[index], 'matches': spans}
+        if before:
+            record['before'] = lines[max(0, index - before):index]
+        if after:
+            record['after'] = lines[index + 1:index + 1 + after]
+        self.out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def count(self, path: str, count: int):
+        self.out.write(json.dumps({'file': path, 'count': count}, ensure_ascii=False) + "\n")
+
+
+def search_file(path: str, matcher: Matcher, writer, before: int, after: int, count_only: bool) -> int:
+    """파일 1개 검색, 매칭 라인 수 반환"""
+    content, _ = read_text(path)
+    lines = content.split('\n')
+    writer.start_file(path)
+    matched = 0
+    after_until = -1
+    for index, s in enumerate(lines):
+        spans = matcher(s)
+        if spans:
+            matched += 1
+            if not count_only:
+                writer.match(lines, index, spans, before, after)
+                after_until = index + after
+        elif index <= after_until:
+            writer.line(lines, index, False)
+    if count_only:
+        writer.count(path, matched)
+    return matched
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    query, mode, files = resolve_query(args, parser)
+    before = args.before if args.context is None else args.context
+    after = args.after if args.context is None else args.context
+
+    try:
+        matcher = build_matcher(query, mode, args.case_sensitive)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return EXIT_ERROR
+
+    out = sys.stdout
+    if hasattr(out, 'reconfigure'):
+        out.reconfigure(errors='replace')
+    if args.format == 'jsonl':
+        writer = _JsonlWriter(out)
+    else:
+        writer = _TextWriter(out, with_name=len(files) > 1, use_separator=bool(before or after))
+
+    total = 0
+    had_error = False
+    try:
+        for path in files:
+            try:
+                total += search_file(path, matcher, writer, max(0, before), max(0, after), args.count)
+            except BrokenPipeError:
+                raise
+            except OSError as e:
+                print(f"{path}: {e.strerror or e}", file=sys.stderr)
+                had_error = True
+        out.flush()
+    except BrokenPipeError:
+        # head 등으로 출력이 먼저 닫힘 (이미 출력한 매칭이 있음) - 종료 시 flush 오류가 나지 않도록 stdout을 버림
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return EXIT_MATCH
+
+    if had_error:
+        return EXIT_ERROR
+    return EXIT_MATCH if total else EXIT_NO_MATCH
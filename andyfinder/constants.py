@@ -11,9 +11,15 @@ g_MIN_FONT_SIZE = 1
 g_MAX_FONT_SIZE = 70
 g_icon_name = 'app.png'
 
+# 시작 시간 예산 (프로세스 시작 ~ 첫 화면 입력 가능 시점)
+STARTUP_BUDGET_SEC = 1.0
+
+# GUI 스레드 멈춤 감시 (이 시간 이상 이벤트 루프가 멈추면 스택 캡처)
+STALL_THRESHOLD_MS = 100
+
 # 파일 로딩 설정
 MIN_BUF_LOAD_SIZE = 1 * 1024 * 1024
 
-# 디버그용 변수
-debug_measuretime_start = 0
-debug_measuretime_snapshot = 0
+# 보기 전용 모드 (이 크기 이상 파일은 로딩 시 기본 적용)
+VIEW_MODE_MIN_FILE_SIZE = 50 * 1024 * 1024
+VIEW_MODE_CURSOR_REFRESH_MS = 50  # 커서 이동에 따른 하이라이트/라벨 갱신 최소 간격
@@ -9,6 +9,13 @@ from .search_dialog import LineViewSearchDialog
 from .goto_dialog import GoToLineDialog
 from .favorite_dialogs import FavoriteAddDialog, FavoritesTree, FavoriteDialog
 from .config_dialogs import ConfigSaveDialog, ConfigLoadDialog
+from .triage_dialog import FavoriteTriageDialog
+from .export_dialog import ExportDialog
+from .group_dialog import GroupByDialog
+from .large_file_viewer import LargeFileViewerDialog
+from .timing_dialog import TimingDialog
+from .stall_dialog import StallDialog
+from .memory_dialog import MemoryDialog
 
 __all__ = [
     'LineViewSearchDialog',
@@ -18,4 +25,11 @@ __all__ = [
     'FavoriteDialog',
     'ConfigSaveDialog',
     'ConfigLoadDialog',
+    'FavoriteTriageDialog',
+    'ExportDialog',
+    'GroupByDialog',
+    'LargeFileViewerDialog',
+    'TimingDialog',
+    'StallDialog',
+    'MemoryDialog',
 ]
@@ -0,0 +1,196 @@
+# -*- coding: utf-8 -*-
+import os
+from typing import Optional
+
+from PySide6 import QtCore, QtWidgets
+from PySide6.QtCore import Qt
+
+from andyfinder.workers.export_worker import EXPORT_FORMATS, ExportWorker
+
+
+class ExportDialog(QtWidgets.QDialog):
+    """검색 결과 내보내기 다이얼로그 (Modeless)
+
+    - 범위: 전체 결과 / 마킹된 결과 / 선택한 결과 / 현재 필터 결과
+    - 형식: CSV / JSON Lines / Text
+    - 컨텍스트 라인(이전/다음)을 포함해서 내보내기 가능
+    - 파일 기록은 백그라운드 스레드에서 스트리밍 (진행률/중지 지원)
+    """
+    SCOPES = [
+        ("전체 결과", 'all'),
+        ("마킹된 결과", 'marked'),
+        ("선택한 결과", 'selected'),
+        ("현재 필터 결과", 'filter'),
+    ]
+
+    def __init__(self, tab_content, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("검색결과 내보내기")
+        self.setModal(False)
+        self.tab_content = tab_content
+        self.export_thread: Optional[QtCore.QThread] = None
+        self.export_worker: Optional[ExportWorker] = None
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+        form = QtWidgets.QFormLayout()
+
+        self.cmb_scope = QtWidgets.QComboBox()
+        for text, key in self.SCOPES:
+            self.cmb_scope.addItem(text, key)
+        form.addRow("범위:", self.cmb_scope)
+
+        self.cmb_format = QtWidgets.QComboBox()
+        for key, text in EXPORT_FORMATS.items():
+            self.cmb_format.addItem(text, key)
+        form.addRow("형식:", self.cmb_format)
+
+        context_layout = QtWidgets.QHBoxLayout()
+        self.spn_prev = QtWidgets.QSpinBox()
+        self.spn_prev.setRange(0, 1000)
+        self.spn_next = QtWidgets.QSpinBox()
+        self.spn_next.setRange(0, 1000)
+        context_layout.addWidget(QtWidgets.QLabel("이전"))
+        context_layout.addWidget(self.spn_prev)
+        context_layout.addWidget(QtWidgets.QLabel("다음"))
+        context_layout.addWidget(self.spn_next)
+        context_layout.addStretch(1)
+        form.addRow("컨텍스트 라인:", context_layout)
+
+        path_layout = QtWidgets.QHBoxLayout()
+        self.edt_path = QtWidgets.QLineEdit()
+        self.edt_path.setMinimumWidth(350)
+        self.btn_browse = QtWidgets.QPushButton("...")
+        self.btn_browse.setAutoDefault(False)
+        self.btn_browse.setFixedWidth(30)
+        path_layout.addWidget(self.edt_path, 1)
+        path_layout.addWidget(self.btn_browse)
+        form.addRow("파일:", path_layout)
+
+        layout.addLayout(form)
+
+        self.prog = QtWidgets.QProgressBar()
+        self.prog.setRange(0, 100)
+        self.prog.setValue(0)
+        layout.addWidget(self.prog)
+
+        self.lbl_status = QtWidgets.QLabel("")
+        layout.addWidget(self.lbl_status)
+
+        btn_layout = QtWidgets.QHBoxLayout()
+        btn_layout.addStretch(1)
+        self.btn_run = QtWidgets.QPushButton("내보내기")
+        self.btn_run.setAutoDefault(False)
+        self.btn_stop = QtWidgets.QPushButton("중지")
+        self.btn_stop.setAutoDefault(False)
+        self.btn_stop.setEnabled(False)
+        self.btn_close = QtWidgets.QPushButton("닫기")
+        self.btn_close.setAutoDefault(False)
+        btn_layout.addWidget(self.btn_run)
+        btn_layout.addWidget(self.btn_stop)
+        btn_layout.addWidget(self.btn_close)
+        layout.addLayout(btn_layout)
+
+        # 시그널
+        self.btn_browse.clicked.connect(self.browse_path)
+        self.cmb_format.currentIndexChanged.connect(self.on_format_changed)
+        self.btn_run.clicked.connect(self.run_export)
+        self.btn_stop.clicked.connect(self.stop_export)
+        self.btn_close.clicked.connect(self.close)
+
+    def prepare(self, scope: str = 'all'):
+        """다이얼로그 표시 전 범위/컨텍스트/기본 파일명 설정"""
+        idx = self.cmb_scope.findData(scope)
+        if idx >= 0:
+            self.cmb_scope.setCurrentIndex(idx)
+
+        prev_n, next_n = self.tab_content.get_context_counts()
+        self.spn_prev.setValue(prev_n)
+        self.spn_next.setValue(next_n)
+
+        if not self.edt_path.text():
+            base = self.tab_content.current_file_path or "results"
+            self.edt_path.setText(os.path.splitext(base)[0] + "_results." + self.cmb_format.currentData())
+        self.lbl_status.setText(f"결과 : {len(self.tab_content.current_results)}개")
+
+    def on_format_changed(self, index: int):
+        """형식 변경 시 파일 확장자도 맞춰 변경"""
+        path = self.edt_path.text()
+        if path:
+            self.edt_path.setText(os.path.splitext(path)[0] + "." + self.cmb_format.currentData())
+
+    def browse_path(self):
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "내보낼 파일", self.edt_path.text(),
+            ";;".join(EXPORT_FORMATS.values()) + ";;All Files (*)",
+            self.cmb_format.currentText()
+        )
+        if path:
+            self.edt_path.setText(path)
+
+    def run_export(self):
+        path = self.edt_path.text().strip()
+        if not path:
+            QtWidgets.QMessageBox.information(self, "안내", "내보낼 파일을 지정하세요.")
+            return
+
+        scope = self.cmb_scope.currentData()
+        rows = self.tab_content.export_rows(scope)
+        count = len(self.tab_content.current_results) if rows is None else len(rows)
+        if count == 0:
+            self.lbl_status.setText(f"내보낼 결과가 없습니다 ({self.cmb_scope.currentText()})")
+            return
+
+        self.stop_export()
+
+        self.export_thread = QtCore.QThread(self)
+        self.export_worker = ExportWorker(
+            path, self.cmb_format.currentData(), self.tab_content.current_results, rows,
+            self.tab_content.snapshot(), self.spn_prev.value(), self.spn_next.value()
+        )
+        self.export_worker.moveToThread(self.export_thread)
+        self.export_thread.started.connect(self.export_worker.run)
+        self.export_worker.progress.connect(self.prog.setValue)
+        self.export_worker.failed.connect(self.on_export_failed)
+        self.export_worker.cancelled.connect(self.on_export_cancelled)
+        self.export_worker.finished.connect(self.on_export_finished)
+        self.btn_run.setEnabled(False)
+        self.btn_stop.setEnabled(True)
+        self.prog.setValue(0)
+        self.lbl_status.setText(f"{count}개 결과 내보내는 중...")
+        self.export_thread.start()
+
+    def stop_export(self):
+        if self.export_worker:
+            self.export_worker.stop()
+        if self.export_thread:
+            self.export_thread.quit()
+            self.export_thread.wait()
+        self.btn_run.setEnabled(True)
+        self.btn_stop.setEnabled(False)
+
+    def on_export_failed(self, msg: str):
+        self.stop_export()
+        self.lbl_status.setText("내보내기 실패: " + msg)
+
+    def on_export_cancelled(self):
+        self.stop_export()
+        self.prog.setValue(0)
+        self.lbl_status.setText("내보내기 중지됨")
+
+    def on_export_finished(self, path: str, count: int, duration: float):
+        self.stop_export()
+        self.lbl_status.setText(f"완료: {count}개 → {os.path.basename(path)} | duration : {duration:.2f} sec(s)")
+        self.tab_content.show_status_message(f"내보내기 완료: {path}", 5000)
+
+    def closeEvent(self, event):
+        self.stop_export()
+        super().closeEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.close()
+            event.accept()
+            return
+        super().keyPressEvent(event)
@@ -68,7 +68,7 @@ class GoToLineDialog(QtWidgets.QDialog):
             return
 
         # 범위 확인
-        total_lines = self.editor.document().blockCount()
+        total_lines = self.editor.blockCount()
         if line_number < 1 or line_number > total_lines:
             QtWidgets.QMessageBox.warning(
                 self, "경고",
@@ -0,0 +1,210 @@
+# -*- coding: utf-8 -*-
+from typing import Optional
+
+from PySide6 import QtCore, QtWidgets
+from PySide6.QtCore import Qt
+
+from andyfinder.grouping import GROUP_FIELDS
+from andyfinder.views.group_model import GroupResultsModel
+from andyfinder.workers.group_worker import GroupByWorker
+
+
+class GroupByDialog(QtWidgets.QDialog):
+    """검색결과 그룹 집계 다이얼로그 (Modeless)
+
+    - 현재 표시 중인(필터 적용된) 검색결과를 선택한 키로 묶어 개수/비율/처음·마지막 라인 표시
+    - 키: logcat 필드 / 정규식 캡처 그룹 / 메시지 템플릿
+    - 그룹 펼치기: 해당 그룹의 결과 라인, 더블클릭 시 해당 결과로 이동
+    """
+    KEY_TYPES = [
+        ("logcat 필드", 'field'),
+        ("정규식 캡처 그룹", 'regex'),
+        ("메시지 템플릿", 'template'),
+    ]
+
+    def __init__(self, tab_content, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("검색결과 그룹 집계")
+        self.setModal(False)
+        self.tab_content = tab_content
+        self.group_thread: Optional[QtCore.QThread] = None
+        self.group_worker: Optional[GroupByWorker] = None
+        self.results_generation = -1  # 집계한 결과 세트 (tab.result_filter_generation)
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        top_layout = QtWidgets.QHBoxLayout()
+        top_layout.addWidget(QtWidgets.QLabel("키:"))
+        self.cmb_key_type = QtWidgets.QComboBox()
+        for text, key in self.KEY_TYPES:
+            self.cmb_key_type.addItem(text, key)
+        top_layout.addWidget(self.cmb_key_type)
+
+        self.cmb_field = QtWidgets.QComboBox()
+        self.cmb_field.addItems(GROUP_FIELDS)
+        top_layout.addWidget(self.cmb_field)
+
+        self.edt_regex = QtWidgets.QLineEdit()
+        self.edt_regex.setPlaceholderText(r"캡처 그룹 정규식 (예: am_proc_start.*?,(\S+?),)")
+        self.edt_regex.setMinimumWidth(300)
+        top_layout.addWidget(self.edt_regex, 1)
+        top_layout.addStretch(0)
+
+        self.btn_run = QtWidgets.QPushButton("실행")
+        self.btn_run.setAutoDefault(False)
+        self.btn_stop = QtWidgets.QPushButton("중지")
+        self.btn_stop.setAutoDefault(False)
+        self.btn_stop.setEnabled(False)
+        self.prog = QtWidgets.QProgressBar()
+        self.prog.setFixedWidth(150)
+        self.prog.setRange(0, 100)
+        self.prog.setValue(0)
+
+        top_layout.addWidget(self.btn_run)
+        top_layout.addWidget(self.btn_stop)
+        top_layout.addWidget(self.prog)
+        layout.addLayout(top_layout)
+
+        self.lbl_status = QtWidgets.QLabel("")
+        layout.addWidget(self.lbl_status)
+
+        self.tree_groups = QtWidgets.QTreeView()
+        self.tree_groups.setUniformRowHeights(True)
+        self.tree_groups.setAlternatingRowColors(True)
+        self.tree_groups.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tree_groups.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tree_groups.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
+
+        self.group_model = GroupResultsModel()
+        self.tree_groups.setModel(self.group_model)
+
+        header = self.tree_groups.header()
+        header.setStretchLastSection(False)
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        for col in range(1, len(GroupResultsModel.HEADERS)):
+            header.setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeToContents)
+
+        layout.addWidget(self.tree_groups, 1)
+
+        bottom_layout = QtWidgets.QHBoxLayout()
+        info_label = QtWidgets.QLabel("그룹 펼치기: 결과 라인 표시 | 라인 더블클릭: 해당 결과로 이동")
+        info_label.setStyleSheet("color: gray;")
+        bottom_layout.addWidget(info_label, 1)
+        self.btn_mark = QtWidgets.QPushButton("선택 그룹 마킹")
+        self.btn_mark.setAutoDefault(False)
+        bottom_layout.addWidget(self.btn_mark)
+        layout.addLayout(bottom_layout)
+
+        # 시그널
+        self.cmb_key_type.currentIndexChanged.connect(self.on_key_type_changed)
+        self.edt_regex.returnPressed.connect(self.run_group_by)
+        self.btn_run.clicked.connect(self.run_group_by)
+        self.btn_stop.clicked.connect(self.stop_group_by)
+        self.btn_mark.clicked.connect(self.mark_selected_groups)
+        self.tree_groups.doubleClicked.connect(self.on_tree_double_clicked)
+
+        self.on_key_type_changed()
+        self.resize(1000, 600)
+
+    def on_key_type_changed(self, index: int = 0):
+        key_type = self.cmb_key_type.currentData()
+        self.cmb_field.setVisible(key_type == 'field')
+        self.edt_regex.setVisible(key_type == 'regex')
+
+    def run_group_by(self):
+        tab = self.tab_content
+        if not tab.current_results:
+            self.lbl_status.setText("검색 결과가 없습니다")
+            return
+
+        key_type = self.cmb_key_type.currentData()
+        key_arg = ""
+        if key_type == 'field':
+            key_arg = self.cmb_field.currentText()
+        elif key_type == 'regex':
+            key_arg = self.edt_regex.text().strip()
+            if not key_arg:
+                self.lbl_status.setText("정규식을 입력하세요")
+                return
+
+        self.stop_group_by()
+
+        self.results_generation = tab.result_filter_generation
+        self.group_thread = QtCore.QThread(self)
+        self.group_worker = GroupByWorker(
+            tab.current_results, tab.resultsModel.visible_source_rows(), tab.snapshot().lines,
+            key_type, key_arg, self.results_generation, tab.result_columns
+        )
+        self.group_worker.moveToThread(self.group_thread)
+        self.group_thread.started.connect(self.group_worker.run)
+        self.group_worker.progress.connect(self.prog.setValue)
+        self.group_worker.columns_built.connect(tab.on_result_columns_built)
+        self.group_worker.failed.connect(self.on_group_by_failed)
+        self.group_worker.finished.connect(self.on_group_by_finished)
+        self.btn_run.setEnabled(False)
+        self.btn_stop.setEnabled(True)
+        self.prog.setValue(0)
+        self.lbl_status.setText("집계 중...")
+        self.group_thread.start()
+
+    def stop_group_by(self):
+        if self.group_worker:
+            self.group_worker.stop()
+        if self.group_thread:
+            self.group_thread.quit()
+            self.group_thread.wait()
+        self.btn_run.setEnabled(True)
+        self.btn_stop.setEnabled(False)
+
+    def on_group_by_failed(self, msg: str):
+        self.stop_group_by()
+        self.lbl_status.setText("집계 실패: " + msg)
+
+    def on_group_by_finished(self, groups, unmatched: int, total: int, duration: float):
+        self.stop_group_by()
+        self.group_model.set_groups(groups, total, self.tab_content.current_results,
+                                    self.tab_content.snapshot().lines)
+        filtered = " (필터 적용)" if self.tab_content.resultsModel.is_filtered() else ""
+        excluded = f", 키 없음 {unmatched:,}건 제외" if unmatched else ""
+        self.lbl_status.setText(
+            f"결과 {total:,}건{filtered} → {len(groups):,}개 그룹{excluded} | duration : {duration:.2f} sec(s)"
+        )
+
+    def _is_stale(self) -> bool:
+        if self.tab_content.result_filter_generation != self.results_generation:
+            self.lbl_status.setText("검색 결과가 변경되었습니다. 다시 실행하세요")
+            return True
+        return False
+
+    def mark_selected_groups(self):
+        """선택한 그룹(또는 선택한 라인이 속한 그룹)의 결과를 모두 마킹"""
+        if self._is_stale():
+            return
+        model = self.group_model
+        groups = {id(g): g for g in (model.group_at(idx) for idx in self.tree_groups.selectionModel().selectedRows())}
+        if not groups:
+            return
+        rows = [row for g in groups.values() for row in g.rows]
+        self.tab_content.resultsModel.mark_rows(rows)
+        self.tab_content.update_bookmark_labels()
+        self.lbl_status.setText(f"{len(groups)}개 그룹, {len(rows):,}건 마킹")
+
+    def on_tree_double_clicked(self, index):
+        if not index.isValid() or self.group_model.is_group(index):
+            return
+        if self._is_stale():
+            return
+        self.tab_content.goto_source_result(self.group_model.data(index, Qt.UserRole))
+
+    def closeEvent(self, event):
+        self.stop_group_by()
+        super().closeEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.close()
+            event.accept()
+            return
+        super().keyPressEvent(event)
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+import os
+from typing import List, Optional, Sequence, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+from andyfinder.editors.log_viewer import LogViewer
+from andyfinder.workers.line_index_worker import LineIndexWorker
+
+
+class LargeFileViewerDialog(QtWidgets.QDialog):
+    """대용량 파일 읽기 전용 뷰어 (Modeless)
+
+    - 파일을 QTextDocument로 만들지 않고 mmap 라인 버퍼 + LogViewer로 화면에 보이는 라인만 그림
+    - 라인 인덱스는 LineIndexWorker가 백그라운드에서 생성 (64KB 구간별 줄바꿈 수만 저장)
+    - Color 키워드: 'a|b|c' 입력 후 적용 (탭의 Color 설정과 같은 색 순서)
+    """
+
+    def __init__(self, path: str, color_keywords: Sequence[Tuple[str, QtGui.QColor]] = (),
+                 color_palette: Sequence[QtGui.QColor] = (), parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"읽기 전용 보기 - {os.path.basename(path)}")
+        self.setModal(False)
+        self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.path = path
+        self.color_palette: List[QtGui.QColor] = list(color_palette) or [QtGui.QColor(255, 255, 200)]
+        self.index_thread: Optional[QtCore.QThread] = None
+        self.index_worker: Optional[LineIndexWorker] = None
+        self.setup_ui()
+
+        self.edt_color_keywords.setText('|'.join(kw for kw, _ in color_keywords))
+        self.viewer.set_keywords(list(color_keywords))
+        self.start_index()
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        top_layout = QtWidgets.QHBoxLayout()
+        lbl_path = QtWidgets.QLabel(self.path)
+        lbl_path.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        top_layout.addWidget(lbl_path, 1)
+        self.prog = QtWidgets.QProgressBar()
+        self.prog.setFixedWidth(150)
+        self.prog.setRange(0, 100)
+        self.prog.setValue(0)
+        top_layout.addWidget(self.prog)
+        layout.addLayout(top_layout)
+
+        color_layout = QtWidgets.QHBoxLayout()
+        self.edt_color_keywords = QtWidgets.QLineEdit()
+        self.edt_color_keywords.setPlaceholderText("예: activity|window|package (Enter: Color 설정)")
+        self.edt_color_keywords.setStyleSheet("QLineEdit { background-color: #C9DFEC; }")
+        self.btn_color_apply = QtWidgets.QPushButton("Color 설정")
+        self.btn_color_apply.setAutoDefault(False)
+        color_layout.addWidget(self.edt_color_keywords, 1)
+        color_layout.addWidget(self.btn_color_apply)
+        layout.addLayout(color_layout)
+
+        self.viewer = LogViewer(self)
+        font = QtGui.QFont("Arial", 10)
+        self.viewer.setFont(font)
+        layout.addWidget(self.viewer, 1)
+
+        self.lbl_status = QtWidgets.QLabel("라인 인덱스 생성 중...")
+        layout.addWidget(self.lbl_status)
+
+        # 시그널
+        self.edt_color_keywords.returnPressed.connect(self.apply_color_keywords)
+        self.btn_color_apply.clicked.connect(self.apply_color_keywords)
+        self.viewer.cursorPositionChanged.connect(self.update_status)
+
+        self.resize(1200, 800)
+
+    def apply_color_keywords(self):
+        keywords = [kw.strip() for kw in self.edt_color_keywords.text().split('|') if kw.strip()]
+        palette = self.color_palette
+        self.viewer.set_keywords([(kw, palette[i % len(palette)]) for i, kw in enumerate(keywords)])
+
+    def start_index(self):
+        self.stop_index()
+        self.index_thread = QtCore.QThread(self)
+        self.index_worker = LineIndexWorker(self.path)
+        self.index_worker.moveToThread(self.index_thread)
+        self.index_thread.started.connect(self.index_worker.run)
+        self.index_worker.progress.connect(self.prog.setValue)
+        self.index_worker.finished.connect(self.on_index_finished)
+        self.index_worker.failed.connect(self.on_index_failed)
+        self.index_thread.start()
+
+    def stop_index(self):
+        if self.index_worker:
+            self.index_worker.stop()
+        if self.index_thread:
+            self.index_thread.quit()
+            self.index_thread.wait()
+        self.index_worker = None
+        self.index_thread = None
+
+    def on_index_failed(self, msg: str):
+        self.stop_index()
+        self.lbl_status.setText("열기 실패: " + msg)
+        QtWidgets.QMessageBox.critical(self, "오류", f"파일 열기 실패:\n{msg}")
+
+    def on_index_finished(self, buffer, encoding: str, duration: float):
+        self.stop_index()
+        self.encoding = encoding
+        self.index_duration = duration
+        self.viewer.set_buffer(buffer)
+        self.viewer.setFocus()
+
+    def update_status(self):
+        buffer = self.viewer.buffer
+        if buffer is None:
+            return
+        bookmarks = f" | 북마크 {len(self.viewer.bookmarks)}" if self.viewer.bookmarks else ""
+        self.lbl_status.setText(
+            f"Line {self.viewer.current_line() + 1:,} / {buffer.line_count:,} | {buffer.size / (1024 * 1024):,.1f} MB"
+            f" | {self.encoding} | 인덱스 {buffer.index_memory() / 1024:,.1f} KB, {self.index_duration:.2f} sec(s)"
+            f"{bookmarks}"
+        )
+
+    def closeEvent(self, event):
+        self.stop_index()
+        buffer = self.viewer.buffer
+        self.viewer.set_buffer(None)
+        if buffer is not None:
+            buffer.close()
+        super().closeEvent(event)
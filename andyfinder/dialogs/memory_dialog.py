@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+from PySide6 import QtGui, QtWidgets
+from PySide6.QtCore import Qt
+
+from andyfinder.memory import (
+    format_bytes, format_snapshot_diff, format_snapshot_top, process_rss, stop_tracemalloc, take_tracemalloc_snapshot
+)
+
+
+class MemoryDialog(QtWidgets.QDialog):
+    """탭별 메모리 사용량 (Modeless)
+
+    - 탭마다 원본 텍스트 / 에디터 문서 / 스냅샷 라인 리스트 / 검색결과 / 캐시별 추정 크기 (TabContent.memory_breakdown)
+    - 캐시 비우기: 선택한 탭(없으면 모든 탭)의 다시 만들 수 있는 캐시 해제 (TabContent.free_caches)
+    - tracemalloc 스냅샷: 첫 스냅샷에서 추적 시작, 이후 스냅샷은 직전 스냅샷과 할당 위치별 증감 비교
+    """
+    HEADERS = ["항목", "크기", "상세"]
+
+    def __init__(self, main_window, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("메모리 사용량")
+        self.setModal(False)
+        self.main_window = main_window
+        self._last_snapshot = None
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.lbl_process = QtWidgets.QLabel("")
+        layout.addWidget(self.lbl_process)
+
+        splitter = QtWidgets.QSplitter(Qt.Vertical)
+        self.tree_memory = QtWidgets.QTreeWidget()
+        self.tree_memory.setHeaderLabels(self.HEADERS)
+        self.tree_memory.setUniformRowHeights(True)
+        self.tree_memory.setAlternatingRowColors(True)
+        self.tree_memory.header().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        splitter.addWidget(self.tree_memory)
+
+        self.txt_tracemalloc = QtWidgets.QPlainTextEdit()
+        self.txt_tracemalloc.setReadOnly(True)
+        self.txt_tracemalloc.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.txt_tracemalloc.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+        self.txt_tracemalloc.setPlaceholderText(
+            "tracemalloc 스냅샷: 처음 누르면 추적을 시작하고, 다시 누르면 직전 스냅샷 이후 늘어난 할당 위치를 표시합니다.\n"
+            "(추적 중에는 Python 할당이 느려지므로 확인 후 '추적 중지')"
+        )
+        splitter.addWidget(self.txt_tracemalloc)
+        splitter.setSizes([350, 200])
+        layout.addWidget(splitter, 1)
+
+        bottom_layout = QtWidgets.QHBoxLayout()
+        self.btn_refresh = QtWidgets.QPushButton("새로고침")
+        self.btn_free = QtWidgets.QPushButton("캐시 비우기")
+        self.btn_free.setToolTip("선택한 탭(선택이 없으면 모든 탭)의 검색 인덱스/찾기/오버뷰/레이아웃/라인 리스트 캐시 해제")
+        self.btn_snapshot = QtWidgets.QPushButton("tracemalloc 스냅샷")
+        self.btn_stop = QtWidgets.QPushButton("추적 중지")
+        for btn in (self.btn_refresh, self.btn_free, self.btn_snapshot, self.btn_stop):
+            btn.setAutoDefault(False)
+        bottom_layout.addWidget(self.btn_refresh)
+        bottom_layout.addWidget(self.btn_free)
+        bottom_layout.addStretch(1)
+        bottom_layout.addWidget(self.btn_snapshot)
+        bottom_layout.addWidget(self.btn_stop)
+        layout.addLayout(bottom_layout)
+
+        # 시그널
+        self.btn_refresh.clicked.connect(self.refresh)
+        self.btn_free.clicked.connect(self.free_caches)
+        self.btn_snapshot.clicked.connect(self.take_snapshot)
+        self.btn_stop.clicked.connect(self.stop_tracing)
+
+        self.resize(800, 650)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def _tabs(self):
+        """(탭 번호, 생성된 TabContent 또는 None)"""
+        tab_widget = self.main_window.tab_widget
+        for i in range(tab_widget.count()):
+            widget = tab_widget.widget(i)
+            yield i + 1, widget if hasattr(widget, 'memory_breakdown') else None
+
+    def refresh(self):
+        QtWidgets.QApplication.setOverrideCursor(Qt.WaitCursor)
+        try:
+            self.tree_memory.clear()
+            total = 0
+            for number, tab in self._tabs():
+                if tab is None:
+                    QtWidgets.QTreeWidgetItem(self.tree_memory, [f"Tab#{number}", "", "아직 열지 않음"])
+                    continue
+                rows = tab.memory_breakdown()
+                tab_total = sum(size for _, size, _ in rows)
+                total += tab_total
+                name = tab.current_file_path or "(파일 없음)"
+                tab_item = QtWidgets.QTreeWidgetItem(self.tree_memory, [f"Tab#{number}", format_bytes(tab_total), name])
+                tab_item.setData(0, Qt.UserRole, tab)
+                tab_item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
+                font = tab_item.font(0)
+                font.setBold(True)
+                tab_item.setFont(0, font)
+                tab_item.setFont(1, font)
+                for label, size, detail in sorted(rows, key=lambda row: row[1], reverse=True):
+                    item = QtWidgets.QTreeWidgetItem(tab_item, [label, format_bytes(size), detail])
+                    item.setData(0, Qt.UserRole, tab)
+                    item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
+            self.tree_memory.expandAll()
+
+            rss = process_rss()
+            rss_text = format_bytes(rss) if rss is not None else "측정 불가"
+            self.lbl_process.setText(f"프로세스 RSS: {rss_text} | 탭 추정 합계: {format_bytes(total)} "
+                                     f"(추정치 - 문서는 문자 수/블록 수 기준, 큰 리스트는 표본 추정)")
+        finally:
+            QtWidgets.QApplication.restoreOverrideCursor()
+
+    def free_caches(self):
+        item = self.tree_memory.currentItem()
+        selected = item.data(0, Qt.UserRole) if item else None
+        tabs = [selected] if selected is not None else [tab for _, tab in self._tabs() if tab is not None]
+        freed = [tab.free_caches() for tab in tabs]
+        self.refresh()
+        if all(f is not None for f in freed):
+            self.lbl_process.setText(self.lbl_process.text() + f" | 캐시 해제: RSS {format_bytes(sum(freed))} 감소")
+
+    def take_snapshot(self):
+        snapshot = take_tracemalloc_snapshot()
+        if self._last_snapshot is None:
+            lines = ["tracemalloc 추적 시작 (이후 할당만 기록)", ""] + format_snapshot_top(snapshot)
+        else:
+            lines = ["직전 스냅샷 대비 증감", ""] + format_snapshot_diff(self._last_snapshot, snapshot)
+        self._last_snapshot = snapshot
+        self.txt_tracemalloc.setPlainText("\n".join(lines))
+
+    def stop_tracing(self):
+        stop_tracemalloc()
+        self._last_snapshot = None
+        self.txt_tracemalloc.setPlainText("tracemalloc 추적 중지")
+
+    def closeEvent(self, event):
+        self.stop_tracing()
+        super().closeEvent(event)
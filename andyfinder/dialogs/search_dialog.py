@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
 import re
-from PySide6 import QtCore, QtGui, QtWidgets
+from typing import Optional
+
+from PySide6 import QtCore, QtWidgets
 from PySide6.QtCore import Qt
 
+from andyfinder.views.line_hits_model import LineHitsModel
+from andyfinder.workers.search_worker import SearchWorker
+
 
 class LineViewSearchDialog(QtWidgets.QDialog):
     """lineView 내부 검색 다이얼로그 (Modeless + 전체검색 기능)"""
@@ -19,6 +24,8 @@ class LineViewSearchDialog(QtWidgets.QDialog):
 
         self.setModal(False)  # Modeless로 변경
         self.editor = editor
+        self.search_all_thread: Optional[QtCore.QThread] = None
+        self.search_all_worker: Optional[SearchWorker] = None
         self.opacity_value = 100  # 투명도 값 (0~100)
         self.setup_ui()
         self.update_opacity()  # 초기 투명도 설정
@@ -83,6 +90,13 @@ class LineViewSearchDialog(QtWidgets.QDialog):
             }
         """)
 
+        self.btn_stop_all = QtWidgets.QPushButton("중지")
+        self.btn_stop_all.setEnabled(False)
+        self.prog_search_all = QtWidgets.QProgressBar()
+        self.prog_search_all.setFixedWidth(150)
+        self.prog_search_all.setRange(0, 100)
+        self.prog_search_all.setValue(0)
+
         self.btn_close = QtWidgets.QPushButton("닫기")
 
         btn_layout.addWidget(self.btn_prev)
@@ -91,6 +105,9 @@ class LineViewSearchDialog(QtWidgets.QDialog):
         self.btn_next.setAutoDefault(False)
         btn_layout.addWidget(self.btn_search_all)
         self.btn_search_all.setAutoDefault(False)
+        btn_layout.addWidget(self.btn_stop_all)
+        self.btn_stop_all.setAutoDefault(False)
+        btn_layout.addWidget(self.prog_search_all)
         btn_layout.addStretch()
         btn_layout.addWidget(self.btn_close)
         layout.addLayout(btn_layout)
@@ -105,10 +122,12 @@ class LineViewSearchDialog(QtWidgets.QDialog):
         self.tbl_search_results.setWordWrap(False)
         self.tbl_search_results.setTextElideMode(Qt.ElideNone)
 
-        # 모델 설정
-        self.search_model = QtGui.QStandardItemModel()
-        self.search_model.setHorizontalHeaderLabels(["LineNumber", "내용"])
+        # 모델 설정 (검색 중 결과를 묶음 단위로 추가)
+        self.search_model = LineHitsModel()
         self.tbl_search_results.setModel(self.search_model)
+        self.tbl_search_results.verticalHeader().setDefaultSectionSize(
+            self.tbl_search_results.fontMetrics().height() + 6
+        )
 
         # 헤더 설정
         header = self.tbl_search_results.horizontalHeader()
@@ -122,6 +141,7 @@ class LineViewSearchDialog(QtWidgets.QDialog):
         self.btn_prev.clicked.connect(self.on_search_prev)
         self.btn_next.clicked.connect(self.on_search_next)
         self.btn_search_all.clicked.connect(self.on_search_all)
+        self.btn_stop_all.clicked.connect(self.on_stop_search_all)
         self.btn_close.clicked.connect(self.close)
         self.tbl_search_results.doubleClicked.connect(self.on_table_double_clicked)
 
@@ -160,57 +180,86 @@ class LineViewSearchDialog(QtWidgets.QDialog):
             self.update_opacity()
 
     def on_search_all(self):
-        """전체검색: edt_search의 정규표현식으로 lineView 전체를 검색하여 테이블에 표시"""
+        """전체검색: edt_search의 정규표현식으로 lineView 전체를 백그라운드에서 검색하여 테이블에 표시"""
         pattern = self.edt_search.text().strip()
         if not pattern:
             self.lbl_status.setText("검색어를 입력하세요")
             return
 
-        # 모델 초기화
-        self.search_model.removeRows(0, self.search_model.rowCount())
-
         try:
-            regex = re.compile(pattern, re.IGNORECASE)
+            re.compile(pattern, re.IGNORECASE)
         except re.error as e:
             self.lbl_status.setText(f"정규식 오류: {e}")
             return
 
-        content = self.editor.toPlainText()
-        lines = content.split('\n')
-        match_count = 0
-
-        for line_num, line_text in enumerate(lines, start=1):
-            if regex.search(line_text):
-                # 줄번호와 내용을 테이블에 추가
-                line_num_item = QtGui.QStandardItem(str(line_num))
-                content_item = QtGui.QStandardItem(line_text)
-                self.search_model.appendRow([line_num_item, content_item])
-                match_count += 1
-
-        self.lbl_status.setText(f"전체검색 완료: {match_count}건")
-
+        self.stop_search_all()
+        # 모델 초기화
+        self.search_model.clear()
+
+        # 메인 검색과 같은 SearchWorker 사용 (정규식, 대소문자 무시)
+        self.search_all_thread = QtCore.QThread(self)
+        self.search_all_worker = SearchWorker(self.editor.snapshot(), pattern, 'regex', False)
+        self.search_all_worker.moveToThread(self.search_all_thread)
+        self.search_all_thread.started.connect(self.search_all_worker.run)
+        self.search_all_worker.progress.connect(self.prog_search_all.setValue)
+        self.search_all_worker.partial.connect(self.on_search_all_partial)
+        self.search_all_worker.failed.connect(self.on_search_all_failed)
+        self.search_all_worker.finished.connect(self.on_search_all_finished)
+        self.btn_search_all.setEnabled(False)
+        self.btn_stop_all.setEnabled(True)
+        self.prog_search_all.setValue(0)
+        self.lbl_status.setText("전체검색 중...")
+        self.search_all_thread.start()
+
+    def stop_search_all(self):
+        if self.search_all_worker:
+            self.search_all_worker.stop()
+        if self.search_all_thread:
+            self.search_all_thread.quit()
+            self.search_all_thread.wait()
+        self.search_all_worker = None
+        self.search_all_thread = None
+        self.btn_search_all.setEnabled(True)
+        self.btn_stop_all.setEnabled(False)
+
+    def on_stop_search_all(self):
+        self.stop_search_all()
+        self.lbl_status.setText(f"전체검색 중지: {self.search_model.total_count():,}건")
+
+    def on_search_all_partial(self, batch):
+        # 중지/재검색 전에 큐에 남아 있던 이전 워커의 결과는 무시
+        if self.search_all_worker is None or self.sender() is not self.search_all_worker:
+            return
+        first = self.search_model.total_count() == 0
+        self.search_model.append_results(batch)
+        self.lbl_status.setText(f"전체검색 중... {self.search_model.total_count():,}건")
         # 첫 번째 결과로 이동 (있는 경우)
-        if match_count > 0:
+        if first and batch:
             self.tbl_search_results.selectRow(0)
 
+    def on_search_all_failed(self, msg: str):
+        if self.search_all_worker is None or self.sender() is not self.search_all_worker:
+            return
+        self.stop_search_all()
+        self.lbl_status.setText(f"전체검색 실패: {msg}")
+
+    def on_search_all_finished(self, results, duration: float):
+        if self.search_all_worker is None or self.sender() is not self.search_all_worker:
+            return
+        self.stop_search_all()
+        self.lbl_status.setText(
+            f"전체검색 완료: {self.search_model.total_count():,}건 | duration : {duration:.2f} sec(s)"
+        )
+
     def on_table_double_clicked(self, index):
         """테이블 더블클릭: lineView에서 해당 라인으로 이동하고 focus는 테이블 유지"""
         if not index.isValid():
             return
 
-        # 줄번호 가져오기 (0번 컬럼)
-        line_num_item = self.search_model.item(index.row(), 0)
-        if not line_num_item:
-            return
-
-        try:
-            line_number = int(line_num_item.text())
-            # lineView에서 해당 라인으로 이동
-            self.editor.gotoLine(line_number)
-            # focus는 테이블로 다시 설정
-            self.tbl_search_results.setFocus()
-        except ValueError:
-            pass
+        # lineView에서 해당 라인으로 이동
+        self.editor.gotoLine(self.search_model.line_at(index.row()) + 1)
+        # focus는 테이블로 다시 설정
+        self.tbl_search_results.setFocus()
 
     def on_search_next(self):
         pattern = self.edt_search.text()
@@ -232,9 +281,7 @@ class LineViewSearchDialog(QtWidgets.QDialog):
             return
 
         # 검색 상태 초기화 후 재검색
-        self.editor.internal_search_pattern = ""
-        self.editor.internal_search_matches = []
-        self.editor.internal_search_index = -1
+        self.editor.reset_internal_search()
 
         # 재검색 수행
         recursive = self.chk_recursive.isChecked()
@@ -244,7 +291,11 @@ class LineViewSearchDialog(QtWidgets.QDialog):
     def update_status(self, result):
         if result:
             current, total = result
-            self.lbl_status.setText(f"{current} / {total}")
+            if total is None:
+                # 전체 개수는 백그라운드에서 계산 중 (끝나면 editor.searchCountReady로 다시 호출됨)
+                self.lbl_status.setText("? / 전체 개수 계산 중...")
+            else:
+                self.lbl_status.setText(f"{current} / {total}")
         else:
             self.lbl_status.setText("일치하는 항목 없음")
 
@@ -266,3 +317,7 @@ class LineViewSearchDialog(QtWidgets.QDialog):
             event.accept()
             return
         super().keyPressEvent(event)
+
+    def closeEvent(self, event):
+        self.stop_search_all()
+        super().closeEvent(event)
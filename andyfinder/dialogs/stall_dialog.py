@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+import os
+from datetime import datetime
+
+from PySide6 import QtGui, QtWidgets
+from PySide6.QtCore import Qt
+
+
+class StallDialog(QtWidgets.QDialog):
+    """GUI 멈춤 기록 (Modeless)
+
+    - StallWatchdog 링 버퍼의 멈춤 목록 (시각 / 시간 / 동작 / 위치), 새 멈춤은 바로 추가
+    - 항목 선택 시 캡처한 GUI 스레드 Python 스택 표시
+    - 파일로 저장: 전체 기록을 텍스트로 저장
+    """
+    HEADERS = ["시각", "시간(ms)", "동작", "위치"]
+
+    def __init__(self, watchdog, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"GUI 멈춤 기록 ({watchdog.threshold * 1000:.0f} ms 이상)")
+        self.setModal(False)
+        self.watchdog = watchdog
+        self.setup_ui()
+        self.watchdog.stallDetected.connect(self.add_event)
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        splitter = QtWidgets.QSplitter(Qt.Vertical)
+        self.tree_events = QtWidgets.QTreeWidget()
+        self.tree_events.setHeaderLabels(self.HEADERS)
+        self.tree_events.setRootIsDecorated(False)
+        self.tree_events.setUniformRowHeights(True)
+        self.tree_events.setAlternatingRowColors(True)
+        self.tree_events.header().setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        splitter.addWidget(self.tree_events)
+
+        self.txt_stack = QtWidgets.QPlainTextEdit()
+        self.txt_stack.setReadOnly(True)
+        self.txt_stack.setLineWrapMode(QtWidgets.QPlainTextEdit.NoWrap)
+        self.txt_stack.setFont(QtGui.QFontDatabase.systemFont(QtGui.QFontDatabase.FixedFont))
+        splitter.addWidget(self.txt_stack)
+        splitter.setSizes([250, 250])
+        layout.addWidget(splitter, 1)
+
+        bottom_layout = QtWidgets.QHBoxLayout()
+        self.lbl_status = QtWidgets.QLabel("")
+        bottom_layout.addWidget(self.lbl_status, 1)
+        self.btn_clear = QtWidgets.QPushButton("지우기")
+        self.btn_clear.setAutoDefault(False)
+        self.btn_save = QtWidgets.QPushButton("파일로 저장...")
+        self.btn_save.setAutoDefault(False)
+        bottom_layout.addWidget(self.btn_clear)
+        bottom_layout.addWidget(self.btn_save)
+        layout.addLayout(bottom_layout)
+
+        # 시그널
+        self.tree_events.currentItemChanged.connect(self.on_current_item_changed)
+        self.btn_clear.clicked.connect(self.clear_events)
+        self.btn_save.clicked.connect(self.save_events)
+
+        self.resize(900, 550)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+
+    def refresh(self):
+        self.tree_events.clear()
+        self.txt_stack.clear()
+        for stall in self.watchdog.events:
+            self._append_item(stall)
+        self._update_status()
+
+    def add_event(self, stall):
+        if self.isVisible():
+            self._append_item(stall)
+            self._update_status()
+
+    def _append_item(self, stall):
+        item = QtWidgets.QTreeWidgetItem([
+            stall.started_at.strftime('%H:%M:%S.%f')[:-3],
+            f"{stall.duration * 1000:,.0f}",
+            stall.trigger,
+            stall.location,
+        ])
+        item.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
+        item.setData(0, Qt.UserRole, stall)
+        self.tree_events.addTopLevelItem(item)
+
+    def _update_status(self):
+        self.lbl_status.setText(f"멈춤 {self.tree_events.topLevelItemCount():,}건 "
+                                f"(최근 {self.watchdog.MAX_EVENTS:,}건까지 보관)")
+
+    def on_current_item_changed(self, current, previous):
+        stall = current.data(0, Qt.UserRole) if current else None
+        self.txt_stack.setPlainText(stall.format() if stall else "")
+
+    def clear_events(self):
+        self.watchdog.clear()
+        self.refresh()
+
+    def save_events(self):
+        default_name = f"andyfinder_stalls_{datetime.now():%Y%m%d_%H%M%S}.txt"
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "GUI 멈춤 기록 저장", os.path.join(".", default_name), "Text Files (*.txt)"
+        )
+        if not path:
+            return
+        try:
+            count = self.watchdog.dump(path)
+            self.lbl_status.setText(f"저장 완료: {path} ({count:,}건)")
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "오류", f"저장 실패: {e}")
@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+import os
+from datetime import datetime
+
+from PySide6 import QtCore, QtWidgets
+from PySide6.QtCore import Qt
+
+
+class TimingDialog(QtWidgets.QDialog):
+    """탭 타이밍 패널 (Modeless)
+
+    - 탭 Tracer에 기록된 구간(파일 읽기/디코딩/라인 인덱스/setPlainText/검색/결과 반영/행 높이/하이라이트)을
+      시작 순서대로 표시 (중첩 구간은 들여쓰기)
+    - 기록이 바뀌면 REFRESH_INTERVAL_MS마다 자동 갱신
+    - Chrome trace 내보내기: chrome://tracing 또는 https://ui.perfetto.dev 에서 열 수 있는 JSON
+    """
+    HEADERS = ["구간", "시작(ms)", "시간(ms)", "bytes", "lines", "MB/s", "스레드", "상세"]
+    REFRESH_INTERVAL_MS = 1000
+
+    def __init__(self, tab_content, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(f"타이밍 패널 - Tab#{tab_content.tab_number}")
+        self.setModal(False)
+        self.tab_content = tab_content
+        self.tracer = tab_content.tracer
+        self._shown_generation = -1
+        self.setup_ui()
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        self.tree_spans = QtWidgets.QTreeWidget()
+        self.tree_spans.setHeaderLabels(self.HEADERS)
+        self.tree_spans.setRootIsDecorated(False)
+        self.tree_spans.setUniformRowHeights(True)
+        self.tree_spans.setAlternatingRowColors(True)
+        header = self.tree_spans.header()
+        header.setStretchLastSection(True)
+        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeToContents)
+        layout.addWidget(self.tree_spans, 1)
+
+        bottom_layout = QtWidgets.QHBoxLayout()
+        self.lbl_status = QtWidgets.QLabel("")
+        bottom_layout.addWidget(self.lbl_status, 1)
+        self.btn_clear = QtWidgets.QPushButton("지우기")
+        self.btn_clear.setAutoDefault(False)
+        self.btn_export = QtWidgets.QPushButton("Chrome trace 내보내기...")
+        self.btn_export.setAutoDefault(False)
+        bottom_layout.addWidget(self.btn_clear)
+        bottom_layout.addWidget(self.btn_export)
+        layout.addLayout(bottom_layout)
+
+        # 시그널
+        self.btn_clear.clicked.connect(self.clear_spans)
+        self.btn_export.clicked.connect(self.export_trace)
+
+        self.resize(900, 500)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._refresh_timer.start()
+
+    def hideEvent(self, event):
+        self._refresh_timer.stop()
+        super().hideEvent(event)
+
+    def refresh(self):
+        if self.tracer.generation == self._shown_generation:
+            return
+        self._shown_generation = self.tracer.generation
+
+        spans = self.tracer.spans()
+        items = []
+        for s in spans:
+            details = ", ".join(f"{k}={v}" for k, v in s.args.items() if k not in ('bytes', 'lines'))
+            throughput = s.throughput()
+            item = QtWidgets.QTreeWidgetItem([
+                "    " * s.depth + s.name,
+                f"{(s.start - self.tracer.origin) * 1000:,.1f}",
+                f"{s.duration * 1000:,.1f}",
+                f"{s.bytes:,}" if s.bytes else "",
+                f"{s.lines:,}" if s.lines else "",
+                f"{throughput:,.1f}" if throughput else "",
+                s.thread,
+                details,
+            ])
+            for col in range(1, 6):
+                item.setTextAlignment(col, Qt.AlignRight | Qt.AlignVCenter)
+            items.append(item)
+
+        self.tree_spans.clear()
+        self.tree_spans.addTopLevelItems(items)
+        self.tree_spans.scrollToBottom()
+        self.lbl_status.setText(f"구간 {len(spans):,}개 (최근 {self.tracer.MAX_SPANS:,}개까지 보관)")
+
+    def clear_spans(self):
+        self.tracer.clear()
+        self.refresh()
+
+    def export_trace(self):
+        default_name = f"andyfinder_trace_tab{self.tab_content.tab_number}_{datetime.now():%Y%m%d_%H%M%S}.json"
+        path, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Chrome trace 내보내기", os.path.join(".", default_name), "Chrome Trace (*.json)"
+        )
+        if not path:
+            return
+        try:
+            count = self.tracer.export_chrome_trace(path)
+            self.lbl_status.setText(f"내보내기 완료: {path} ({count:,}개 구간)")
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "오류", f"내보내기 실패: {e}")
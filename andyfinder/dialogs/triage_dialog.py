@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+from typing import Optional
+
+from PySide6 import QtCore, QtWidgets
+from PySide6.QtCore import Qt
+
+from andyfinder.favorites import (
+    QUERY_FAVORITES_PATH,
+    load_favorite_nodes,
+    list_favorite_folders,
+    select_favorite_items,
+)
+from andyfinder.views.triage_model import TriageSummaryModel
+from andyfinder.workers.triage_worker import FavoriteTriageWorker
+
+
+class FavoriteTriageDialog(QtWidgets.QDialog):
+    """기본 검색어 즐겨찾기 일괄 실행(Triage) 다이얼로그 (Modeless)
+
+    - 전체 또는 선택한 폴더의 즐겨찾기를 한 번의 스캔으로 실행
+    - 즐겨찾기별 Hit 수 / 처음·마지막 라인 / 샘플 표시
+    - 행 더블클릭: 해당 즐겨찾기의 결과를 tblResults에 표시 (drill-down)
+    """
+
+    def __init__(self, tab_content, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("즐겨찾기 일괄 실행 (Triage)")
+        self.setModal(False)
+        self.tab_content = tab_content
+        self.triage_thread: Optional[QtCore.QThread] = None
+        self.triage_worker: Optional[FavoriteTriageWorker] = None
+        self.snapshot_revision = -1  # 요약을 만든 스냅샷 revision
+        self.setup_ui()
+
+    def setup_ui(self):
+        layout = QtWidgets.QVBoxLayout(self)
+
+        top_layout = QtWidgets.QHBoxLayout()
+        top_layout.addWidget(QtWidgets.QLabel("범위:"))
+        self.cmb_scope = QtWidgets.QComboBox()
+        self.cmb_scope.setMinimumWidth(300)
+        top_layout.addWidget(self.cmb_scope, 1)
+
+        self.btn_run = QtWidgets.QPushButton("실행")
+        self.btn_run.setAutoDefault(False)
+        self.btn_stop = QtWidgets.QPushButton("중지")
+        self.btn_stop.setAutoDefault(False)
+        self.btn_stop.setEnabled(False)
+        self.prog = QtWidgets.QProgressBar()
+        self.prog.setFixedWidth(150)
+        self.prog.setRange(0, 100)
+        self.prog.setValue(0)
+
+        top_layout.addWidget(self.btn_run)
+        top_layout.addWidget(self.btn_stop)
+        top_layout.addWidget(self.prog)
+        layout.addLayout(top_layout)
+
+        self.lbl_status = QtWidgets.QLabel("")
+        layout.addWidget(self.lbl_status)
+
+        self.tbl_summary = QtWidgets.QTableView()
+        self.tbl_summary.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
+        self.tbl_summary.setSelectionMode(QtWidgets.QAbstractItemView.SingleSelection)
+        self.tbl_summary.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
+        self.tbl_summary.verticalHeader().setVisible(False)
+        self.tbl_summary.setAlternatingRowColors(True)
+        self.tbl_summary.setWordWrap(False)
+
+        self.summary_model = TriageSummaryModel()
+        self.tbl_summary.setModel(self.summary_model)
+
+        header = self.tbl_summary.horizontalHeader()
+        header.setSectionResizeMode(0, QtWidgets.QHeaderView.Interactive)
+        for col in (1, 2, 3):
+            header.setSectionResizeMode(col, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(4, QtWidgets.QHeaderView.Stretch)
+        self.tbl_summary.setColumnWidth(0, 250)
+
+        layout.addWidget(self.tbl_summary, 1)
+
+        info_label = QtWidgets.QLabel("행 더블클릭: 해당 즐겨찾기의 결과를 검색결과 창에 표시")
+        info_label.setStyleSheet("color: gray;")
+        layout.addWidget(info_label)
+
+        # 시그널
+        self.btn_run.clicked.connect(self.run_triage)
+        self.btn_stop.clicked.connect(self.cancel_triage)
+        self.tbl_summary.doubleClicked.connect(self.on_table_double_clicked)
+
+        self.resize(900, 500)
+
+    def refresh_scopes(self):
+        """즐겨찾기 파일을 다시 읽어 범위 콤보박스 구성"""
+        current = self.cmb_scope.currentData()
+        try:
+            nodes = load_favorite_nodes(QUERY_FAVORITES_PATH)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "오류", f"즐겨찾기 로드 실패: {e}")
+            nodes = []
+
+        self.cmb_scope.clear()
+        self.cmb_scope.addItem(f"전체 ({len(select_favorite_items(nodes))}개)", "")
+        for folder in list_favorite_folders(nodes):
+            count = len(select_favorite_items(nodes, folder))
+            self.cmb_scope.addItem(f"{folder} ({count}개)", folder)
+
+        idx = self.cmb_scope.findData(current)
+        if idx >= 0:
+            self.cmb_scope.setCurrentIndex(idx)
+
+    def run_triage(self):
+        snapshot = self.tab_content.snapshot()
+        if not snapshot:
+            QtWidgets.QMessageBox.information(self, "안내", "먼저 (dumpstate) 파일을 여세요.")
+            return
+
+        try:
+            nodes = load_favorite_nodes(QUERY_FAVORITES_PATH)
+        except Exception as e:
+            QtWidgets.QMessageBox.critical(self, "오류", f"즐겨찾기 로드 실패: {e}")
+            return
+
+        items = select_favorite_items(nodes, self.cmb_scope.currentData() or None)
+        if not items:
+            self.lbl_status.setText("실행할 즐겨찾기가 없습니다")
+            return
+
+        self.stop_triage()
+
+        self.triage_thread = QtCore.QThread(self)
+        self.snapshot_revision = snapshot.revision
+        self.triage_worker = FavoriteTriageWorker(snapshot, items)
+        self.triage_worker.moveToThread(self.triage_thread)
+        self.triage_thread.started.connect(self.triage_worker.run)
+        self.triage_worker.progress.connect(self.prog.setValue)
+        self.triage_worker.failed.connect(self.on_triage_failed)
+        self.triage_worker.finished.connect(self.on_triage_finished)
+        self.btn_run.setEnabled(False)
+        self.btn_stop.setEnabled(True)
+        self.prog.setValue(0)
+        self.lbl_status.setText(f"{len(items)}개 즐겨찾기 실행 중...")
+        self.triage_thread.start()
+
+    def stop_triage(self):
+        if self.triage_worker:
+            self.triage_worker.stop()
+        if self.triage_thread:
+            self.triage_thread.quit()
+            self.triage_thread.wait()
+        self.triage_worker = None
+        self.triage_thread = None
+        self.btn_run.setEnabled(True)
+        self.btn_stop.setEnabled(False)
+
+    def cancel_triage(self):
+        """중지 버튼 - 중지된 실행의 부분 결과는 표시하지 않음"""
+        if self.triage_worker is None:
+            return
+        self.stop_triage()
+        self.prog.setValue(0)
+        self.lbl_status.setText("중지됨")
+
+    def on_triage_failed(self, msg: str):
+        if self.triage_worker is None or self.sender() is not self.triage_worker:
+            return
+        self.stop_triage()
+        self.lbl_status.setText("실행 실패: " + msg)
+
+    def on_triage_finished(self, summaries, duration: float):
+        if self.triage_worker is None or self.sender() is not self.triage_worker:
+            return
+        self.stop_triage()
+        self.summary_model.set_summaries(summaries)
+        matched = sum(1 for s in summaries if s.lines)
+        self.lbl_status.setText(
+            f"완료: {len(summaries)}개 중 {matched}개 매칭 | duration : {duration:.2f} sec(s)"
+        )
+
+    def on_table_double_clicked(self, index):
+        if not index.isValid():
+            return
+        summary = self.summary_model.get(index.row())
+        if summary.error or not summary.lines:
+            return
+        if self.tab_content.snapshot().revision != self.snapshot_revision:
+            self.lbl_status.setText("파일 내용이 변경되었습니다. 다시 실행하세요")
+            return
+        self.tab_content.show_triage_results(summary)
+
+    def closeEvent(self, event):
+        self.stop_triage()
+        super().closeEvent(event)
+
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_Escape:
+            self.close()
+            event.accept()
+            return
+        super().keyPressEvent(event)
@@ -5,11 +5,17 @@ AndyFinder Editors Package
 코드 편집기 관련 클래스들을 포함하는 패키지
 """
 from andyfinder.editors.line_number_area import LineNumberArea
+from andyfinder.editors.keyword_highlighter import KeywordHighlighter
+from andyfinder.editors.overview_ruler import OverviewRuler
 from andyfinder.editors.code_editor import CodeEditor
 from andyfinder.editors.drag_drop_editor import DragDropCodeEditor
+from andyfinder.editors.log_viewer import LogViewer
 
 __all__ = [
     'LineNumberArea',
+    'KeywordHighlighter',
+    'OverviewRuler',
     'CodeEditor',
     'DragDropCodeEditor',
+    'LogViewer',
 ]
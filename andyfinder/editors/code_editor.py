@@ -5,7 +5,11 @@ CodeEditor - 라인 번호와 북마크를 지원하는 코드 편집기
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt, Signal
 
+from andyfinder.editors.keyword_highlighter import KeywordHighlighter
 from andyfinder.editors.line_number_area import LineNumberArea
+from andyfinder.editors.overview_ruler import OverviewRuler
+from andyfinder.marks import SortedIndexSet
+from andyfinder.snapshot import SnapshotCache, TextSnapshot
 
 # 전역 설정값
 g_MIN_FONT_SIZE = 1
@@ -18,8 +22,15 @@ class CodeEditor(QtWidgets.QPlainTextEdit):
     def __init__(self):
         super().__init__()
         self.lineNumberArea = LineNumberArea(self)
-        self.color_highlight_selections = []
-        self.bookmarks = set()
+        self.overview_ruler = OverviewRuler(self)  # 세로 스크롤바 옆 분포 룰러
+        self.bookmarks = SortedIndexSet()  # 1-based 라인 번호 (정렬 유지)
+
+        # 문서 텍스트 스냅샷 캐시 (편집 시 revision 증가 → 다음 접근 때 재생성)
+        self.snapshot_cache = SnapshotCache(self.toPlainText)
+        self.document().contentsChange.connect(self._on_contents_change)
+
+        # Color 키워드 하이라이트 (보이는 블록만 포맷, 현재 라인 하이라이트와 별개)
+        self.keyword_highlighter = KeywordHighlighter(self)
 
         # 가로/세로 스크롤바 항상 표시
         self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
@@ -41,6 +52,19 @@ class CodeEditor(QtWidgets.QPlainTextEdit):
         # 초기 테두리 설정
         self.setStyleSheet("QPlainTextEdit { border: 1px solid black; }")
 
+    def _on_contents_change(self, position, chars_removed, chars_added):
+        # 서식만 바뀐 경우(chars 변화 없음)는 스냅샷을 유지
+        if chars_removed or chars_added:
+            self.snapshot_cache.invalidate()
+
+    def snapshot(self) -> TextSnapshot:
+        """현재 문서의 캐시된 스냅샷 (toPlainText 대신 사용)"""
+        return self.snapshot_cache.snapshot()
+
+    def set_snapshot_text(self, text: str):
+        """setPlainText(text) 후 호출: 로딩한 문자열을 그대로 스냅샷으로 등록"""
+        self.snapshot_cache.set_text(text)
+
     # 폰트 설정 오버라이드: 에디터/라인넘버 동기화
     def setFont(self, font: QtGui.QFont):
         super().setFont(font)
@@ -81,23 +105,28 @@ class CodeEditor(QtWidgets.QPlainTextEdit):
                 break
             parent = parent.parent()
 
+    def add_bookmarks(self, line_numbers):
+        """여러 북마크를 한 번에 추가 (1-based) - 라인넘버 영역은 1회만 갱신"""
+        self.bookmarks.update(line_numbers)
+        self.lineNumberArea.update()
+
     def goto_next_bookmark(self):
         """다음 북마크로 이동"""
         if not self.bookmarks:
             return
         current_line = self.textCursor().blockNumber() + 1
-        next_bookmarks = sorted([b for b in self.bookmarks if b > current_line])
-        if next_bookmarks:
-            self.gotoLine(next_bookmarks[0])
+        next_line = self.bookmarks.next_after(current_line)
+        if next_line > 0:
+            self.gotoLine(next_line)
 
     def goto_previous_bookmark(self):
         """이전 북마크로 이동"""
         if not self.bookmarks:
             return
         current_line = self.textCursor().blockNumber() + 1
-        prev_bookmarks = sorted([b for b in self.bookmarks if b < current_line], reverse=True)
-        if prev_bookmarks:
-            self.gotoLine(prev_bookmarks[0])
+        prev_line = self.bookmarks.prev_before(current_line)
+        if prev_line > 0:
+            self.gotoLine(prev_line)
 
     def lineNumberAreaWidth(self):
         digits = 1
@@ -109,7 +138,7 @@ class CodeEditor(QtWidgets.QPlainTextEdit):
         return space
 
     def updateLineNumberAreaWidth(self, _):
-        self.setViewportMargins(self.lineNumberAreaWidth(), 0, 0, 0)
+        self.setViewportMargins(self.lineNumberAreaWidth(), 0, OverviewRuler.WIDTH, 0)
 
     def updateLineNumberArea(self, rect, dy):
         if dy:
@@ -123,6 +152,9 @@ class CodeEditor(QtWidgets.QPlainTextEdit):
         super().resizeEvent(event)
         cr = self.contentsRect()
         self.lineNumberArea.setGeometry(QtCore.QRect(cr.left(), cr.top(), self.lineNumberAreaWidth(), cr.height()))
+        # 오버뷰 룰러: viewport 오른쪽 여백(스크롤바 바로 왼쪽)
+        vr = self.viewport().geometry()
+        self.overview_ruler.setGeometry(QtCore.QRect(vr.right() + 1, vr.top(), OverviewRuler.WIDTH, vr.height()))
 
     def lineNumberAreaPaintEvent(self, event):
         painter = QtGui.QPainter(self.lineNumberArea)
@@ -164,7 +196,6 @@ class CodeEditor(QtWidgets.QPlainTextEdit):
     def highlightCurrentLine(self):
         """요청사항 4: lineView_clone에도 current active line에 light blue 배경 표시"""
         extraSelections = []
-        extraSelections.extend(self.color_highlight_selections)
 
         if not self.isReadOnly():
             selection = QtWidgets.QTextEdit.ExtraSelection()
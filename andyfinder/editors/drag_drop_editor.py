@@ -3,15 +3,28 @@
 DragDropCodeEditor - Drag & Drop과 내부 검색을 지원하는 CodeEditor
 """
 import re
-from PySide6 import QtGui, QtWidgets
+from bisect import bisect_left
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt, Signal
 
 from andyfinder.editors.code_editor import CodeEditor
+from andyfinder.matcher import find_next, find_prev
+from andyfinder.workers.find_count_worker import FindCountWorker
 
 
 class DragDropCodeEditor(CodeEditor):
-    """Drag & Drop이 가능하고 내부 검색을 지원하는 CodeEditor"""
+    """Drag & Drop이 가능하고 내부 검색을 지원하는 CodeEditor
+
+    내부 검색(F3/F4)은 커서 위치부터 필요한 만큼만 검색해 첫 매칭을 바로 보여주고 (matcher.find_next/find_prev),
+    전체 개수/순번은 FindCountWorker가 구한 매칭 위치로 채운다 ((문서 revision, 검색어)별 LRU 캐시).
+    """
     fileDropped = Signal(str)
+    searchCountReady = Signal(object)  # (현재 순번, 전체 개수) - 전체 개수 계산이 끝났을 때
+
+    FIND_CACHE_SIZE = 4
 
     def __init__(self, parent=None):
         super().__init__()
@@ -19,10 +32,14 @@ class DragDropCodeEditor(CodeEditor):
 
         # 내부 검색 상태
         self.internal_search_pattern = ""
-        self.internal_search_matches = []
-        self.internal_search_index = -1
+        self.internal_search_regex: Optional[re.Pattern] = None
         self.search_dialog = None
 
+        # (revision, 검색어) -> (시작 오프셋 배열, 끝 오프셋 배열)
+        self.find_cache: "OrderedDict[Tuple[int, str], tuple]" = OrderedDict()
+        self.find_count_thread: Optional[QtCore.QThread] = None
+        self.find_count_worker: Optional[FindCountWorker] = None
+
     def dragEnterEvent(self, event):
         if event.mimeData().hasUrls():
             event.acceptProposedAction()
@@ -64,14 +81,10 @@ class DragDropCodeEditor(CodeEditor):
             # 부모를 TabContent로 설정
             parent_widget = tab_content if tab_content else self.window()
 
-            # LineViewSearchDialog는 AndyFinderTab.py에 정의되어 있으므로 동적으로 import
             # 순환 참조를 피하기 위해 여기서 import
-            try:
-                from AndyFinderTab import LineViewSearchDialog
-                self.search_dialog = LineViewSearchDialog(self, parent_widget, viewer_name)
-            except ImportError:
-                # LineViewSearchDialog를 찾을 수 없는 경우 처리
-                return
+            from andyfinder.dialogs.search_dialog import LineViewSearchDialog
+            self.search_dialog = LineViewSearchDialog(self, parent_widget, viewer_name)
+            self.searchCountReady.connect(self.search_dialog.update_status)
 
         # 선택된 텍스트 확인
         cursor = self.textCursor()
@@ -90,36 +103,89 @@ class DragDropCodeEditor(CodeEditor):
 
         self.search_dialog.edt_search.selectAll()
 
-    def find_all_matches(self, pattern):
-        """모든 매칭 위치 찾기"""
-        if not pattern:
-            return []
-
-        try:
-            regex = re.compile(pattern, re.IGNORECASE)
-        except re.error:
-            return []
+    def reset_internal_search(self):
+        """검색 상태 초기화 (F5: 처음부터 다시 검색) - 진행 중인 개수 계산도 중지"""
+        self.stop_find_count()
+        self.internal_search_pattern = ""
+        self.internal_search_regex = None
 
-        content = self.toPlainText()
-        matches = []
+    def _prepare_internal_search(self, pattern) -> Optional[re.Pattern]:
+        """검색어가 바뀌면 정규식을 다시 만들고, 전체 개수가 캐시에 없으면 워커 시작"""
+        if pattern != self.internal_search_pattern or self.internal_search_regex is None:
+            self.stop_find_count()
+            self.internal_search_pattern = pattern
+            try:
+                self.internal_search_regex = re.compile(pattern, re.IGNORECASE)
+            except re.error:
+                self.internal_search_regex = None
+                return None
+
+        if self._cached_matches() is None and self.find_count_worker is None:
+            self.start_find_count()
+        return self.internal_search_regex
+
+    def _cached_matches(self):
+        key = (self.snapshot_cache.revision, self.internal_search_pattern)
+        matches = self.find_cache.get(key)
+        if matches is not None:
+            self.find_cache.move_to_end(key)
+        return matches
 
-        for match in regex.finditer(content):
-            matches.append((match.start(), match.end()))
+    def start_find_count(self):
+        """현재 스냅샷 전체의 매칭 위치를 백그라운드에서 계산"""
+        self.find_count_thread = QtCore.QThread(self)
+        self.find_count_worker = FindCountWorker(self.snapshot(), self.internal_search_pattern,
+                                                 self.internal_search_regex)
+        self.find_count_worker.moveToThread(self.find_count_thread)
+        self.find_count_thread.started.connect(self.find_count_worker.run)
+        self.find_count_worker.finished.connect(self.on_find_count_finished)
+        self.find_count_worker.failed.connect(self.stop_find_count)
+        self.find_count_thread.start()
+
+    def stop_find_count(self, *args):
+        if self.find_count_worker:
+            self.find_count_worker.stop()
+        if self.find_count_thread:
+            self.find_count_thread.quit()
+            self.find_count_thread.wait()
+        self.find_count_worker = None
+        self.find_count_thread = None
+
+    def on_find_count_finished(self, starts, ends, pattern: str, revision: int, duration: float):
+        self.stop_find_count()
+        self.find_cache[(revision, pattern)] = (starts, ends)
+        while len(self.find_cache) > self.FIND_CACHE_SIZE:
+            self.find_cache.popitem(last=False)
+
+        # 그 사이 검색어/문서가 바뀌지 않았으면 현재 선택 기준 순번 갱신
+        if pattern == self.internal_search_pattern and revision == self.snapshot_cache.revision:
+            self.searchCountReady.emit(self._match_status(starts, self.textCursor().selectionStart()))
+
+    @staticmethod
+    def _match_status(starts, start: int):
+        """현재 매칭 시작 위치의 (순번, 전체 개수)"""
+        total = len(starts)
+        if not total:
+            return None
+        i = bisect_left(starts, start)
+        if i < total and starts[i] == start:
+            return (i + 1, total)
+        return (min(i, total), total)
 
-        return matches
+    def _select_match(self, start: int, end: int):
+        cursor = self.textCursor()
+        cursor.setPosition(start)
+        cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
+        self.setTextCursor(cursor)
+        self.ensureCursorVisible()
+        self.centerCursor()
 
     def search_next(self, pattern, recursive=True):
-        """다음 검색 결과로 이동"""
+        """다음 검색 결과로 이동 - (순번, 전체 개수), 전체 개수 계산 중이면 해당 값은 None"""
         if not pattern:
             return None
-
-        # 패턴이 변경되었으면 다시 검색
-        if pattern != self.internal_search_pattern:
-            self.internal_search_pattern = pattern
-            self.internal_search_matches = self.find_all_matches(pattern)
-            self.internal_search_index = -1
-
-        if not self.internal_search_matches:
+        regex = self._prepare_internal_search(pattern)
+        if regex is None:
             return None
 
         # 현재 커서 위치: 선택이 있으면 선택 끝, 없으면 현재 위치
@@ -129,44 +195,38 @@ class DragDropCodeEditor(CodeEditor):
         else:
             cursor_pos = cursor.position()
 
-        # 현재 위치 이후의 매칭 찾기
-        found = False
-        for i, (start, end) in enumerate(self.internal_search_matches):
-            if start >= cursor_pos:
-                self.internal_search_index = i
-                found = True
-                break
-
-        # 찾지 못했으면 처음부터
-        if not found:
-            if recursive:
-                self.internal_search_index = 0
-            else:
-                return (len(self.internal_search_matches), len(self.internal_search_matches))
-
-        # 해당 위치로 이동
-        start, end = self.internal_search_matches[self.internal_search_index]
-        cursor = self.textCursor()
-        cursor.setPosition(start)
-        cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
-        self.setTextCursor(cursor)
-        self.ensureCursorVisible()
-        self.centerCursor()
-
-        return (self.internal_search_index + 1, len(self.internal_search_matches))
+        matches = self._cached_matches()
+        if matches is not None:
+            starts, ends = matches
+            if not starts:
+                return None
+            i = bisect_left(starts, cursor_pos)
+            if i >= len(starts):
+                if not recursive:
+                    return (len(starts), len(starts))
+                i = 0
+            self._select_match(starts[i], ends[i])
+            return (i + 1, len(starts))
+
+        text = self.snapshot().text
+        m = find_next(regex, text, cursor_pos, len(text))
+        if m is None:
+            # 찾지 못했으면 처음부터
+            first = find_next(regex, text, 0, cursor_pos) if cursor_pos > 0 else None
+            if first is None:
+                return None
+            if not recursive:
+                return (None, None)
+            m = first
+        self._select_match(m.start(), m.end())
+        return (None, None)
 
     def search_prev(self, pattern, recursive=True):
-        """이전 검색 결과로 이동"""
+        """이전 검색 결과로 이동 - (순번, 전체 개수), 전체 개수 계산 중이면 해당 값은 None"""
         if not pattern:
             return None
-
-        # 패턴이 변경되었으면 다시 검색
-        if pattern != self.internal_search_pattern:
-            self.internal_search_pattern = pattern
-            self.internal_search_matches = self.find_all_matches(pattern)
-            self.internal_search_index = len(self.internal_search_matches)
-
-        if not self.internal_search_matches:
+        regex = self._prepare_internal_search(pattern)
+        if regex is None:
             return None
 
         # 현재 커서 위치: 선택이 있으면 선택 시작, 없으면 현재 위치
@@ -176,32 +236,31 @@ class DragDropCodeEditor(CodeEditor):
         else:
             cursor_pos = cursor.position()
 
-        # 현재 위치 이전의 매칭 찾기
-        found = False
-        for i in range(len(self.internal_search_matches) - 1, -1, -1):
-            start, end = self.internal_search_matches[i]
-            if start < cursor_pos:
-                self.internal_search_index = i
-                found = True
-                break
-
-        # 찾지 못했으면 마지막으로
-        if not found:
-            if recursive:
-                self.internal_search_index = len(self.internal_search_matches) - 1
-            else:
-                return (1, len(self.internal_search_matches))
-
-        # 해당 위치로 이동
-        start, end = self.internal_search_matches[self.internal_search_index]
-        cursor = self.textCursor()
-        cursor.setPosition(start)
-        cursor.setPosition(end, QtGui.QTextCursor.KeepAnchor)
-        self.setTextCursor(cursor)
-        self.ensureCursorVisible()
-        self.centerCursor()
-
-        return (self.internal_search_index + 1, len(self.internal_search_matches))
+        matches = self._cached_matches()
+        if matches is not None:
+            starts, ends = matches
+            if not starts:
+                return None
+            i = bisect_left(starts, cursor_pos) - 1
+            if i < 0:
+                if not recursive:
+                    return (1, len(starts))
+                i = len(starts) - 1
+            self._select_match(starts[i], ends[i])
+            return (i + 1, len(starts))
+
+        text = self.snapshot().text
+        m = find_prev(regex, text, cursor_pos)
+        if m is None:
+            # 찾지 못했으면 마지막으로
+            last = find_prev(regex, text, len(text) + 1, cursor_pos)
+            if last is None:
+                return None
+            if not recursive:
+                return (None, None)
+            m = last
+        self._select_match(m.start(), m.end())
+        return (None, None)
 
     def keyPressEvent(self, event):
         # Ctrl+G: Go to Line (focus가 있을 때만)
@@ -273,12 +332,8 @@ class DragDropCodeEditor(CodeEditor):
 
         parent_widget = tab_content if tab_content else self.window()
 
-        # GoToLineDialog는 AndyFinderTab.py에 정의되어 있으므로 동적으로 import
-        try:
-            from AndyFinderTab import GoToLineDialog
-            dialog = GoToLineDialog(self, parent_widget)
-            if dialog.exec() == QtWidgets.QDialog.Accepted and dialog.line_number > 0:
-                self.gotoLine(dialog.line_number)
-        except ImportError:
-            # GoToLineDialog를 찾을 수 없는 경우 처리
-            pass
+        # 순환 참조를 피하기 위해 여기서 import
+        from andyfinder.dialogs.goto_dialog import GoToLineDialog
+        dialog = GoToLineDialog(self, parent_widget)
+        if dialog.exec() == QtWidgets.QDialog.Accepted and dialog.line_number > 0:
+            self.gotoLine(dialog.line_number)
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+KeywordHighlighter - 화면에 보이는 블록에만 Color 키워드 배경을 입히는 하이라이터
+"""
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+
+
+class KeywordHighlighter(QtCore.QObject):
+    """
+    Color 키워드 하이라이터 (QPlainTextEdit 1개 전용)
+
+    - 모든 키워드를 대소문자 무시 alternation 정규식 1개로 합쳐 한 번의 finditer로 매칭
+      (긴 키워드를 앞에 두어 접두어가 같은 짧은 키워드에 가려지지 않게 함)
+    - QSyntaxHighlighter와 같은 방식(블록 QTextLayout의 추가 포맷)으로 배경을 입히되,
+      문서 전체가 아니라 viewport에 보이는 블록(+MARGIN_BLOCKS)만 처리
+    - 블록 userState에 적용한 generation을 기록 → 스크롤로 새로 보이는 블록만 추가 처리,
+      키워드가 바뀌면 generation 증가로 화면 밖 블록은 다시 보일 때 갱신
+    - ExtraSelection을 쓰지 않으므로 현재 라인 하이라이트(highlightCurrentLine)와 독립
+    """
+    MARGIN_BLOCKS = 20
+
+    def __init__(self, editor: QtWidgets.QPlainTextEdit):
+        super().__init__(editor)
+        self.editor = editor
+        self.pattern: Optional[re.Pattern] = None
+        self.formats: List[QtGui.QTextCharFormat] = []  # 정규식 그룹 번호 - 1 -> 배경 포맷
+        self.generation = 0
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.highlight_visible_blocks)
+
+        editor.updateRequest.connect(self._schedule)
+        editor.document().contentsChange.connect(self._on_contents_change)
+
+    def set_keywords(self, keywords: Sequence[Tuple[str, QtGui.QColor]]):
+        """(키워드, 색) 목록 설정 - 빈 목록이면 하이라이트 제거"""
+        ordered = sorted((kw for kw in keywords if kw[0]), key=lambda kw: len(kw[0]), reverse=True)
+        if ordered:
+            self.pattern = re.compile('|'.join('(' + re.escape(kw) + ')' for kw, _ in ordered), re.IGNORECASE)
+            self.formats = []
+            for _, color in ordered:
+                fmt = QtGui.QTextCharFormat()
+                fmt.setBackground(color)
+                self.formats.append(fmt)
+        else:
+            self.pattern = None
+            self.formats = []
+
+        # 0 미만은 QTextBlock userState 기본값(-1)과 겹치므로 양수만 사용
+        self.generation = self.generation + 1 if self.generation < 0x7FFFFFFF else 1
+        self.highlight_visible_blocks()
+
+    def clear(self):
+        self.set_keywords([])
+
+    def _schedule(self, rect=None, dy=0):
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def _on_contents_change(self, position: int, chars_removed: int, chars_added: int):
+        """편집된 블록은 다시 매칭하도록 표시 (서식만 바뀐 경우 제외)
+
+        중간에 새로 생긴 블록은 userState가 기본값(-1)이므로 편집 시작/끝 블록만 표시하면 됨
+        (setPlainText로 전체가 바뀌어도 블록 전체를 순회하지 않음)
+        """
+        if not (chars_removed or chars_added):
+            return
+        doc = self.editor.document()
+        doc.findBlock(position).setUserState(-1)
+        doc.findBlock(position + chars_added).setUserState(-1)
+        self._schedule()
+
+    def _block_ranges(self, text: str) -> List[QtGui.QTextLayout.FormatRange]:
+        ranges = []
+        formats = self.formats
+        for m in self.pattern.finditer(text):
+            r = QtGui.QTextLayout.FormatRange()
+            r.start = m.start()
+            r.length = m.end() - m.start()
+            r.format = formats[m.lastindex - 1]
+            ranges.append(r)
+        return ranges
+
+    def highlight_visible_blocks(self):
+        """viewport에 보이는 블록 중 현재 generation이 아닌 블록만 다시 포맷"""
+        editor = self.editor
+        block = editor.firstVisibleBlock()
+        if not block.isValid():
+            return
+
+        for _ in range(self.MARGIN_BLOCKS):
+            prev = block.previous()
+            if not prev.isValid():
+                break
+            block = prev
+
+        offset = editor.contentOffset()
+        bottom_limit = editor.viewport().rect().bottom()
+        generation = self.generation
+        dirty_from = dirty_to = -1
+        after_bottom = 0
+
+        while block.isValid() and after_bottom <= self.MARGIN_BLOCKS:
+            if block.userState() != generation:
+                layout = block.layout()
+                if self.pattern is not None:
+                    layout.setFormats(self._block_ranges(block.text()))
+                elif layout.formats():
+                    layout.clearFormats()
+                else:
+                    layout = None
+                block.setUserState(generation)
+                if layout is not None:
+                    if dirty_from < 0:
+                        dirty_from = block.position()
+                    dirty_to = block.position() + block.length()
+
+            if editor.blockBoundingGeometry(block).translated(offset).top() > bottom_limit:
+                after_bottom += 1
+            block = block.next()
+
+        if dirty_from >= 0:
+            # 레이아웃 캐시 갱신 및 다시 그리기 (QSyntaxHighlighter와 동일)
+            editor.document().markContentsDirty(dirty_from, dirty_to - dirty_from)
@@ -0,0 +1,459 @@
+# -*- coding: utf-8 -*-
+"""
+LogViewer - 화면에 보이는 라인만 라인 버퍼에서 읽어 그리는 읽기 전용 로그 뷰어
+"""
+import re
+from typing import List, Optional, Sequence, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6.QtCore import Qt, Signal
+
+from andyfinder.marks import SortedIndexSet
+
+# 전역 설정값 (CodeEditor와 동일)
+g_MIN_FONT_SIZE = 1
+g_MAX_FONT_SIZE = 70
+
+
+class _LogViewerGutter(QtWidgets.QWidget):
+    """LogViewer 라인 번호 영역 (더블클릭: 북마크 토글)"""
+
+    def __init__(self, viewer: "LogViewer"):
+        super().__init__(viewer)
+        self.viewer = viewer
+
+    def sizeHint(self):
+        return QtCore.QSize(self.viewer.gutter_width(), 0)
+
+    def paintEvent(self, event):
+        self.viewer.gutter_paint_event(event)
+
+    def mouseDoubleClickEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            line = self.viewer.line_at_y(event.position().y())
+            if line >= 0:
+                self.viewer.toggle_bookmark(line + 1)
+        super().mouseDoubleClickEvent(event)
+
+
+class LogViewer(QtWidgets.QAbstractScrollArea):
+    """
+    가상화 읽기 전용 로그 뷰어 (QTextDocument 없음)
+
+    - buffer: line_count 속성과 lines(first, count, max_bytes) 메서드를 가진 라인 버퍼 (MappedLineBuffer)
+    - paintEvent는 화면에 보이는 라인만 버퍼에서 읽어 그림 → 파일 크기와 무관한 메모리/그리기 비용
+    - 세로 스크롤 단위 = 라인, 가로 스크롤 단위 = 문자 (긴 라인은 보이는 부분 문자만 그림)
+    - CodeEditor와 같은 사용법: 라인 번호/북마크(더블클릭, F2/Shift+F2), 현재 라인 하이라이트,
+      Color 키워드(set_keywords), 선택/복사(Ctrl+C), gotoLine/Ctrl+G, Ctrl+휠 확대/축소
+    """
+    fontSizeChanged = Signal(int)
+    cursorPositionChanged = Signal()
+
+    MAX_DISPLAY_BYTES = 64 * 1024  # 라인당 화면 표시용으로 디코딩하는 최대 바이트
+    TEXT_MARGIN = 4
+    CURRENT_LINE_COLOR = QtGui.QColor(200, 255, 200)  # 연한 green (읽기 전용)
+    SELECTION_COLOR = QtGui.QColor(51, 153, 255, 110)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buffer = None
+        self.bookmarks = SortedIndexSet()  # 1-based 라인 번호 (정렬 유지)
+        self.gutter = _LogViewerGutter(self)
+
+        # 커서/선택: (라인, 문자 위치), anchor == cursor 이면 선택 없음
+        self.cursor_pos: Tuple[int, int] = (0, 0)
+        self.anchor_pos: Tuple[int, int] = (0, 0)
+
+        self.keyword_pattern: Optional[re.Pattern] = None
+        self.keyword_colors: List[QtGui.QColor] = []
+
+        self._max_columns = 0  # 지금까지 그린 라인 중 최대 문자 수 (가로 스크롤 범위)
+        self._visible: Tuple[int, int, List[str]] = (-1, 0, [])  # (첫 라인, 개수, 라인들) 캐시
+
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+        self.viewport().setCursor(Qt.IBeamCursor)
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.horizontalScrollBar().valueChanged.connect(self._on_scrolled)
+
+        self.setStyleSheet("QAbstractScrollArea { border: 1px solid black; }")
+        self._update_metrics()
+
+    # ------------------------------ 버퍼/스크롤 ------------------------------
+
+    def set_buffer(self, buffer):
+        """표시할 라인 버퍼 지정 (None이면 비움) - 북마크/선택 초기화"""
+        self.buffer = buffer
+        self.bookmarks.clear()
+        self.cursor_pos = self.anchor_pos = (0, 0)
+        self._max_columns = 0
+        self._visible = (-1, 0, [])
+        self.verticalScrollBar().setValue(0)
+        self.horizontalScrollBar().setValue(0)
+        self._update_metrics()
+        self.viewport().update()
+        self.cursorPositionChanged.emit()
+
+    def blockCount(self) -> int:
+        """전체 라인 수 (GoToLineDialog 등 QPlainTextEdit과 같은 이름)"""
+        return self.buffer.line_count if self.buffer is not None else 1
+
+    def line_height(self) -> int:
+        return self.fontMetrics().lineSpacing()
+
+    def visible_line_count(self) -> int:
+        return max(1, self.viewport().height() // max(1, self.line_height()))
+
+    def first_visible_line(self) -> int:
+        return self.verticalScrollBar().value()
+
+    def gutter_width(self) -> int:
+        digits = len(str(max(1, self.blockCount())))
+        return 3 + self.fontMetrics().horizontalAdvance('9') * digits + self.TEXT_MARGIN
+
+    def _update_metrics(self):
+        self.setViewportMargins(self.gutter_width(), 0, 0, 0)
+        cr = self.contentsRect()
+        self.gutter.setGeometry(QtCore.QRect(cr.left(), cr.top(), self.gutter_width(), cr.height()))
+
+        page = self.visible_line_count()
+        vbar = self.verticalScrollBar()
+        vbar.setPageStep(page)
+        vbar.setRange(0, max(0, self.blockCount() - page))
+
+        columns = max(1, self.viewport().width() // max(1, self.fontMetrics().averageCharWidth()))
+        hbar = self.horizontalScrollBar()
+        hbar.setPageStep(columns)
+        hbar.setRange(0, max(0, self._max_columns - columns // 2))
+
+    def _on_scrolled(self, value: int):
+        self.viewport().update()
+        self.gutter.update()
+
+    def _visible_lines(self) -> Tuple[int, List[str]]:
+        """화면에 보이는 라인 (스크롤 위치가 같으면 캐시 사용)"""
+        if self.buffer is None:
+            return 0, []
+        first = self.first_visible_line()
+        count = self.visible_line_count() + 1
+        cached_first, cached_count, lines = self._visible
+        if cached_first != first or cached_count != count:
+            lines = self.buffer.lines(first, count, self.MAX_DISPLAY_BYTES)
+            self._visible = (first, count, lines)
+            longest = max((len(s) for s in lines), default=0)
+            if longest > self._max_columns:
+                self._max_columns = longest
+                self._update_metrics()
+        return first, lines
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_metrics()
+
+    def setFont(self, font: QtGui.QFont):
+        super().setFont(font)
+        self.gutter.setFont(font)
+        self._visible = (-1, 0, [])
+        self._update_metrics()
+        self.viewport().update()
+        self.gutter.update()
+
+    # ------------------------------ 좌표 변환 ------------------------------
+
+    def line_at_y(self, y: float) -> int:
+        if self.buffer is None:
+            return -1
+        line = self.first_visible_line() + int(y // max(1, self.line_height()))
+        return min(line, self.blockCount() - 1)
+
+    def _column_at_x(self, text: str, x: float) -> int:
+        """뷰포트 x 좌표 -> 라인의 문자 위치 (가로 스크롤 문자 수 반영, 이진 탐색)"""
+        start = self.horizontalScrollBar().value()
+        visible = text[start:]
+        x -= self.TEXT_MARGIN
+        if x <= 0 or not visible:
+            return min(start, len(text))
+        fm = self.fontMetrics()
+        lo, hi = 0, len(visible)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if fm.horizontalAdvance(visible[:mid + 1]) - fm.horizontalAdvance(visible[mid]) / 2 < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        return start + lo
+
+    def _pos_at(self, point: QtCore.QPointF) -> Tuple[int, int]:
+        line = max(0, self.line_at_y(point.y()))
+        return line, self._column_at_x(self.buffer.line(line) if self.buffer else "", point.x())
+
+    # ------------------------------ 그리기 ------------------------------
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self.viewport())
+        painter.fillRect(event.rect(), self.palette().base())
+        if self.buffer is None:
+            return
+
+        first, lines = self._visible_lines()
+        fm = self.fontMetrics()
+        line_h = self.line_height()
+        width = self.viewport().width()
+        hstart = self.horizontalScrollBar().value()
+        max_chars = width // max(1, fm.horizontalAdvance('.')) + 2
+        (sel_l1, sel_c1), (sel_l2, sel_c2) = sorted((self.anchor_pos, self.cursor_pos))
+        has_selection = self.anchor_pos != self.cursor_pos
+        pattern = self.keyword_pattern
+        colors = self.keyword_colors
+        text_color = self.palette().color(QtGui.QPalette.Text)
+        x0 = self.TEXT_MARGIN
+
+        for i, text in enumerate(lines):
+            line = first + i
+            top = i * line_h
+            shown = text[hstart:hstart + max_chars]
+
+            if line == self.cursor_pos[0]:
+                painter.fillRect(0, top, width, line_h, self.CURRENT_LINE_COLOR)
+
+            # Color 키워드 (보이는 부분과 겹치는 매칭만)
+            if pattern is not None and shown:
+                for m in pattern.finditer(text, max(0, hstart - 256), hstart + max_chars):
+                    s, e = max(m.start(), hstart) - hstart, min(m.end(), hstart + max_chars) - hstart
+                    if e <= s:
+                        continue
+                    x = x0 + fm.horizontalAdvance(shown[:s])
+                    painter.fillRect(x, top, fm.horizontalAdvance(shown[s:e]), line_h,
+                                     colors[m.lastindex - 1])
+
+            # 선택 영역
+            if has_selection and sel_l1 <= line <= sel_l2:
+                c1 = sel_c1 if line == sel_l1 else 0
+                c2 = sel_c2 if line == sel_l2 else len(text) + 1
+                s, e = max(c1, hstart) - hstart, max(c2, hstart) - hstart
+                if e > s:
+                    x = x0 + fm.horizontalAdvance(shown[:s])
+                    w = fm.horizontalAdvance(shown[s:e]) if line == sel_l2 else width - x
+                    painter.fillRect(x, top, max(2, w), line_h, self.SELECTION_COLOR)
+
+            painter.setPen(text_color)
+            painter.drawText(x0, top + fm.ascent(), shown)
+
+        # 커서 (현재 라인의 문자 위치)
+        cur_line, cur_col = self.cursor_pos
+        if self.hasFocus() and first <= cur_line < first + len(lines) and cur_col >= hstart:
+            text = lines[cur_line - first]
+            x = x0 + fm.horizontalAdvance(text[hstart:cur_col])
+            painter.fillRect(x, (cur_line - first) * line_h, 1, line_h, text_color)
+
+    def gutter_paint_event(self, event):
+        painter = QtGui.QPainter(self.gutter)
+        painter.fillRect(event.rect(), QtGui.QColor(230, 230, 230))
+        if self.buffer is None:
+            return
+        line_h = self.line_height()
+        width = self.gutter.width() - self.TEXT_MARGIN
+        first = self.first_visible_line()
+        last = min(self.blockCount(), first + self.visible_line_count() + 1)
+        bold = QtGui.QFont(self.font())
+        bold.setBold(True)
+
+        for line in range(first, last):
+            top = (line - first) * line_h
+            number = line + 1
+            if number in self.bookmarks:
+                painter.fillRect(0, top, self.gutter.width(), line_h, QtGui.QColor(255, 255, 0))
+                painter.setFont(bold)
+                painter.setPen(Qt.red)
+            else:
+                painter.setFont(self.font())
+                painter.setPen(Qt.black)
+            painter.drawText(0, top, width, line_h, Qt.AlignRight, str(number))
+
+    # ------------------------------ 커서/이동 ------------------------------
+
+    def set_cursor(self, line: int, column: int = 0, keep_anchor: bool = False):
+        line = min(max(0, line), self.blockCount() - 1)
+        self.cursor_pos = (line, max(0, column))
+        if not keep_anchor:
+            self.anchor_pos = self.cursor_pos
+        self.ensure_line_visible(line)
+        self.viewport().update()
+        self.cursorPositionChanged.emit()
+
+    def current_line(self) -> int:
+        """현재 커서 라인 (0-based)"""
+        return self.cursor_pos[0]
+
+    def ensure_line_visible(self, line: int):
+        vbar = self.verticalScrollBar()
+        first = vbar.value()
+        page = self.visible_line_count()
+        if line < first:
+            vbar.setValue(line)
+        elif line >= first + page:
+            vbar.setValue(line - page + 1)
+
+    def gotoLine(self, line_number: int):
+        """특정 라인으로 이동 (1-based) - 화면 가운데에 표시"""
+        if self.buffer is None or line_number < 1 or line_number > self.blockCount():
+            return
+        line = line_number - 1
+        self.verticalScrollBar().setValue(max(0, line - self.visible_line_count() // 2))
+        self.horizontalScrollBar().setValue(0)
+        self.set_cursor(line)
+
+    def selected_text(self) -> str:
+        if self.buffer is None or self.anchor_pos == self.cursor_pos:
+            return ""
+        (l1, c1), (l2, c2) = sorted((self.anchor_pos, self.cursor_pos))
+        return self.buffer.text_between(l1, c1, l2, c2)
+
+    def copy(self):
+        text = self.selected_text()
+        if text:
+            QtWidgets.QApplication.clipboard().setText(text)
+
+    # ------------------------------ 북마크 ------------------------------
+
+    def toggle_bookmark(self, line_number: int):
+        """북마크 토글 (1-based)"""
+        if line_number in self.bookmarks:
+            self.bookmarks.remove(line_number)
+        else:
+            self.bookmarks.add(line_number)
+        self.gutter.update()
+        self.cursorPositionChanged.emit()
+
+    def goto_next_bookmark(self):
+        next_line = self.bookmarks.next_after(self.current_line() + 1)
+        if next_line > 0:
+            self.gotoLine(next_line)
+
+    def goto_previous_bookmark(self):
+        prev_line = self.bookmarks.prev_before(self.current_line() + 1)
+        if prev_line > 0:
+            self.gotoLine(prev_line)
+
+    # ------------------------------ Color 키워드 ------------------------------
+
+    def set_keywords(self, keywords: Sequence[Tuple[str, QtGui.QColor]]):
+        """(키워드, 색) 목록 - KeywordHighlighter와 같은 단일 alternation 정규식 (긴 키워드 우선)"""
+        ordered = sorted((kw for kw in keywords if kw[0]), key=lambda kw: len(kw[0]), reverse=True)
+        if ordered:
+            self.keyword_pattern = re.compile('|'.join('(' + re.escape(kw) + ')' for kw, _ in ordered),
+                                              re.IGNORECASE)
+            self.keyword_colors = [color for _, color in ordered]
+        else:
+            self.keyword_pattern = None
+            self.keyword_colors = []
+        self.viewport().update()
+
+    # ------------------------------ 입력 ------------------------------
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton and self.buffer is not None:
+            line, column = self._pos_at(event.position())
+            self.set_cursor(line, column, keep_anchor=bool(event.modifiers() & Qt.ShiftModifier))
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton and self.buffer is not None:
+            line, column = self._pos_at(event.position())
+            self.set_cursor(line, column, keep_anchor=True)
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def wheelEvent(self, event):
+        # hasFocus 체크: focus가 있고 Ctrl이 눌린 경우만 확대/축소
+        if self.hasFocus() and (event.modifiers() & Qt.ControlModifier):
+            delta = event.angleDelta().y()
+            if delta > 0:
+                self.zoomIn()
+            elif delta < 0:
+                self.zoomOut()
+            event.accept()
+        else:
+            super().wheelEvent(event)
+
+    def zoomIn(self):
+        font = self.font()
+        if font.pointSize() < g_MAX_FONT_SIZE:
+            font.setPointSize(font.pointSize() + 1)
+            self.setFont(font)
+            self.fontSizeChanged.emit(font.pointSize())
+
+    def zoomOut(self):
+        font = self.font()
+        if font.pointSize() > g_MIN_FONT_SIZE:
+            font.setPointSize(font.pointSize() - 1)
+            self.setFont(font)
+            self.fontSizeChanged.emit(font.pointSize())
+
+    def keyPressEvent(self, event):
+        if self.buffer is None:
+            super().keyPressEvent(event)
+            return
+
+        key = event.key()
+        mods = event.modifiers()
+        shift = bool(mods & Qt.ShiftModifier)
+        ctrl = bool(mods & Qt.ControlModifier)
+        line, column = self.cursor_pos
+
+        if ctrl and key == Qt.Key_C:
+            self.copy()
+        elif ctrl and key == Qt.Key_G:
+            self.show_goto_line_dialog()
+        elif key == Qt.Key_F2:
+            if shift:
+                self.goto_previous_bookmark()
+            else:
+                self.goto_next_bookmark()
+        elif key == Qt.Key_Up:
+            self.set_cursor(line - 1, column, shift)
+        elif key == Qt.Key_Down:
+            self.set_cursor(line + 1, column, shift)
+        elif key == Qt.Key_PageUp:
+            self.verticalScrollBar().setValue(self.first_visible_line() - self.visible_line_count())
+            self.set_cursor(line - self.visible_line_count(), column, shift)
+        elif key == Qt.Key_PageDown:
+            self.verticalScrollBar().setValue(self.first_visible_line() + self.visible_line_count())
+            self.set_cursor(line + self.visible_line_count(), column, shift)
+        elif key == Qt.Key_Home:
+            self.set_cursor(0 if ctrl else line, 0, shift)
+            self.horizontalScrollBar().setValue(0)
+        elif key == Qt.Key_End:
+            target = self.blockCount() - 1 if ctrl else line
+            self.set_cursor(target, len(self.buffer.line(target)), shift)
+        elif key == Qt.Key_Left:
+            self.set_cursor(line, max(0, column - 1), shift)
+        elif key == Qt.Key_Right:
+            self.set_cursor(line, min(len(self.buffer.line(line)), column + 1), shift)
+        else:
+            super().keyPressEvent(event)
+            return
+        event.accept()
+
+    def show_goto_line_dialog(self):
+        """Go to Line 다이얼로그 표시"""
+        # 순환 참조를 피하기 위해 여기서 import
+        from andyfinder.dialogs.goto_dialog import GoToLineDialog
+        dialog = GoToLineDialog(self, self.window())
+        if dialog.exec() == QtWidgets.QDialog.Accepted and dialog.line_number > 0:
+            self.gotoLine(dialog.line_number)
+
+    def focusInEvent(self, event):
+        """포커스를 얻으면 빨간색 2px 테두리 (CodeEditor와 동일)"""
+        super().focusInEvent(event)
+        self.setStyleSheet("QAbstractScrollArea { border: 2px solid red; }")
+        self.viewport().update()
+
+    def focusOutEvent(self, event):
+        super().focusOutEvent(event)
+        self.setStyleSheet("QAbstractScrollArea { border: 2px solid black; }")
+        self.viewport().update()
@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""
+OverviewRuler - 세로 스크롤바 옆에 검색결과/키워드/마킹/북마크 분포를 보여주는 룰러
+"""
+import math
+from array import array
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6.QtCore import Qt
+
+from andyfinder.memory import estimate_size
+from andyfinder.overview import OVERVIEW_CATEGORIES, LinesJob
+from andyfinder.workers.overview_worker import OverviewWorker
+
+
+def _blend(color: QtGui.QColor, background: QtGui.QColor, alpha: int) -> int:
+    """background 위에 color를 alpha(0~255)로 합성한 0xffRRGGBB"""
+    a = min(255, alpha) / 255.0
+    r = int(color.red() * a + background.red() * (1 - a))
+    g = int(color.green() * a + background.green() * (1 - a))
+    b = int(color.blue() * a + background.blue() * (1 - a))
+    return 0xFF000000 | (r << 16) | (g << 8) | b
+
+
+class OverviewRuler(QtWidgets.QWidget):
+    """
+    매칭 밀도 오버뷰 룰러 (CodeEditor 1개 전용)
+
+    - 카테고리별 라인 소스를 (키, prepare) 로 등록 → 키가 바뀐 것만 워커에서 다시 계산
+      prepare()는 GUI 스레드에서 필요한 데이터를 잡아 LinesJob을 반환 (실제 계산은 워커),
+      지금 데이터를 만들 수 없으면 None을 반환 → 해당 카테고리는 이전 분포를 유지
+    - 픽셀 1줄 = bucket 1개, (카테고리, 키, 라인 수, 높이)별 히스토그램 LRU 캐시
+      라인 배열도 카테고리별로 보관해 높이만 바뀌면 히스토그램만 다시 셈
+    - 히스토그램은 QImage 1장으로 합성해 두고 paintEvent는 이미지 + 현재 화면 위치만 그림
+      (스크롤 중 다시 그리기 비용이 라인 수와 무관)
+    - 클릭/드래그: 해당 위치의 라인으로 이동
+    """
+    WIDTH = 14
+    CACHE_SIZE = 16
+    REFRESH_DELAY_MS = 150
+
+    # 카테고리 -> (x, 폭, 색)
+    LANES = {
+        'results': (0, 4, QtGui.QColor(255, 140, 0)),
+        'keywords': (4, 4, QtGui.QColor(0, 150, 255)),
+        'marks': (8, 3, QtGui.QColor(220, 0, 0)),
+        'bookmarks': (11, 3, QtGui.QColor(0, 160, 0)),
+    }
+    BACKGROUND = QtGui.QColor(240, 240, 240)
+    VIEW_COLOR = QtGui.QColor(0, 0, 0, 40)
+
+    def __init__(self, editor: QtWidgets.QPlainTextEdit):
+        super().__init__(editor)
+        self.editor = editor
+        self.setFixedWidth(self.WIDTH)
+        self.setCursor(Qt.PointingHandCursor)
+        self.setToolTip("주황: 검색결과 | 파랑: Color 키워드 | 빨강: 마킹 | 초록: 북마크 (클릭: 이동)")
+
+        self._sources: Dict[str, Tuple[object, Callable[[], LinesJob]]] = {}
+        self._lines: Dict[str, Tuple[object, object]] = {}  # category -> (key, 라인 배열)
+        self._hists: "OrderedDict[Tuple[str, object, int, int], object]" = OrderedDict()
+        self._image: Optional[QtGui.QImage] = None
+        self._image_key = None
+
+        self.overview_thread: Optional[QtCore.QThread] = None
+        self.overview_worker: Optional[OverviewWorker] = None
+        self.generation = 0
+
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_DELAY_MS)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        editor.verticalScrollBar().valueChanged.connect(self.update)
+        editor.verticalScrollBar().rangeChanged.connect(self.update)
+        editor.blockCountChanged.connect(self.schedule_refresh)
+
+    def set_source(self, category: str, key, prepare: Optional[Callable[[], LinesJob]]):
+        """라인 소스 등록 (prepare가 None이면 제거) - 키가 같으면 아무것도 하지 않음"""
+        if prepare is None:
+            if self._sources.pop(category, None) is not None:
+                self.schedule_refresh()
+            return
+        current = self._sources.get(category)
+        if current is not None and current[0] == key:
+            return
+        self._sources[category] = (key, prepare)
+        self.schedule_refresh()
+
+    def source_key(self, category: str):
+        """등록된 라인 소스의 키 (없으면 None)"""
+        current = self._sources.get(category)
+        return current[0] if current is not None else None
+
+    def schedule_refresh(self, *args):
+        self._refresh_timer.start()
+
+    def _buckets(self) -> int:
+        return max(1, self.height())
+
+    def refresh(self):
+        """캐시에 없는 히스토그램만 워커로 계산, 모두 있으면 이미지 합성"""
+        line_count = self.editor.blockCount()
+        buckets = self._buckets()
+        jobs = []
+        for category, (key, prepare) in self._sources.items():
+            if (category, key, line_count, buckets) in self._hists:
+                continue
+            cached = self._lines.get(category)
+            source = cached[1] if cached is not None and cached[0] == key else prepare()
+            if source is None:
+                continue
+            jobs.append((category, key, source))
+
+        if not jobs:
+            self._rebuild_image()
+            return
+
+        self.stop_overview()
+        self.generation += 1
+        self.overview_thread = QtCore.QThread(self)
+        self.overview_worker = OverviewWorker(jobs, line_count, buckets, self.generation)
+        self.overview_worker.moveToThread(self.overview_thread)
+        self.overview_thread.started.connect(self.overview_worker.run)
+        self.overview_worker.finished.connect(self.on_overview_finished)
+        self.overview_worker.failed.connect(self.on_overview_failed)
+        self.overview_thread.start()
+
+    def stop_overview(self):
+        if self.overview_worker:
+            self.overview_worker.stop()
+        if self.overview_thread:
+            self.overview_thread.quit()
+            self.overview_thread.wait()
+        self.overview_worker = None
+        self.overview_thread = None
+
+    def cache_size(self, seen: Optional[set] = None) -> int:
+        """라인 배열/히스토그램 캐시와 합성 이미지의 추정 크기"""
+        if seen is None:
+            seen = set()
+        size = estimate_size(self._lines, seen) + estimate_size(self._hists, seen)
+        if self._image is not None:
+            size += self._image.sizeInBytes()
+        return size
+
+    def clear_cache(self):
+        """라인 배열/히스토그램 캐시 해제 (표시 중인 이미지는 유지, 다음 갱신 때 다시 계산)"""
+        self._lines.clear()
+        self._hists.clear()
+
+    def on_overview_failed(self, msg: str):
+        self.stop_overview()
+
+    def on_overview_finished(self, out: dict, generation: int):
+        if generation != self.generation:
+            return
+        line_count, buckets = self.overview_worker.line_count, self.overview_worker.buckets
+        self.stop_overview()
+        for category, (key, lines, hist) in out.items():
+            self._lines[category] = (key, lines)
+            self._hists[(category, key, line_count, buckets)] = hist
+        while len(self._hists) > self.CACHE_SIZE:
+            self._hists.popitem(last=False)
+        self._rebuild_image()
+
+    def _rebuild_image(self):
+        line_count = self.editor.blockCount()
+        buckets = self._buckets()
+        hists = []
+        for category in OVERVIEW_CATEGORIES:
+            source = self._sources.get(category)
+            if source is None:
+                continue
+            hist = self._hists.get((category, source[0], line_count, buckets))
+            if hist is not None:
+                self._hists.move_to_end((category, source[0], line_count, buckets))
+                hists.append((category, hist))
+
+        image_key = (buckets, tuple((c, self._sources[c][0]) for c, _ in hists), line_count)
+        if image_key == self._image_key and self._image is not None:
+            return
+
+        # 픽셀 버퍼(0xffRRGGBB)를 직접 채워 QImage 1회 생성 (bucket마다 Qt 호출하지 않음)
+        width = self.WIDTH
+        bg = self.BACKGROUND
+        pixels = array('I', [bg.rgb() & 0xFFFFFFFF]) * (width * buckets)
+        for category, hist in hists:
+            x, w, base = self.LANES[category]
+            peak = max(hist) if hist else 0
+            if not peak:
+                continue
+            scale = 215.0 / math.log1p(peak)
+            shades = {}
+            for y, count in enumerate(hist):
+                if not count:
+                    continue
+                # 로그 스케일 농도 (1건도 보이도록 최소 40), 배경 위에 미리 합성
+                alpha = 40 + int(math.log1p(count) * scale)
+                lane = shades.get(alpha)
+                if lane is None:
+                    lane = shades[alpha] = array('I', [_blend(base, bg, alpha)]) * w
+                start = y * width + x
+                pixels[start:start + w] = lane
+        image = QtGui.QImage(pixels.tobytes(), width, buckets, width * 4, QtGui.QImage.Format_RGB32).copy()
+
+        self._image = image
+        self._image_key = image_key
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        rect = self.rect()
+        if self._image is not None:
+            if self._image.height() == rect.height():
+                painter.drawImage(0, 0, self._image)
+            else:
+                # 새 높이의 히스토그램을 계산하는 동안 기존 이미지를 늘려서 표시
+                painter.drawImage(rect, self._image)
+        else:
+            painter.fillRect(rect, self.BACKGROUND)
+
+        # 현재 화면에 보이는 범위 (스크롤바 단위 = 라인)
+        bar = self.editor.verticalScrollBar()
+        span = bar.maximum() - bar.minimum() + bar.pageStep()
+        if span > 0:
+            top = int((bar.value() - bar.minimum()) * rect.height() / span)
+            height = max(2, int(bar.pageStep() * rect.height() / span))
+            painter.fillRect(0, top, rect.width(), height, self.VIEW_COLOR)
+
+    def _goto_y(self, y: float):
+        line_count = self.editor.blockCount()
+        height = max(1, self.height())
+        line = min(line_count - 1, max(0, int(y * line_count / height)))
+        self.editor.gotoLine(line + 1)
+
+    def mousePressEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self._goto_y(event.position().y())
+            event.accept()
+            return
+        super().mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.LeftButton:
+            self._goto_y(event.position().y())
+            event.accept()
+            return
+        super().mouseMoveEvent(event)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.schedule_refresh()
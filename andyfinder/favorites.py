@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""즐겨찾기(fav/*.json) 파일 헬퍼 - Qt 비의존"""
+import json
+import os
+from typing import Iterator, List, Optional, Tuple
+
+QUERY_FAVORITES_PATH = "./fav/edit_query.json"
+
+
+def load_favorite_nodes(json_path: str) -> List[dict]:
+    """폴더 구조의 즐겨찾기 노드 로드 (구버전 평면 포맷 자동 변환, 실패 시 예외 전달)"""
+    if not os.path.exists(json_path):
+        return []
+    with open(json_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    favs = data.get('favorites', [])
+    if any(not isinstance(e, dict) or 'type' not in e for e in favs):
+        return [{'type': 'item', 'name': e['name'], 'value': e.get('value', '')}
+                for e in favs if isinstance(e, dict) and 'name' in e and 'value' in e]
+    return favs
+
+
+def iter_favorite_items(nodes: List[dict], prefix: str = "") -> Iterator[Tuple[str, str]]:
+    """(폴더/이름 경로, 값) 순회 - cmb_favorites 표시 문자열과 동일한 경로 형식"""
+    for node in nodes:
+        if node.get('type') == 'folder':
+            folder_name = node.get('name', '')
+            yield from iter_favorite_items(node.get('children', []), f"{prefix}{folder_name}/")
+        else:
+            yield f"{prefix}{node.get('name', '')}", node.get('value', '')
+
+
+def list_favorite_folders(nodes: List[dict], prefix: str = "") -> List[str]:
+    """모든 폴더 경로 목록 ('a/', 'a/b/' 형식)"""
+    folders = []
+    for node in nodes:
+        if node.get('type') == 'folder':
+            path = f"{prefix}{node.get('name', '')}/"
+            folders.append(path)
+            folders.extend(list_favorite_folders(node.get('children', []), path))
+    return folders
+
+
+def select_favorite_items(nodes: List[dict], folder: Optional[str] = None) -> List[Tuple[str, str]]:
+    """folder('a/b/' 형식)가 주어지면 해당 폴더 하위 항목만, 없으면 전체 항목 반환"""
+    items = [(path, value) for path, value in iter_favorite_items(nodes) if value]
+    if folder:
+        items = [(path, value) for path, value in items if path.startswith(folder)]
+    return items
+
+
+def find_favorite(nodes: List[dict], name: str) -> Optional[str]:
+    """이름 또는 전체 경로로 즐겨찾기 값 검색 (경로 일치 우선)"""
+    by_name = None
+    for path, value in iter_favorite_items(nodes):
+        if path == name:
+            return value
+        if by_name is None and path.rsplit('/', 1)[-1] == name:
+            by_name = value
+    return by_name
@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+"""검색결과 그룹 집계 - Qt 비의존
+
+그룹 키 종류
+- field   : logcat 필드 (tag/pid/tid/level) - LogcatColumns 배열 값으로 바로 묶음
+- regex   : 정규식 캡처 그룹 (그룹이 없으면 일치한 문자열 전체)
+- template: 메시지 템플릿 - tag + 숫자/hex/UUID를 자리표시자로 바꾼 메시지
+"""
+import re
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from andyfinder.logcat import LEVEL_ORDER, LogcatColumns
+from andyfinder.models import GroupSummary, SearchResult
+
+GROUP_KEY_TYPES = ('field', 'regex', 'template')
+GROUP_FIELDS = ('tag', 'pid', 'tid', 'level')
+
+_TEMPLATE_RE = re.compile(
+    r'(?P<uuid>\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b)'
+    r'|(?P<hex>\b0x[0-9a-f]+\b|\b(?=[0-9a-f]*[a-f])(?=[0-9a-f]*\d)[0-9a-f]{8,}\b)'
+    r'|(?P<num>\d+)',
+    re.IGNORECASE
+)
+
+_LEVEL_NAMES = {value: name for name, value in LEVEL_ORDER.items() if name != 'A'}
+
+_STOP_CHECK_INTERVAL = 50000
+
+
+def message_template(text: str) -> str:
+    """숫자/hex/UUID를 <num>/<hex>/<uuid>로 바꾼 메시지 템플릿"""
+    return _TEMPLATE_RE.sub(lambda m: '<' + m.lastgroup + '>', text)
+
+
+def needs_columns(key_type: str) -> bool:
+    """LogcatColumns가 필요한 그룹 키인지"""
+    return key_type in ('field', 'template')
+
+
+def _key_function(key_type: str, key_arg: str, results: List[SearchResult], lines: Sequence[str],
+                  columns: Optional[LogcatColumns]) -> Callable[[int], Optional[object]]:
+    """결과 인덱스 -> 그룹 키 (None이면 그룹에서 제외)"""
+    if key_type == 'field':
+        if key_arg not in GROUP_FIELDS:
+            raise ValueError(f"알 수 없는 필드: {key_arg}")
+        levels = columns.levels
+        # 정수 배열 값으로 묶고 라벨 변환은 그룹 수만큼만 수행
+        values = {'tag': columns.tag_ids, 'pid': columns.pids,
+                  'tid': columns.tids, 'level': columns.levels}[key_arg]
+        return lambda i: values[i] if levels[i] >= 0 else None
+
+    if key_type == 'regex':
+        try:
+            rx = re.compile(key_arg, re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f"정규식 오류: {e}")
+        search = rx.search
+        group = 1 if rx.groups else 0
+
+        def regex_key(i):
+            m = search(lines[results[i].line])
+            return m.group(group) if m else None
+        return regex_key
+
+    if key_type == 'template':
+        levels, tag_ids, offsets, tags = columns.levels, columns.tag_ids, columns.msg_offsets, columns.tags
+
+        def template_key(i):
+            line = lines[results[i].line]
+            if levels[i] < 0:
+                return message_template(line)
+            return f"{tags[tag_ids[i]]}: {message_template(line[offsets[i]:])}"
+        return template_key
+
+    raise ValueError(f"알 수 없는 그룹 키: {key_type}")
+
+
+def _key_label(key_type: str, key_arg: str, key, columns: Optional[LogcatColumns]) -> str:
+    if key_type == 'field':
+        if key_arg == 'tag':
+            return columns.tags[key]
+        if key_arg == 'level':
+            return _LEVEL_NAMES.get(key, str(key))
+        return str(key)
+    return str(key) if key is not None else ""
+
+
+def group_results(results: List[SearchResult], rows: Sequence[int], lines: Sequence[str], key_type: str,
+                  key_arg: str = "", columns: Optional[LogcatColumns] = None,
+                  should_stop: Optional[Callable[[], bool]] = None,
+                  progress: Optional[Callable[[int], None]] = None) -> Optional[Tuple[List[GroupSummary], int]]:
+    """rows(오름차순 결과 인덱스)를 그룹 키별로 한 번에 묶음
+
+    반환: (개수 내림차순 GroupSummary 리스트, 키가 없어 제외된 결과 수), 중지되면 None
+    결과 리스트는 라인 순서이므로 그룹의 처음/마지막 라인은 첫/마지막 row의 라인.
+    """
+    key_of = _key_function(key_type, key_arg, results, lines, columns)
+    groups: Dict[object, List[int]] = {}
+    unmatched = 0
+    total = len(rows)
+
+    for start in range(0, total, _STOP_CHECK_INTERVAL):
+        if should_stop and should_stop():
+            return None
+        for i in rows[start:start + _STOP_CHECK_INTERVAL]:
+            key = key_of(i)
+            if key is None:
+                unmatched += 1
+                continue
+            members = groups.get(key)
+            if members is None:
+                groups[key] = [i]
+            else:
+                members.append(i)
+        if progress:
+            progress(int((start / max(1, total)) * 100))
+
+    summaries = [
+        GroupSummary(
+            key=_key_label(key_type, key_arg, key, columns),
+            rows=members,
+            first_line=results[members[0]].line,
+            last_line=results[members[-1]].line,
+        )
+        for key, members in groups.items()
+    ]
+    summaries.sort(key=lambda g: (-g.count, g.first_line))
+    return summaries, unmatched
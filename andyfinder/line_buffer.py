@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+메모리 매핑 라인 버퍼 - Qt 비의존
+
+대용량 파일을 문자열로 읽지 않고 mmap으로 열어, 화면에 필요한 라인만 그때그때 디코딩한다.
+라인 인덱스는 라인별 오프셋이 아니라 CHUNK_SIZE 바이트 구간마다 '그 앞까지의 줄바꿈 수'만 저장
+(2GB 파일 기준 약 3만 개 정수) → 파일 크기와 거의 무관한 메모리로 임의 라인에 접근한다.
+라인 L을 찾을 때는 bisect로 구간을 고르고 그 구간 안에서만 줄바꿈을 센다.
+"""
+import mmap
+import os
+from array import array
+from bisect import bisect_left
+from typing import Callable, List, Optional
+
+# 줄바꿈이 1바이트 b'\n'이 아닌 인코딩은 지원하지 않음
+UNSUPPORTED_ENCODING_PREFIXES = ('utf-16', 'utf_16', 'utf-32', 'utf_32')
+
+
+def is_supported_encoding(encoding: str) -> bool:
+    return not (encoding or '').lower().startswith(UNSUPPORTED_ENCODING_PREFIXES)
+
+
+class MappedLineBuffer:
+    """
+    읽기 전용 mmap 라인 버퍼
+
+    - build_index(): 구간별 줄바꿈 누적 수 계산 (워커 스레드에서 호출)
+    - line(i) / lines(first, count): 0-based 라인 디코딩 (끝의 '\\r' 제거, 디코딩 오류는 대체 문자)
+    - 마지막 조회 위치를 기억해 연속 라인 접근(스크롤)은 앞 라인에서 이어서 찾음
+    """
+    CHUNK_SIZE = 64 * 1024
+
+    def __init__(self, path: str, encoding: str = 'utf-8'):
+        if not is_supported_encoding(encoding):
+            raise ValueError(f"지원하지 않는 인코딩: {encoding}")
+        self.path = path
+        self.encoding = encoding
+        self.size = os.path.getsize(path)
+        self._file = open(path, 'rb')
+        # 빈 파일은 mmap할 수 없으므로 빈 bytes로 대체
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b''
+        self._chunk_lines = array('q', [0])  # i번째 구간 시작 전까지의 줄바꿈 수
+        self.line_count = 1
+        self._last = (0, 0)  # (라인, 시작 바이트) 최근 조회
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._data = b''
+        self._file.close()
+
+    def index_memory(self) -> int:
+        """라인 인덱스가 차지하는 바이트 수"""
+        return self._chunk_lines.itemsize * len(self._chunk_lines)
+
+    def build_index(self, should_stop: Optional[Callable[[], bool]] = None,
+                    progress: Optional[Callable[[int], None]] = None) -> bool:
+        """구간별 줄바꿈 누적 수 계산 - 중지되면 False"""
+        data = self._data
+        size = self.size
+        step = self.CHUNK_SIZE
+        counts = array('q', [0])
+        total = 0
+        report_every = max(1, (size // step) // 100)
+        for i, start in enumerate(range(0, size, step)):
+            # mmap에는 count가 없으므로 구간을 잘라서 셈 (구간 크기만큼의 임시 bytes)
+            total += data[start:start + step].count(b'\n')
+            counts.append(total)
+            if not i % report_every:
+                if should_stop and should_stop():
+                    return False
+                if progress:
+                    progress(int(start * 100 / max(1, size)))
+        self._chunk_lines = counts
+        self.line_count = total + 1
+        self._last = (0, 0)
+        return True
+
+    def line_start(self, line: int) -> int:
+        """0-based 라인의 시작 바이트 오프셋"""
+        if line <= 0:
+            return 0
+        data = self._data
+        last_line, last_pos = self._last
+        if last_line <= line and line - last_line < 256:
+            # 최근 조회 라인에서 이어서 찾기 (스크롤/연속 라인)
+            pos, remaining = last_pos, line - last_line
+        else:
+            # line번째 줄바꿈이 들어 있는 구간 (counts[i] < line <= counts[i + 1])
+            i = bisect_left(self._chunk_lines, line) - 1
+            pos, remaining = i * self.CHUNK_SIZE, line - self._chunk_lines[i]
+        find = data.find
+        while remaining:
+            pos = find(b'\n', pos) + 1
+            remaining -= 1
+        self._last = (line, pos)
+        return pos
+
+    def _decode(self, raw: bytes) -> str:
+        text = raw.decode(self.encoding, errors='replace')
+        return text[:-1] if text.endswith('\r') else text
+
+    def line(self, line: int) -> str:
+        return self.lines(line, 1)[0] if 0 <= line < self.line_count else ""
+
+    def lines(self, first: int, count: int, max_bytes: int = 0) -> List[str]:
+        """first부터 최대 count개 라인 (max_bytes > 0이면 라인마다 앞쪽 max_bytes만 디코딩 - 화면 표시용)"""
+        first = max(0, first)
+        count = min(count, self.line_count - first)
+        if count <= 0:
+            return []
+        data = self._data
+        pos = self.line_start(first)
+        out = []
+        for _ in range(count):
+            end = data.find(b'\n', pos)
+            if end < 0:
+                end = self.size
+            stop = min(end, pos + max_bytes) if max_bytes > 0 else end
+            out.append(self._decode(data[pos:stop]))
+            pos = end + 1
+        return out
+
+    def text_between(self, start_line: int, start_col: int, end_line: int, end_col: int) -> str:
+        """(라인, 문자 위치) 두 지점 사이 텍스트 (복사용)"""
+        lines = self.lines(start_line, end_line - start_line + 1)
+        if not lines:
+            return ""
+        if len(lines) == 1:
+            return lines[0][start_col:end_col]
+        lines[0] = lines[0][start_col:]
+        lines[-1] = lines[-1][:end_col]
+        return '\n'.join(lines)
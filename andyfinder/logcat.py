@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+"""logcat(threadtime) 라인 파서 - Qt 비의존
+
+dumpstate의 logcat 섹션 라인 형식:
+    [YYYY-]MM-DD HH:MM:SS.mmm  PID  TID L TAG: message
+
+결과 수십만 건을 반복해서 파싱하므로 정규식 대신 str.split/partition으로 자른다.
+"""
+from array import array
+from typing import Dict, Iterable, List, Optional
+
+# 필드 이름 (필터/그룹 키로 사용)
+LOGCAT_FIELDS = ('date', 'time', 'pid', 'tid', 'level', 'tag', 'msg')
+NUMERIC_FIELDS = ('pid', 'tid')
+
+# 로그 레벨 순서 (A(assert)는 F와 같은 최고 레벨로 취급)
+LEVEL_ORDER = {'V': 0, 'D': 1, 'I': 2, 'W': 3, 'E': 4, 'F': 5, 'A': 5}
+
+
+def parse_logcat_line(line: str) -> Optional[Dict[str, str]]:
+    """logcat 라인이면 필드 dict, 아니면 None"""
+    parts = line.split(None, 5)
+    if len(parts) < 6:
+        return None
+    date, time_, pid, tid, level, rest = parts
+    if level not in LEVEL_ORDER or not pid.isdigit() or not tid.isdigit() or time_[2:3] != ':':
+        return None
+    tag, sep, msg = rest.partition(':')
+    if not sep:
+        return None
+    return {
+        'date': date,
+        'time': time_,
+        'pid': pid,
+        'tid': tid,
+        'level': level,
+        'tag': tag.strip(),
+        'msg': msg[1:] if msg.startswith(' ') else msg,
+    }
+
+
+class LogcatColumns:
+    """검색 결과 row별 logcat 필드 컬럼 인덱스
+
+    결과 row마다 dict를 만들지 않고 배열로 보관해서 필터/그룹핑이 배열 비교만으로 끝나도록 한다.
+    - levels : LEVEL_ORDER 값, logcat 형식이 아니면 -1
+    - pids/tids : 숫자
+    - tag_ids : tags 리스트 인덱스 (같은 tag는 같은 id) -> tag 조건은 고유 tag에 대해서만 평가
+    - msg_offsets : 라인 내 message 시작 위치 (msg = line[offset:])
+    """
+    __slots__ = ('levels', 'pids', 'tids', 'tag_ids', 'tags', 'msg_offsets')
+
+    def __init__(self):
+        self.levels = array('b')
+        self.pids = array('l')
+        self.tids = array('l')
+        self.tag_ids = array('l')
+        self.tags: List[str] = []
+        self.msg_offsets = array('l')
+
+    def __len__(self) -> int:
+        return len(self.levels)
+
+    @classmethod
+    def build(cls, lines: Iterable[str]) -> 'LogcatColumns':
+        """결과 row 순서대로의 라인들로 컬럼 생성"""
+        columns = cls()
+        levels, pids, tids = columns.levels, columns.pids, columns.tids
+        tag_ids, msg_offsets = columns.tag_ids, columns.msg_offsets
+        tag_index: Dict[str, int] = {}
+
+        for line in lines:
+            parts = line.split(None, 5)
+            if len(parts) == 6 and parts[4] in LEVEL_ORDER and parts[2].isdigit() \
+                    and parts[3].isdigit() and parts[1][2:3] == ':':
+                tag, sep, msg = parts[5].partition(':')
+                if sep:
+                    levels.append(LEVEL_ORDER[parts[4]])
+                    pids.append(int(parts[2]))
+                    tids.append(int(parts[3]))
+                    tag = tag.strip()
+                    tag_id = tag_index.get(tag)
+                    if tag_id is None:
+                        tag_id = tag_index[tag] = len(tag_index)
+                    tag_ids.append(tag_id)
+                    msg_offsets.append(len(line) - len(msg) + (1 if msg.startswith(' ') else 0))
+                    continue
+            levels.append(-1)
+            pids.append(0)
+            tids.append(0)
+            tag_ids.append(-1)
+            msg_offsets.append(len(line))
+
+        columns.tags = list(tag_index)
+        return columns
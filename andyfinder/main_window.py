@@ -5,7 +5,7 @@ import os
 import json
 import subprocess
 from datetime import datetime
-from typing import Optional
+from typing import Dict, Optional
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
@@ -16,16 +16,18 @@ from andyfinder.constants import (
     g_pgm_name,
     g_win_size_w,
     g_win_size_h,
-    g_icon_name
+    g_icon_name,
+    STALL_THRESHOLD_MS
 )
+from andyfinder.watchdog import StallWatchdog
 from andyfinder.widgets.tab_bar import CustomTabBar
-from andyfinder.dialogs.config_dialogs import ConfigSaveDialog, ConfigLoadDialog
 
 
-# TabContent는 아직 분리되지 않았으므로 임시로 TYPE_CHECKING 사용
-# TODO: TabContent를 별도 모듈로 분리 후 실제 import로 변경
+# 순환 참조 방지를 위해 TabContent는 TYPE_CHECKING에서만 import
 if False:  # TYPE_CHECKING과 유사하게 사용
-    from AndyFinderTab import TabContent
+    from andyfinder.tab_content import TabContent
+    from andyfinder.dialogs.stall_dialog import StallDialog
+    from andyfinder.dialogs.memory_dialog import MemoryDialog
 
 
 class MainWindow(QtWidgets.QMainWindow):
@@ -49,6 +51,16 @@ class MainWindow(QtWidgets.QMainWindow):
         self._previous_window_state = Qt.WindowNoState
         self._previous_geometry = None
 
+        # 아직 생성되지 않은 탭에 적용할 설정 (탭 index -> config)
+        self._pending_tab_configs: Dict[int, dict] = {}
+        # 시작 후 다시 열 이전 세션 (탭 index -> session)
+        self._pending_sessions: Dict[int, dict] = {}
+
+        # GUI 스레드 멈춤 감시 (도움말 > GUI 멈춤 기록)
+        self.stall_watchdog = StallWatchdog(STALL_THRESHOLD_MS, self)
+        self.stall_dialog: Optional['StallDialog'] = None
+        self.memory_dialog: Optional['MemoryDialog'] = None
+
         self._create_menus()
         self._build_main_ui()
 
@@ -69,11 +81,22 @@ class MainWindow(QtWidgets.QMainWindow):
         open_action.triggered.connect(self.open_file)
         file_menu.addAction(open_action)
 
+        large_view_action = QtGui.QAction('대용량 파일 보기(읽기 전용)(&R)...', self)
+        large_view_action.setShortcut('Ctrl+Alt+O')
+        large_view_action.setStatusTip('파일을 문서로 만들지 않고 보이는 라인만 읽어 표시합니다')
+        large_view_action.triggered.connect(self.open_large_file_viewer)
+        file_menu.addAction(large_view_action)
+
         save_action = QtGui.QAction('저장(&S)', self)
         save_action.setShortcut('Ctrl+S')
         save_action.triggered.connect(self.save_file)
         file_menu.addAction(save_action)
 
+        export_action = QtGui.QAction('검색결과 내보내기(&E)...', self)
+        export_action.setShortcut('Ctrl+E')
+        export_action.triggered.connect(lambda: self._delegate_to_tab('show_export_dialog'))
+        file_menu.addAction(export_action)
+
         file_menu.addSeparator()
 
         # 설정 저장/불러오기
@@ -117,9 +140,58 @@ class MainWindow(QtWidgets.QMainWindow):
         open_folder_action.triggered.connect(self.open_loaded_file_folder)
         tools_menu.addAction(open_folder_action)
 
+        triage_action = QtGui.QAction('즐겨찾기 일괄 실행(&B)', self)
+        triage_action.setShortcut('Ctrl+Shift+F5')
+        triage_action.triggered.connect(self.show_favorite_triage)
+        tools_menu.addAction(triage_action)
+
+        group_action = QtGui.QAction('검색결과 그룹 집계(&G)', self)
+        group_action.setShortcut('Ctrl+Shift+G')
+        group_action.triggered.connect(lambda: self._delegate_to_tab('show_group_by'))
+        tools_menu.addAction(group_action)
+
+        timing_action = QtGui.QAction('타이밍 패널(&P)', self)
+        timing_action.setShortcut('Ctrl+Shift+T')
+        timing_action.setStatusTip('현재 탭의 단계별 처리 시간을 보고 Chrome trace로 내보냅니다')
+        timing_action.triggered.connect(lambda: self._delegate_to_tab('show_timing_panel'))
+        tools_menu.addAction(timing_action)
+
+        memory_action = QtGui.QAction('메모리 사용량(&Y)...', self)
+        memory_action.setStatusTip('탭별 메모리 사용량을 항목별로 추정하고 캐시를 비웁니다')
+        memory_action.triggered.connect(self.show_memory_panel)
+        tools_menu.addAction(memory_action)
+
+        # 검색결과 일괄 마킹
+        mark_menu = tools_menu.addMenu('검색결과 마킹(&M)')
+
+        mark_matching_action = QtGui.QAction('결과내 검색어와 일치하는 항목 모두 마킹', self)
+        mark_matching_action.setShortcut('Ctrl+Shift+M')
+        mark_matching_action.triggered.connect(lambda: self._delegate_to_tab('mark_results_matching'))
+        mark_menu.addAction(mark_matching_action)
+
+        invert_marks_action = QtGui.QAction('마킹 반전', self)
+        invert_marks_action.setShortcut('Ctrl+Shift+I')
+        invert_marks_action.triggered.connect(lambda: self._delegate_to_tab('invert_result_marks'))
+        mark_menu.addAction(invert_marks_action)
+
+        clear_marks_action = QtGui.QAction('마킹 모두 해제', self)
+        clear_marks_action.triggered.connect(lambda: self._delegate_to_tab('clear_result_marks'))
+        mark_menu.addAction(clear_marks_action)
+
+        marks_to_bm_action = QtGui.QAction('마킹 → 북마크', self)
+        marks_to_bm_action.setShortcut('Ctrl+Shift+B')
+        marks_to_bm_action.triggered.connect(lambda: self._delegate_to_tab('marks_to_bookmarks'))
+        mark_menu.addAction(marks_to_bm_action)
+
         # 도움말 메뉴
         help_menu = menubar.addMenu('도움말(&H)')
 
+        stall_action = QtGui.QAction('GUI 멈춤 기록(&S)...', self)
+        stall_action.setStatusTip(f'{STALL_THRESHOLD_MS} ms 이상 화면이 멈췄던 기록과 당시 스택을 봅니다')
+        stall_action.triggered.connect(self.show_stall_log)
+        help_menu.addAction(stall_action)
+        help_menu.addSeparator()
+
         about_action = QtGui.QAction('정보(&A)', self)
         about_action.triggered.connect(self.show_about)
         help_menu.addAction(about_action)
@@ -155,6 +227,18 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as e:
             QtWidgets.QMessageBox.critical(self, "오류", f"폴더 열기 실패: {e}")
 
+    def _delegate_to_tab(self, method_name: str):
+        """현재 활성 탭의 메서드 호출"""
+        tab = self.get_current_tab()
+        if tab and hasattr(tab, method_name):
+            getattr(tab, method_name)()
+
+    def show_favorite_triage(self):
+        """현재 활성 탭에서 즐겨찾기 일괄 실행"""
+        tab = self.get_current_tab()
+        if tab:
+            tab.show_favorite_triage()
+
     def show_about(self):
         QtWidgets.QMessageBox.about(
             self,
@@ -163,6 +247,24 @@ class MainWindow(QtWidgets.QMainWindow):
             "(dumpstate) This tool can find and analyse a (dumpstate)file."
         )
 
+    def show_memory_panel(self):
+        """탭별 메모리 사용량 다이얼로그 표시"""
+        if self.memory_dialog is None:
+            from andyfinder.dialogs.memory_dialog import MemoryDialog
+            self.memory_dialog = MemoryDialog(self, self)
+        self.memory_dialog.show()
+        self.memory_dialog.raise_()
+        self.memory_dialog.activateWindow()
+
+    def show_stall_log(self):
+        """GUI 멈춤 기록 다이얼로그 표시"""
+        if self.stall_dialog is None:
+            from andyfinder.dialogs.stall_dialog import StallDialog
+            self.stall_dialog = StallDialog(self.stall_watchdog, self)
+        self.stall_dialog.show()
+        self.stall_dialog.raise_()
+        self.stall_dialog.activateWindow()
+
     def _build_main_ui(self):
         """UI 구성"""
         # ===== 추가: Menu와 tab 사이에 1px 검은색 위젯 =====
@@ -176,13 +278,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self.tab_widget.setTabsClosable(False)
         self.tab_widget.setMovable(False)
 
-        # 초기 탭 생성 (3개)
-        # NOTE: TabContent import는 실제 사용 시점에 필요
-        # 현재는 AndyFinderTab.py에서 직접 import 필요
-        from AndyFinderTab import TabContent
+        # 초기 탭 (3개): 빈 자리만 만들고 TabContent는 처음 활성화될 때 생성 (ensure_tab)
         for i in range(3):
-            tab_content = TabContent(i + 1, self)
-            self.tab_widget.addTab(tab_content, f"Tab#{i + 1}")
+            self.tab_widget.addTab(QtWidgets.QWidget(), f"Tab#{i + 1}")
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
+        self.ensure_tab(self.tab_widget.currentIndex())
 
         # ===== 변경: 중앙 위젯을 컨테이너로 구성 =====
         central_widget = QtWidgets.QWidget()
@@ -195,13 +295,37 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.setCentralWidget(central_widget)
 
+    def ensure_tab(self, index: int) -> Optional['TabContent']:
+        """index 탭의 TabContent 반환 (아직 없으면 생성해서 빈 자리와 교체, 보류된 설정 적용)"""
+        widget = self.tab_widget.widget(index)
+        if widget is None:
+            return None
+        # TabContent 타입 체크는 런타임에 수행
+        if hasattr(widget, 'tab_number'):
+            return widget
+
+        # NOTE: TabContent import는 실제 사용 시점에 필요 (시작 시간 단축)
+        from andyfinder.tab_content import TabContent
+        tab_content = TabContent(index + 1, self)
+        current = self.tab_widget.currentIndex()
+        title = self.tab_widget.tabText(index)
+        self.tab_widget.blockSignals(True)
+        try:
+            self.tab_widget.removeTab(index)
+            self.tab_widget.insertTab(index, tab_content, title)
+            self.tab_widget.setCurrentIndex(current)
+        finally:
+            self.tab_widget.blockSignals(False)
+        widget.deleteLater()
+
+        pending = self._pending_tab_configs.pop(index, None)
+        if pending is not None:
+            tab_content.apply_config(pending)
+        return tab_content
+
     def get_current_tab(self) -> Optional['TabContent']:
         """현재 활성 탭 반환"""
-        current = self.tab_widget.currentWidget()
-        # TabContent 타입 체크는 런타임에 수행
-        if current and hasattr(current, 'tab_number'):
-            return current
-        return None
+        return self.ensure_tab(self.tab_widget.currentIndex())
 
     def mark_tab_modified(self, tab: 'TabContent'):
         """탭 제목에 * 표시"""
@@ -234,6 +358,21 @@ class MainWindow(QtWidgets.QMainWindow):
         if tab:
             tab.open_file()
 
+    def open_large_file_viewer(self):
+        """대용량 파일 읽기 전용 뷰어 열기 (현재 탭의 Color 키워드 적용)"""
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, "파일 선택", "", "Log/Text Files (*.txt *.log *.*)")
+        if not path:
+            return
+        from andyfinder.dialogs.large_file_viewer import LargeFileViewerDialog
+        tab = self.get_current_tab()
+        dialog = LargeFileViewerDialog(
+            path,
+            tab.color_keywords if tab else (),
+            tab.color_palette if tab else (),
+            self,
+        )
+        dialog.show()
+
     def save_file(self):
         tab = self.get_current_tab()
         if tab:
@@ -246,6 +385,7 @@ class MainWindow(QtWidgets.QMainWindow):
             QtWidgets.QMessageBox.information(self, "안내", "활성 탭이 없습니다.")
             return
 
+        from andyfinder.dialogs.config_dialogs import ConfigSaveDialog
         dialog = ConfigSaveDialog(self)
         if dialog.exec() != QtWidgets.QDialog.Accepted:
             return
@@ -281,6 +421,7 @@ class MainWindow(QtWidgets.QMainWindow):
             return
 
         config_dir = "./config"
+        from andyfinder.dialogs.config_dialogs import ConfigLoadDialog
         dialog = ConfigLoadDialog(config_dir, self)
         if dialog.exec() != QtWidgets.QDialog.Accepted or not dialog.selected_file:
             return
@@ -328,13 +469,20 @@ class MainWindow(QtWidgets.QMainWindow):
     def build_latest_config(self) -> dict:
         """모든 탭의 설정 + 윈도우 상태 저장"""
         tabs_config = []
+        sessions = []
         for i in range(self.tab_widget.count()):
             tab = self.tab_widget.widget(i)
             if tab and hasattr(tab, 'get_config'):
                 tabs_config.append(tab.get_config())
+                sessions.append(tab.get_session())
+            else:
+                # 한 번도 열지 않은 탭은 불러온 설정을 그대로 유지
+                tabs_config.append(self._pending_tab_configs.get(i, {}))
+                sessions.append(self._pending_sessions.get(i))
 
         cfg = {
             'tabs': tabs_config,
+            'sessions': sessions,
             'current_tab': self.tab_widget.currentIndex(),
             'always_on_top': self.always_on_top_action.isChecked(),
             'window_geometry': {
@@ -357,6 +505,17 @@ class MainWindow(QtWidgets.QMainWindow):
                     tab = self.tab_widget.widget(i)
                     if tab and hasattr(tab, 'apply_config'):
                         tab.apply_config(tab_cfg)
+                    else:
+                        self._pending_tab_configs[i] = tab_cfg
+
+            # 이전 세션 파일은 창을 띄운 뒤 백그라운드로 다시 열기
+            sessions = cfg.get('sessions') or []
+            self._pending_sessions = {
+                i: session for i, session in enumerate(sessions)
+                if isinstance(session, dict) and i < self.tab_widget.count()
+            }
+            if self._pending_sessions:
+                QtCore.QTimer.singleShot(0, self.restore_sessions)
 
             # 현재 탭 설정
             current_tab = cfg.get('current_tab', 0)
@@ -385,8 +544,24 @@ class MainWindow(QtWidgets.QMainWindow):
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "경고", f"최신 설정 적용 중 일부 오류가 발생했습니다: {e}")
 
+    def restore_sessions(self):
+        """이전 세션의 파일들을 탭별로 다시 열기 (탭마다 FileLoader 스레드 → 동시에 로딩)"""
+        pending, self._pending_sessions = self._pending_sessions, {}
+        restored = 0
+        for index, session in sorted(pending.items()):
+            tab = self.ensure_tab(index)
+            if tab and tab.restore_session(session):
+                restored += 1
+        if restored:
+            self.statusBar().showMessage(f"이전 세션 복원 중: {restored}개 파일", 3000)
+
     def save_latest_config(self):
         """앱 종료 시 최신 설정 저장"""
+        # 진행 중인 검색결과 캐시 기록은 기다리지 않고 중지 (캐시가 없으면 복원 시 다시 검색)
+        for i in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(i)
+            if hasattr(tab, 'stop_result_cache'):
+                tab.stop_result_cache()
         try:
             cfg = self.build_latest_config()
             path = self.latest_config_file_path()
@@ -436,19 +611,35 @@ class MainWindow(QtWidgets.QMainWindow):
 
             if reply == QtWidgets.QMessageBox.Save:
                 # 모든 수정된 탭 저장
+                errors = []
                 for i in modified_tabs:
                     tab = self.tab_widget.widget(i - 1)
                     if tab and hasattr(tab, 'save_file'):
                         tab.save_file()
+                        # 백그라운드 저장이 끝난 뒤 종료
+                        error = tab.wait_save_finished()
+                        if error is not None:
+                            errors.append(f"Tab#{i}: {error}")
+                if errors:
+                    # 저장하지 못한 편집 내용을 잃지 않도록 종료 취소
+                    QtWidgets.QMessageBox.critical(
+                        self, "저장 실패",
+                        "다음 탭을 저장하지 못해 종료를 취소했습니다.\n" + "\n".join(errors)
+                    )
+                    event.ignore()
+                    return
                 self.save_latest_config()
+                self.stall_watchdog.stop()
                 event.accept()
             elif reply == QtWidgets.QMessageBox.Discard:
                 self.save_latest_config()
+                self.stall_watchdog.stop()
                 event.accept()
             else:
                 event.ignore()
         else:
             self.save_latest_config()
+            self.stall_watchdog.stop()
             event.accept()
 
     def toggle_fullscreen(self):
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+"""마킹/북마크용 정렬 인덱스 집합 - Qt 비의존"""
+from bisect import bisect_left, bisect_right, insort
+from itertools import count
+from typing import Iterable, Iterator, List
+
+# 모든 SortedIndexSet이 공유하는 변경 번호 (인스턴스가 바뀌어도 version이 겹치지 않음)
+_versions = count(1)
+
+
+class SortedIndexSet:
+    """
+    정렬 상태를 유지하는 정수 집합
+
+    - set과 같은 멤버십/추가/삭제 인터페이스 (in, add, remove, discard, clear, len)
+    - next_after/prev_before: bisect로 O(log n) 이웃 검색 (F2/Shift+F2)
+    - update/difference_update: 대량 변경은 한 번에 재정렬
+    - version: 내용이 바뀔 때마다 새 번호 (캐시 키용)
+    """
+    __slots__ = ('_set', '_items', 'version')
+
+    # 이 개수 이하일 때는 insort, 초과하면 전체 재정렬이 더 빠름
+    _INSORT_LIMIT = 64
+
+    def __init__(self, iterable: Iterable[int] = ()):
+        self._set = set(iterable)
+        self._items: List[int] = sorted(self._set)
+        self.version = next(_versions)
+
+    def __contains__(self, value) -> bool:
+        return value in self._set
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __bool__(self) -> bool:
+        return bool(self._items)
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._items)
+
+    def __repr__(self) -> str:
+        return f"SortedIndexSet({self._items!r})"
+
+    def add(self, value: int):
+        if value not in self._set:
+            self._set.add(value)
+            insort(self._items, value)
+            self.version = next(_versions)
+
+    def remove(self, value: int):
+        self._set.remove(value)
+        del self._items[bisect_left(self._items, value)]
+        self.version = next(_versions)
+
+    def discard(self, value: int):
+        if value in self._set:
+            self.remove(value)
+
+    def clear(self):
+        self._set.clear()
+        self._items.clear()
+        self.version = next(_versions)
+
+    def update(self, values: Iterable[int]):
+        new = set(values) - self._set
+        if not new:
+            return
+        self._set |= new
+        if len(new) <= self._INSORT_LIMIT:
+            for value in new:
+                insort(self._items, value)
+        else:
+            self._items = sorted(self._set)
+        self.version = next(_versions)
+
+    def difference_update(self, values: Iterable[int]):
+        gone = self._set.intersection(values)
+        if not gone:
+            return
+        self._set -= gone
+        if len(gone) <= self._INSORT_LIMIT:
+            for value in gone:
+                del self._items[bisect_left(self._items, value)]
+        else:
+            self._items = sorted(self._set)
+        self.version = next(_versions)
+
+    def as_set(self) -> set:
+        """집합 연산용 (읽기 전용으로 사용)"""
+        return self._set
+
+    def first(self) -> int:
+        return self._items[0] if self._items else -1
+
+    def last(self) -> int:
+        return self._items[-1] if self._items else -1
+
+    def next_after(self, value: int) -> int:
+        """value보다 큰 첫 번째 값, 없으면 -1"""
+        i = bisect_right(self._items, value)
+        return self._items[i] if i < len(self._items) else -1
+
+    def prev_before(self, value: int) -> int:
+        """value보다 작은 마지막 값, 없으면 -1"""
+        i = bisect_left(self._items, value)
+        return self._items[i - 1] if i > 0 else -1
@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+"""
+검색 매칭 함수 - Qt 비의존
+
+SearchWorker(GUI)와 명령줄 검색(cli)이 같은 규칙으로 라인을 매칭한다.
+매칭 함수는 라인 문자열을 받아 (start, end) 구간 리스트를 반환 (없으면 빈 리스트).
+"""
+import re
+from typing import Callable, List, Optional, Tuple
+
+Matcher = Callable[[str], List[Tuple[int, int]]]
+
+
+def build_matcher(query: str, mode: str, case_sensitive: bool) -> Optional[Matcher]:
+    """검색 모드에 따라 매칭 함수를 생성 (검색어가 비어 있으면 None, 정규식 오류는 ValueError)"""
+    text = query.strip()
+    if not text:
+        return None
+
+    flags = 0 if case_sensitive else re.IGNORECASE
+
+    if mode == 'regex':
+        try:
+            regex = re.compile(text, flags)
+        except re.error as e:
+            raise ValueError(f'정규식 오류: {e}')
+
+        def fn_regex(s, rx=regex):
+            return [(m.start(), m.end()) for m in rx.finditer(s)]
+
+        return fn_regex
+    else:
+        needle = text if case_sensitive else text.lower()
+
+        def fn_plain(s, n=needle, cs=case_sensitive):
+            hay = s if cs else s.lower()
+            spans = []
+            start = 0
+            ln = len(n)
+            if ln == 0:
+                return spans
+            while True:
+                pos = hay.find(n, start)
+                if pos == -1:
+                    break
+                spans.append((pos, pos + ln))
+                start = pos + ln if ln > 0 else pos + 1
+            return spans
+
+        return fn_plain
+
+
+# 에디터 내부 검색(F3/F4)에서 뒤쪽으로 한 번에 검색하는 문자 수 (라인 경계까지 확장)
+FIND_CHUNK = 1 << 20
+
+
+def is_line_local(regex: re.Pattern) -> bool:
+    """매칭이 항상 한 라인 안에 있고 라인 밖을 보지 않는 패턴인지 (보수적으로 판단)
+
+    줄바꿈을 포함할 수 있는 요소($, \\Z, \\s, \\n, [^...], 인라인 플래그/lookaround 등)가 있으면 False.
+    """
+    if regex.flags & (re.DOTALL | re.MULTILINE) or not isinstance(regex.pattern, str):
+        return False
+    src = regex.pattern
+    i = 0
+    while i < len(src):
+        c = src[i]
+        nxt = src[i + 1:i + 2]
+        if c == '\\':
+            if nxt.isalnum() and nxt not in 'dwbB':
+                return False
+            i += 2
+            continue
+        if c == '$' or ord(c) < 0x20 or (c == '[' and nxt == '^') or (c == '(' and nxt == '?'):
+            return False
+        i += 1
+    return True
+
+
+def find_next(regex: re.Pattern, text: str, pos: int, limit: int) -> Optional[re.Match]:
+    """pos 이후 limit 전에서 시작하는 첫 매칭 (텍스트 전체를 대상으로 검색, 첫 매칭에서 멈춤)"""
+    m = regex.search(text, pos)
+    return m if m is not None and m.start() < limit else None
+
+
+def find_prev(regex: re.Pattern, text: str, pos: int, floor: int = 0,
+              chunk: int = FIND_CHUNK) -> Optional[re.Match]:
+    """floor 이후 pos 앞에서 시작하는 마지막 매칭
+
+    한 라인 안에서만 매칭되는 패턴은 chunk(라인 경계로 확장) 단위로 뒤쪽부터 검색하고,
+    라인을 넘거나 끝에 고정될 수 있는 패턴은 잘라서 검색하면 결과가 달라지므로 floor부터 한 번에 검색한다.
+    """
+    if not is_line_local(regex):
+        last = None
+        for m in regex.finditer(text, floor):
+            if m.start() >= pos:
+                break
+            last = m
+        return last
+
+    hi = pos
+    while hi > floor:
+        lo = text.rfind('\n', floor, max(floor, hi - chunk))
+        lo = floor if lo < 0 else lo + 1
+        # pos가 속한 라인의 매칭이 잘리지 않도록 검색 범위 끝은 hi가 속한 라인 끝 (줄바꿈 포함)
+        line_end = text.find('\n', hi)
+        last = None
+        for m in regex.finditer(text, lo, len(text) if line_end < 0 else line_end + 1):
+            if m.start() >= hi:
+                break
+            last = m
+        if last is not None:
+            return last
+        hi = lo
+    return None
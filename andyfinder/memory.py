@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""
+프로세스 메모리 측정 / 추정 헬퍼 - Qt 비의존
+
+- process_rss(): psutil이 설치되어 있으면 사용하고, 없으면 /proc(Linux) 또는
+  GetProcessMemoryInfo(Windows)로 읽는다. 측정할 수 없으면 None.
+- estimate_size(): 컨테이너와 하위 원소의 대략적인 크기 (큰 컨테이너는 표본으로 추정)
+- tracemalloc 스냅샷 / 두 시점 비교
+"""
+import os
+import sys
+import tracemalloc
+from array import array
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import psutil
+except ImportError:  # 선택 의존성
+    psutil = None
+
+
+def process_rss() -> Optional[int]:
+    """현재 프로세스의 RSS(Working Set) 바이트 수"""
+    try:
+        if psutil is not None:
+            return psutil.Process().memory_info().rss
+        if sys.platform.startswith('linux'):
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+        if sys.platform == 'win32':
+            return _windows_working_set()
+    except Exception:
+        pass
+    return None
+
+
+def _windows_working_set() -> Optional[int]:
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ('cb', wintypes.DWORD),
+            ('PageFaultCount', wintypes.DWORD),
+            ('PeakWorkingSetSize', ctypes.c_size_t),
+            ('WorkingSetSize', ctypes.c_size_t),
+            ('QuotaPeakPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaPeakNonPagedPoolUsage', ctypes.c_size_t),
+            ('QuotaNonPagedPoolUsage', ctypes.c_size_t),
+            ('PagefileUsage', ctypes.c_size_t),
+            ('PeakPagefileUsage', ctypes.c_size_t),
+        ]
+
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if not ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.WorkingSetSize
+
+
+def format_bytes(size: int) -> str:
+    """바이트 수를 KB/MB 단위 문자열로"""
+    if abs(size) >= 1024 * 1024:
+        return f"{size / (1024 * 1024):,.1f} MB"
+    return f"{size / 1024:,.1f} KB"
+
+
+# ------------------------------ 크기 추정 ------------------------------
+
+ESTIMATE_SAMPLE = 2000  # 원소가 이보다 많은 컨테이너는 균등 표본으로 추정
+
+# QTextDocument 1 블록(라인)당 고정 비용 - 문자(UTF-16 2바이트) 외 블록/프래그먼트/레이아웃 데이터 (실측 근사)
+QT_BLOCK_OVERHEAD = 170
+QT_EXTRA_SELECTION_SIZE = 256  # QTextEdit.ExtraSelection 1개 (커서 + 포맷) 근사
+
+_LEAF_TYPES = (str, bytes, bytearray, array, int, float, complex, bool, type(None))
+
+
+def estimate_size(obj, seen: Optional[set] = None, sample: int = ESTIMATE_SAMPLE) -> int:
+    """obj와 하위 원소의 대략적인 바이트 수
+
+    - 같은 객체는 seen으로 1회만 계산 (여러 구조가 공유하는 문자열 등)
+    - list/tuple/set/dict/객체 __dict__/__slots__를 따라가며, 원소가 sample개를 넘으면 표본 평균으로 추정
+    """
+    if seen is None:
+        seen = set()
+    if obj is None or id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, _LEAF_TYPES) or hasattr(obj, 'nbytes'):
+        return size
+
+    if isinstance(obj, dict):
+        children = list(obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)) or type(obj).__name__ == 'deque':
+        children = obj if isinstance(obj, (list, tuple)) else list(obj)
+    elif hasattr(obj, '__dict__'):
+        children = [vars(obj)]
+    elif hasattr(obj, '__slots__'):
+        children = [getattr(obj, name, None) for name in obj.__slots__]
+    else:
+        return size
+
+    count = len(children)
+    if count > sample:
+        step = count / sample
+        picked = (children[int(i * step)] for i in range(sample))
+        return size + int(sum(estimate_size(c, seen, sample) for c in picked) * count / sample)
+    return size + sum(estimate_size(c, seen, sample) for c in children)
+
+
+def estimate_document_size(characters: int, blocks: int) -> int:
+    """QTextDocument 추정 크기 (UTF-16 문자 + 블록당 고정 비용)"""
+    return characters * 2 + blocks * QT_BLOCK_OVERHEAD
+
+
+def estimate_results_size(results: Sequence, lines: Optional[Sequence[str]] = None,
+                          sample: int = ESTIMATE_SAMPLE) -> Tuple[int, int, int]:
+    """검색결과(line/snippet/matches 속성) 추정 크기
+
+    반환: (결과 객체 + 매칭 구간, 별도로 잡고 있는 snippet 문자열, 라인 리스트와 공유하는 snippet 수)
+    snippet이 lines[r.line]과 같은 객체면 라인 리스트 쪽에서 이미 계산했으므로 제외한다.
+    """
+    count = len(results)
+    if not count:
+        return sys.getsizeof(results), 0, 0
+    step = max(1.0, count / sample)
+    picked = [results[int(i * step)] for i in range(min(count, sample))]
+    seen: set = set()
+    objects = snippets = shared = 0
+    for r in picked:
+        seen.add(id(r.snippet))  # snippet은 아래에서 따로 계산
+        objects += estimate_size(r, seen)
+        if lines is not None and r.line < len(lines) and lines[r.line] is r.snippet:
+            shared += 1
+        else:
+            snippets += sys.getsizeof(r.snippet)
+    scale = count / len(picked)
+    return sys.getsizeof(results) + int(objects * scale), int(snippets * scale), int(shared * scale)
+
+
+# ------------------------------ tracemalloc ------------------------------
+
+def take_tracemalloc_snapshot() -> tracemalloc.Snapshot:
+    """tracemalloc 스냅샷 (추적 중이 아니면 시작 - 시작 이후 할당만 기록됨)"""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+    snapshot = tracemalloc.take_snapshot()
+    return snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    ])
+
+
+def stop_tracemalloc():
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def format_snapshot_top(snapshot: tracemalloc.Snapshot, limit: int = 30) -> List[str]:
+    """할당 위치(파일:라인)별 상위 limit개"""
+    stats = snapshot.statistics('lineno')
+    total = sum(stat.size for stat in stats)
+    out = [f"추적 중인 할당 합계: {format_bytes(total)} ({len(stats):,}개 위치)"]
+    for stat in stats[:limit]:
+        frame = stat.traceback[0]
+        out.append(f"{format_bytes(stat.size):>12}  {stat.count:>9,}개  {frame.filename}:{frame.lineno}")
+    return out
+
+
+def format_snapshot_diff(old: tracemalloc.Snapshot, new: tracemalloc.Snapshot, limit: int = 30) -> List[str]:
+    """두 스냅샷 사이 할당 위치별 증감 상위 limit개"""
+    stats = new.compare_to(old, 'lineno')
+    total = sum(stat.size_diff for stat in stats)
+    out = [f"증감 합계: {'+' if total >= 0 else ''}{format_bytes(total)}"]
+    for stat in stats[:limit]:
+        if not stat.size_diff:
+            continue
+        frame = stat.traceback[0]
+        sign = '+' if stat.size_diff >= 0 else ''
+        out.append(f"{sign + format_bytes(stat.size_diff):>13}  {stat.count_diff:>+9,}개  "
+                   f"{frame.filename}:{frame.lineno}")
+    return out
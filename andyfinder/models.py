@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 """데이터 모델"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Tuple
 
 
@@ -11,3 +11,38 @@ class SearchResult:
     line: int
     snippet: str
     matches: List[Tuple[int, int]]  # (start, end) in snippet string
+
+
+@dataclass
+class TriageSummary:
+    """즐겨찾기 일괄 실행(Triage) 결과 - 즐겨찾기 1개당 1개"""
+    name: str
+    pattern: str
+    lines: List[int] = field(default_factory=list)  # 매칭된 0-based 라인 번호
+    sample: str = ""
+    error: str = ""
+
+    @property
+    def hit_count(self) -> int:
+        return len(self.lines)
+
+    @property
+    def first_line(self) -> int:
+        return self.lines[0] if self.lines else -1
+
+    @property
+    def last_line(self) -> int:
+        return self.lines[-1] if self.lines else -1
+
+
+@dataclass
+class GroupSummary:
+    """검색결과 그룹 집계 결과 - 그룹 키 1개당 1개"""
+    key: str
+    rows: List[int] = field(default_factory=list)  # 결과 인덱스 (오름차순)
+    first_line: int = -1  # 0-based
+    last_line: int = -1
+
+    @property
+    def count(self) -> int:
+        return len(self.rows)
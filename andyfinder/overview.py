@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""오버뷰 룰러용 라인 분포 계산 - Qt 비의존
+
+라인 소스(검색결과/Color 키워드/마킹/북마크)는 모두 0-based 라인 번호의 오름차순 배열로 만들고,
+룰러 높이(픽셀) 만큼의 구간(bucket)별 개수를 bisect로 센다 (라인 수가 아니라 bucket 수에 비례).
+job 함수들은 GUI 스레드에서 필요한 데이터를 잡아 두고 워커 스레드에서 실행된다.
+"""
+import re
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, List, Optional, Sequence
+
+from andyfinder.matcher import is_line_local
+from andyfinder.models import SearchResult
+from andyfinder.snapshot import TextSnapshot
+
+OVERVIEW_CATEGORIES = ('results', 'keywords', 'marks', 'bookmarks')
+
+# job(should_stop) -> 오름차순 라인 배열, 중지되면 None
+LinesJob = Callable[[Callable[[], bool]], Optional[Sequence[int]]]
+
+# 키워드 검색 창 크기 (문자 수, 라인 끝까지 확장) - 창마다 중지 여부 확인
+_KEYWORD_WINDOW = 1 << 20
+
+
+def line_histogram(lines: Sequence[int], line_count: int, buckets: int) -> array:
+    """오름차순 라인 배열 -> bucket별 개수 (라인 L은 bucket L * buckets // line_count)"""
+    hist = array('I', bytes(4 * max(0, buckets)))
+    if not lines or line_count <= 0 or buckets <= 0:
+        return hist
+    prev = 0
+    for b in range(buckets):
+        # bucket b의 끝(미포함) 라인 = ceil((b + 1) * line_count / buckets)
+        end = bisect_left(lines, -(-(b + 1) * line_count // buckets), prev)
+        hist[b] = end - prev
+        prev = end
+    return hist
+
+
+def result_lines_job(results: List[SearchResult]) -> LinesJob:
+    """검색결과 라인 (결과 리스트는 라인 순서)"""
+    def job(should_stop):
+        return array('q', (r.line for r in results))
+    return job
+
+
+def row_lines_job(results: List[SearchResult], rows: Iterable[int]) -> LinesJob:
+    """결과 row(오름차순) -> 라인, rows는 호출 시점에 복사"""
+    rows = list(rows)
+
+    def job(should_stop):
+        return array('q', (results[i].line for i in rows if i < len(results)))
+    return job
+
+
+def bookmark_lines_job(bookmarks: Iterable[int]) -> LinesJob:
+    """1-based 북마크(오름차순) -> 0-based 라인, 호출 시점에 복사"""
+    lines = array('q', (n - 1 for n in bookmarks))
+
+    def job(should_stop):
+        return lines
+    return job
+
+
+def keyword_lines_job(snapshot: TextSnapshot, pattern: re.Pattern) -> LinesJob:
+    """키워드 정규식이 있는 라인 - 한 라인에서 찾으면 다음 라인 시작부터 다시 검색
+
+    한 라인 안에서만 매칭되는 패턴(Color 키워드는 re.escape 결과)은 _KEYWORD_WINDOW 단위로 잘라 검색해
+    드문 키워드라도 search 1회가 문서 전체를 훑지 않도록 하고, 창마다 중지 여부를 확인한다.
+    """
+    windowed = is_line_local(pattern)
+
+    def job(should_stop):
+        text = snapshot.text
+        size = len(text)
+        starts = snapshot.line_starts
+        last = len(starts) - 1
+        search = pattern.search
+        out = array('q')
+        pos = 0
+        while pos < size:
+            if should_stop():
+                return None
+            end = size
+            if windowed:
+                end = text.find('\n', min(pos + _KEYWORD_WINDOW, size))
+                end = size if end < 0 else end + 1
+            m = search(text, pos, end)
+            if m is None:
+                pos = end
+                continue
+            line = bisect_right(starts, m.start()) - 1
+            out.append(line)
+            if line >= last:
+                break
+            pos = starts[line + 1]
+        return out
+    return job
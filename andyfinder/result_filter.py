@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""검색 결과 필터 조건 - Qt 비의존
+
+모드
+- text : 대소문자 무시 부분 문자열 (표시되는 snippet 기준)
+- regex: 대소문자 무시 정규식 search (snippet 기준)
+- field: 공백으로 구분한 조건들의 AND (결과 라인 자체를 logcat 필드로 파싱)
+    line>=1000  pid=1234  level>=W  tag=ActivityManager  msg~"am_.*proc"  crash
+    - 연산자: = != ~(정규식) > >= < <=  (크기 비교는 line/pid/tid/level만)
+    - 연산자가 없는 단어는 결과 라인 전체에 대한 부분 문자열
+    - line 이외의 필드 조건은 logcat 형식 라인에만 일치
+
+컴파일 결과는 row 단위 predicate가 아니라 (results, candidates, lines, columns) -> 통과 row 리스트인
+일괄 필터로, 조건별로 리스트 컴프리헨션을 한 번씩 돌려 row당 함수 호출 비용을 줄인다.
+field 모드는 결과 세트마다 한 번 만든 LogcatColumns(필드 컬럼 배열)를 사용한다.
+"""
+import operator
+import re
+import shlex
+from typing import Callable, List, Optional, Sequence
+
+from andyfinder.logcat import LEVEL_ORDER, LOGCAT_FIELDS, NUMERIC_FIELDS, LogcatColumns
+from andyfinder.models import SearchResult
+
+FILTER_MODES = ('text', 'regex', 'field')
+
+# (결과 리스트, 후보 row 인덱스(오름차순), 스냅샷 라인 리스트, LogcatColumns) -> 통과한 row 인덱스 리스트
+RowsFilter = Callable[[List[SearchResult], Sequence[int], Sequence[str], Optional[LogcatColumns]], List[int]]
+
+_TERM_RE = re.compile(r'^(?P<key>[A-Za-z_]+)(?P<op>!=|>=|<=|=|~|>|<)(?P<value>.*)$')
+_CMP_OPS = {'=': operator.eq, '!=': operator.ne,
+            '>': operator.gt, '>=': operator.ge, '<': operator.lt, '<=': operator.le}
+
+
+def is_incremental_extension(mode: str, previous: str, query: str) -> bool:
+    """query가 previous의 결과 안에서만 다시 걸러도 되는 확장인지
+
+    text 모드는 필터어를 뒤로 늘리면 결과가 항상 부분집합이 된다.
+    regex/field는 늘려도 부분집합이 보장되지 않으므로(a| , line>=1 -> line>=10) 전체를 다시 본다.
+    """
+    return mode == 'text' and bool(previous) and query.lower().startswith(previous.lower())
+
+
+def _compile_field_term(key: str, op: str, value: str):
+    """필드 조건 1개 -> (평가 순서, rows 필터 함수(rows, results, lines, columns) -> rows)
+
+    line/level/pid/tid/tag는 컬럼 배열 비교(또는 고유 tag 집합 조회)만으로 끝나므로 먼저,
+    date/time/msg는 라인 문자열을 잘라야 하므로 마지막에 평가한다.
+    """
+    if op == '~':
+        if key in NUMERIC_FIELDS or key in ('line', 'level'):
+            raise ValueError(f"{key}: '~' 연산자는 사용할 수 없습니다")
+        try:
+            search = re.compile(value, re.IGNORECASE).search
+        except re.error as e:
+            raise ValueError(f"{key}: 정규식 오류 - {e}")
+        text_check = lambda text: search(text) is not None
+    elif key in NUMERIC_FIELDS or key == 'line':
+        try:
+            target = int(value)
+        except ValueError:
+            raise ValueError(f"{key}: 숫자가 필요합니다 ({value!r})")
+    elif key == 'level':
+        if value.upper() not in LEVEL_ORDER:
+            raise ValueError(f"level: V/D/I/W/E/F 중 하나가 필요합니다 ({value!r})")
+        target = LEVEL_ORDER[value.upper()]
+    elif op in ('=', '!='):
+        target = value.lower()
+        text_check = (lambda text: text.lower() == target) if op == '=' else (lambda text: text.lower() != target)
+    else:
+        raise ValueError(f"{key}: 크기 비교는 line/pid/tid/level만 가능합니다")
+
+    cmp = _CMP_OPS.get(op)
+
+    if key == 'line':
+        return 0, lambda rows, results, lines, cols: [i for i in rows if cmp(results[i].line + 1, target)]
+
+    if key == 'level':
+        def level_filter(rows, results, lines, cols):
+            levels = cols.levels
+            return [i for i in rows if levels[i] >= 0 and cmp(levels[i], target)]
+        return 1, level_filter
+
+    if key in NUMERIC_FIELDS:
+        def number_filter(rows, results, lines, cols):
+            levels, values = cols.levels, (cols.pids if key == 'pid' else cols.tids)
+            return [i for i in rows if levels[i] >= 0 and cmp(values[i], target)]
+        return 1, number_filter
+
+    if key == 'tag':
+        def tag_filter(rows, results, lines, cols):
+            # 고유 tag에 대해서만 조건 평가 후 id 집합 조회
+            ok_ids = {tag_id for tag_id, tag in enumerate(cols.tags) if text_check(tag)}
+            tag_ids = cols.tag_ids
+            return [i for i in rows if tag_ids[i] in ok_ids]
+        return 1, tag_filter
+
+    def text_field_filter(rows, results, lines, cols):
+        levels, offsets = cols.levels, cols.msg_offsets
+        passed = []
+        for i in rows:
+            if levels[i] < 0:
+                continue
+            line = lines[results[i].line]
+            if key == 'msg':
+                text = line[offsets[i]:]
+            else:
+                text = line.split(None, 2)[0 if key == 'date' else 1]
+            if text_check(text):
+                passed.append(i)
+        return passed
+    return 3, text_field_filter
+
+
+def _compile_field_filter(query: str) -> RowsFilter:
+    try:
+        terms = shlex.split(query)
+    except ValueError as e:
+        raise ValueError(f"조건 파싱 오류: {e}")
+
+    steps = []
+    for term in terms:
+        m = _TERM_RE.match(term)
+        key = m.group('key').lower() if m else ''
+        if key == 'line' or key in LOGCAT_FIELDS:
+            steps.append(_compile_field_term(key, m.group('op'), m.group('value')))
+        else:
+            # 연산자 없는 단어: 결과 라인 전체에 대한 부분 문자열
+            needle = term.lower()
+            steps.append((2, lambda rows, results, lines, cols, needle=needle: [
+                i for i in rows if needle in lines[results[i].line].lower()
+            ]))
+    steps.sort(key=lambda step: step[0])
+
+    def rows_filter(results, candidates, lines, columns):
+        rows = candidates
+        for _, step in steps:
+            rows = step(rows, results, lines, columns)
+        return list(rows)
+
+    return rows_filter
+
+
+def needs_columns(mode: str) -> bool:
+    """LogcatColumns가 필요한 모드인지"""
+    return mode == 'field'
+
+
+def compile_result_filter(mode: str, query: str) -> RowsFilter:
+    """필터 조건 컴파일 (잘못된 조건은 ValueError)"""
+    if mode == 'text':
+        needle = query.lower()
+        return lambda results, candidates, lines, columns: [
+            i for i in candidates if needle in results[i].snippet.lower()
+        ]
+
+    if mode == 'regex':
+        try:
+            search = re.compile(query, re.IGNORECASE).search
+        except re.error as e:
+            raise ValueError(f"정규식 오류: {e}")
+        return lambda results, candidates, lines, columns: [
+            i for i in candidates if search(results[i].snippet)
+        ]
+
+    if mode == 'field':
+        return _compile_field_filter(query)
+
+    raise ValueError(f"알 수 없는 필터 모드: {mode}")
@@ -0,0 +1,123 @@
+# -*- coding: utf-8 -*-
+"""
+세션 복원용 파일 지문 / 검색결과 캐시 - Qt 비의존
+
+- file_fingerprint(): 크기 + 수정 시각 + 앞/뒤 FINGERPRINT_SAMPLE 바이트 해시
+  (파일 전체를 읽지 않고 '같은 파일인지' 판단)
+- 검색결과 캐시: (지문, 검색 조건)별 JSON 1개 - 라인 번호와 매칭 구간만 저장하고,
+  snippet은 복원 시 다시 읽은 파일의 라인에서 채움
+"""
+import hashlib
+import json
+import os
+from typing import Callable, List, Optional, Sequence, Tuple
+
+RESULT_CACHE_DIR = os.path.join(".", "config", "result_cache")
+RESULT_CACHE_MAX_FILES = 30  # 오래된 캐시부터 삭제
+RESULT_CACHE_MAX_RESULTS = 2000000  # 이보다 많은 결과는 캐시하지 않음 (다시 검색)
+FINGERPRINT_SAMPLE = 64 * 1024
+_WRITE_BATCH = 20000  # 결과 N개씩 나눠 기록 (배치마다 중지 요청 확인)
+
+CachedResults = List[Tuple[int, List[Tuple[int, int]]]]  # (라인, 매칭 구간들)
+
+
+def file_fingerprint(path: str) -> dict:
+    """파일 지문 (크기, 수정 시각, 앞/뒤 샘플 해시)"""
+    st = os.stat(path)
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        digest.update(f.read(FINGERPRINT_SAMPLE))
+        if st.st_size > FINGERPRINT_SAMPLE:
+            f.seek(max(FINGERPRINT_SAMPLE, st.st_size - FINGERPRINT_SAMPLE))
+            digest.update(f.read(FINGERPRINT_SAMPLE))
+    return {'size': st.st_size, 'mtime_ns': st.st_mtime_ns, 'sample': digest.hexdigest()}
+
+
+def fingerprint_matches(path: str, fingerprint: Optional[dict]) -> bool:
+    if not fingerprint or not os.path.isfile(path):
+        return False
+    try:
+        return file_fingerprint(path) == fingerprint
+    except OSError:
+        return False
+
+
+def result_cache_path(fingerprint: dict, search: dict) -> str:
+    key = json.dumps([fingerprint, search], sort_keys=True, ensure_ascii=False)
+    name = hashlib.blake2b(key.encode('utf-8'), digest_size=16).hexdigest()
+    return os.path.join(RESULT_CACHE_DIR, name + '.json')
+
+
+def save_result_cache(fingerprint: dict, search: dict, results: Sequence,
+                      should_stop: Optional[Callable[[], bool]] = None) -> bool:
+    """검색결과(line, matches 속성) 저장 - 임시 파일 기록 후 교체
+
+    결과를 _WRITE_BATCH개씩 나눠 기록하고, 배치마다 should_stop()이 True면
+    임시 파일을 지우고 False 반환 (기존 캐시는 그대로)
+    """
+    if len(results) > RESULT_CACHE_MAX_RESULTS:
+        return False
+    os.makedirs(RESULT_CACHE_DIR, exist_ok=True)
+    path = result_cache_path(fingerprint, search)
+    dumps = json.JSONEncoder(ensure_ascii=False, separators=(',', ':')).encode
+    tmp_path = path + '.part'
+    stopped = False
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write('{"fingerprint":%s,"search":%s' % (dumps(fingerprint), dumps(search)))
+            for key in ('lines', 'matches'):
+                f.write(',"%s":[' % key)
+                for start in range(0, len(results), _WRITE_BATCH):
+                    if should_stop is not None and should_stop():
+                        stopped = True
+                        break
+                    batch = results[start:start + _WRITE_BATCH]
+                    # 결과마다 리스트를 만들면 GC(전체 세대 수집)가 GUI 스레드까지 멈추므로 문자열로 바로 기록
+                    if key == 'lines':
+                        items = ['%d' % r.line for r in batch]
+                    else:
+                        # 매칭 구간은 [s0, e0, s1, e1, ...] 로 평탄화
+                        items = ['[%s]' % ','.join(['%d,%d' % span for span in r.matches]) for r in batch]
+                    if start:
+                        f.write(',')
+                    f.write(','.join(items))
+                if stopped:
+                    break
+                f.write(']')
+            f.write('}')
+        if not stopped:
+            os.replace(tmp_path, path)
+    finally:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    if stopped:
+        return False
+    prune_result_cache()
+    return True
+
+
+def load_result_cache(fingerprint: dict, search: dict) -> Optional[CachedResults]:
+    """저장된 검색결과, 없거나 조건이 다르면 None"""
+    path = result_cache_path(fingerprint, search)
+    if not os.path.isfile(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('fingerprint') != fingerprint or data.get('search') != search:
+        return None
+    return [
+        (line, list(zip(flat[0::2], flat[1::2])))
+        for line, flat in zip(data.get('lines', []), data.get('matches', []))
+    ]
+
+
+def prune_result_cache(max_files: int = RESULT_CACHE_MAX_FILES):
+    """캐시 파일이 max_files개를 넘으면 오래된 것부터 삭제"""
+    try:
+        entries = [os.path.join(RESULT_CACHE_DIR, name) for name in os.listdir(RESULT_CACHE_DIR)
+                   if name.endswith('.json')]
+        entries.sort(key=os.path.getmtime, reverse=True)
+        for path in entries[max_files:]:
+            os.remove(path)
+    except OSError:
+        pass
@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+문서 텍스트 스냅샷
+
+toPlainText()는 호출할 때마다 문서 전체를 복사하므로, 탭마다 하나의 불변 스냅샷
+(텍스트 + 라인 인덱스)을 캐시해 두고 문서 revision이 바뀔 때만 다시 만든다.
+Qt에 의존하지 않으므로 워커 스레드에서도 그대로 읽을 수 있다.
+"""
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, islice
+from typing import Callable, List, Optional
+
+
+class TextSnapshot:
+    """불변 문서 스냅샷 (텍스트 + 라인 리스트 + 라인 시작 오프셋)"""
+
+    __slots__ = ('text', 'revision', '_lines', '_line_starts')
+
+    def __init__(self, text: str, revision: int = 0):
+        self.text = text
+        self.revision = revision
+        self._lines: Optional[List[str]] = None
+        self._line_starts: Optional[array] = None
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __bool__(self) -> bool:
+        return bool(self.text)
+
+    @property
+    def lines(self) -> List[str]:
+        """'\\n' 기준 라인 리스트 (최초 접근 시 1회 생성)"""
+        if self._lines is None:
+            self._lines = self.text.split('\n')
+        return self._lines
+
+    @property
+    def line_starts(self) -> array:
+        """각 라인의 시작 문자 오프셋 (0-based 라인 인덱스)"""
+        if self._line_starts is None:
+            lines = self.lines
+            starts = array('q', [0])
+            starts.extend(accumulate(len(s) + 1 for s in islice(lines, len(lines) - 1)))
+            self._line_starts = starts
+        return self._line_starts
+
+    @property
+    def line_count(self) -> int:
+        return len(self.lines)
+
+    def line(self, index: int) -> str:
+        """0-based 라인 텍스트"""
+        return self.lines[index]
+
+    def text_range(self, first: int, last: int) -> str:
+        """0-based 라인 first~last(포함) 텍스트 - 라인 시작 오프셋으로 원본을 한 번만 잘라냄 (join 없음)"""
+        starts = self.line_starts
+        end = starts[last + 1] - 1 if last + 1 < len(starts) else len(self.text)
+        return self.text[starts[first]:end]
+
+    def cached_index(self) -> tuple:
+        """이미 만들어진 (라인 리스트, 라인 시작 오프셋) - 없으면 None, 새로 만들지 않음 (메모리 집계용)"""
+        return self._lines, self._line_starts
+
+    def drop_index(self):
+        """라인 리스트/시작 오프셋 해제 (다음 접근 시 다시 생성)"""
+        self._lines = None
+        self._line_starts = None
+
+    def line_of_offset(self, pos: int) -> int:
+        """문자 오프셋이 속한 0-based 라인 인덱스"""
+        return max(0, bisect_right(self.line_starts, pos) - 1)
+
+
+class SnapshotCache:
+    """
+    탭(또는 에디터) 단위 스냅샷 캐시
+
+    - revision: 문서 편집 시 invalidate()로 증가
+    - snapshot(): 캐시가 없을 때만 text_provider()로 전체 텍스트를 1회 복사
+    - set_text(): 로더가 읽은 문자열을 그대로 스냅샷으로 사용 (복사 없음)
+    """
+
+    def __init__(self, text_provider: Callable[[], str]):
+        self._text_provider = text_provider
+        self._snapshot: Optional[TextSnapshot] = None
+        self.revision = 0
+
+    def invalidate(self):
+        self.revision += 1
+        self._snapshot = None
+
+    def set_text(self, text: str):
+        self.revision += 1
+        self._snapshot = TextSnapshot(text, self.revision)
+
+    def snapshot(self) -> TextSnapshot:
+        if self._snapshot is None:
+            self._snapshot = TextSnapshot(self._text_provider(), self.revision)
+        return self._snapshot
+
+    def is_cached(self) -> bool:
+        return self._snapshot is not None
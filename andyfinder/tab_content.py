@@ -2,21 +2,27 @@
 """
 TabContent - 각 탭의 컨텐츠를 담당하는 위젯
 """
+import gc
 import os
 import re
 import json
-import time
-from typing import List, Tuple, Optional
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Tuple, Optional
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt, QModelIndex
 
 # andyfinder 모듈에서 import
 from andyfinder.constants import (
-    g_font_face, g_font_size,
-    debug_measuretime_start, debug_measuretime_snapshot
+    g_font_face, g_font_size, VIEW_MODE_MIN_FILE_SIZE, VIEW_MODE_CURSOR_REFRESH_MS,
+)
+from andyfinder.memory import (
+    QT_EXTRA_SELECTION_SIZE, estimate_document_size, estimate_results_size, estimate_size, format_bytes, process_rss
 )
 from andyfinder.models import SearchResult
+from andyfinder.snapshot import SnapshotCache, TextSnapshot
+from andyfinder.tracing import Tracer
 from andyfinder.widgets.line_edit import (
     QueryLineEdit,
     ColorKeywordsLineEdit,
@@ -25,15 +31,34 @@ from andyfinder.widgets.line_edit import (
 from andyfinder.widgets.combo_box import FavoriteComboBox
 from andyfinder.editors.drag_drop_editor import DragDropCodeEditor
 from andyfinder.views.drag_table_view import DragTableView
-from andyfinder.views.results_model import ResultsModel, NoWrapDelegate
+from andyfinder.views.results_model import ResultsModel
+from andyfinder.views.result_delegate import ResultSnippetDelegate
 from andyfinder.workers.file_loader import FileLoader
+from andyfinder.workers.save_worker import DocumentChunkFeeder, SaveWorker
 from andyfinder.workers.search_worker import SearchWorker
-from andyfinder.dialogs.favorite_dialogs import FavoriteDialog, FavoriteAddDialog
+from andyfinder.workers.result_cache_worker import ResultCacheWorker, ResultCacheSaveWorker
+from andyfinder.session import file_fingerprint, fingerprint_matches
+from andyfinder.workers.result_search_worker import ResultSearchWorker
+from andyfinder.workers.result_filter_worker import ResultFilterWorker
+from andyfinder.result_filter import is_incremental_extension
+from andyfinder.logcat import LogcatColumns
+from andyfinder.overview import bookmark_lines_job, keyword_lines_job, result_lines_job, row_lines_job
+from andyfinder.workers.triage_worker import compile_favorite_pattern
+
+# 다이얼로그는 처음 열 때 import (시작 시간 단축)
+if TYPE_CHECKING:
+    from andyfinder.dialogs.triage_dialog import FavoriteTriageDialog
+    from andyfinder.dialogs.export_dialog import ExportDialog
+    from andyfinder.dialogs.group_dialog import GroupByDialog
+    from andyfinder.dialogs.timing_dialog import TimingDialog
 
 
 class TabContent(QtWidgets.QWidget):
     """각 탭의 컨텐츠를 담당하는 위젯"""
 
+    RESULT_SEARCH_CACHE_SIZE = 8
+    RESULT_FILTER_CACHE_SIZE = 8
+
     def __init__(self, tab_number: int, parent=None):
         super().__init__(parent)
         self.tab_number = tab_number
@@ -45,17 +70,53 @@ class TabContent(QtWidgets.QWidget):
         self.search_worker: Optional[SearchWorker] = None
         self.file_thread: Optional[QtCore.QThread] = None
         self.file_loader: Optional[FileLoader] = None
+        self.save_thread: Optional[QtCore.QThread] = None
+        self.save_worker: Optional[SaveWorker] = None
+        self.save_feeder: Optional[DocumentChunkFeeder] = None
+        self.result_cache_thread: Optional[QtCore.QThread] = None
+        self.result_cache_worker: Optional[ResultCacheSaveWorker] = None
         self.current_results: List[SearchResult] = []
         self.current_result_index: int = -1
         self.current_file_path: str = ""
         self.is_modified: bool = False
+        self.view_mode: bool = False  # 보기 전용 (undo/편집 추적 끔, 커서 갱신 묶음 처리)
+
+        # 세션 복원: current_results를 만든 검색 조건 (캐시 키), 복원 대기 중인 세션/마킹
+        self.current_search: Optional[dict] = None
+        self._running_search: Optional[dict] = None
+        self._restore_session: Optional[dict] = None
+        self._restore_marks: Optional[List[int]] = None
+
+        # 단계별 구간 기록 (타이밍 패널 / Chrome trace 내보내기)
+        self.tracer = Tracer(f"AndyFinder Tab#{tab_number}")
+        self.timing_dialog: Optional['TimingDialog'] = None
+        self.file_size = 0
+        self._load_span = None
+        self._search_span = None
 
         self.result_search_query: str = ""
         self.result_search_index: int = -1
         self.result_search_matches: List[int] = []
+        # 결과 내 검색 인덱스: (결과 세대, 검색어) -> 일치 row 리스트 (LRU)
+        self.results_generation: int = 0
+        self.result_search_cache: "OrderedDict[Tuple[int, str], List[int]]" = OrderedDict()
+        self.result_search_thread: Optional[QtCore.QThread] = None
+        self.result_search_worker: Optional[ResultSearchWorker] = None
+        self._result_search_forward: bool = True
+
+        # 결과 필터: (모드, 필터어) -> 통과한 결과 인덱스 리스트 (LRU, 결과 세트가 바뀌면 초기화)
+        self.result_filter_generation: int = 0
+        self.result_filter_cache: "OrderedDict[Tuple[str, str], List[int]]" = OrderedDict()
+        self.result_filter_thread: Optional[QtCore.QThread] = None
+        self.result_filter_worker: Optional[ResultFilterWorker] = None
+        self.result_columns: Optional[LogcatColumns] = None  # 필드 필터/그룹 집계용 컬럼 인덱스 (결과 세트마다 1회 생성)
 
         self.color_keywords: List[Tuple[str, QtGui.QColor]] = []
 
+        self.triage_dialog: Optional['FavoriteTriageDialog'] = None
+        self.export_dialog: Optional['ExportDialog'] = None
+        self.group_dialog: Optional['GroupByDialog'] = None
+
         # 50가지 색상 팔레트
         self.color_palette = [
             QtGui.QColor(255, 255, 200), QtGui.QColor(255, 200, 200), QtGui.QColor(200, 255, 200),
@@ -79,6 +140,13 @@ class TabContent(QtWidgets.QWidget):
 
         self._build_ui()
 
+        # 탭 단위 문서 스냅샷 서비스 (lineView 문서 기준)
+        self.snapshot_cache: SnapshotCache = self.lineView.snapshot_cache
+
+    def snapshot(self) -> TextSnapshot:
+        """lineView 문서의 캐시된 스냅샷 (검색/복사/하이라이트 공용)"""
+        return self.snapshot_cache.snapshot()
+
     def _build_ui(self):
         top_widget = QtWidgets.QWidget()
         top_layout = QtWidgets.QVBoxLayout(top_widget)
@@ -111,8 +179,16 @@ class TabContent(QtWidgets.QWidget):
         self.lbl_file.setMinimumWidth(300)
         self.lbl_file.setTextInteractionFlags(Qt.TextSelectableByMouse)
 
+        self.chk_view_mode = QtWidgets.QCheckBox("보기 전용")
+        self.chk_view_mode.setToolTip(
+            f"편집/undo 기록을 끄고 커서 이동 갱신을 묶어서 처리 "
+            f"({VIEW_MODE_MIN_FILE_SIZE // (1024 * 1024)}MB 이상 파일은 자동 적용)"
+        )
+        self.chk_view_mode.toggled.connect(self.set_view_mode)
+
         first_layout.addWidget(self.btn_open)
         first_layout.addWidget(self.lbl_file, 1)
+        first_layout.addWidget(self.chk_view_mode)
 
         # 두 번째 줄
         second_row = QtWidgets.QWidget()
@@ -227,6 +303,11 @@ class TabContent(QtWidgets.QWidget):
         self.prog.setRange(0, 100)
         self.prog.setValue(0)
 
+        # 즐겨찾기 일괄 실행 버튼
+        self.btn_triage = QtWidgets.QPushButton("Triage")
+        self.btn_triage.setToolTip("기본 검색어 즐겨찾기 일괄 실행 (Ctrl+Shift+F5)")
+        self.btn_triage.clicked.connect(self.show_favorite_triage)
+
         # 즐겨찾기 드롭박스
         self.cmb_favorites = FavoriteComboBox()
         self.cmb_favorites.setMinimumWidth(800)
@@ -258,6 +339,7 @@ class TabContent(QtWidgets.QWidget):
         third_layout.addWidget(self.edt_next_lines)
         third_layout.addWidget(self.btn_stop)
         third_layout.addWidget(self.prog)
+        third_layout.addWidget(self.btn_triage)
         third_layout.addWidget(self.cmb_favorites)
         third_layout.addStretch()
 
@@ -446,9 +528,8 @@ class TabContent(QtWidgets.QWidget):
         self.lineView.setFont(QtGui.QFont(g_font_face, g_font_size))
         self.lineView.textChanged.connect(self.on_text_changed)
         self.lineView.fileDropped.connect(self.load_dropped_file)
-        self.lineView.cursorPositionChanged.connect(self.highlight_current_line)
-        # 북마크 변경 시그널 연결 추가
-        self.lineView.cursorPositionChanged.connect(self.update_bookmark_labels)
+        # 현재 라인 하이라이트 + 북마크 라벨 (보기 전용 모드에서는 묶어서 처리)
+        self.lineView.cursorPositionChanged.connect(self.on_line_view_cursor_changed)
 
         lineView_layout.addWidget(self.lineView)
 
@@ -484,9 +565,7 @@ class TabContent(QtWidgets.QWidget):
         self.lineView_clone.setFont(QtGui.QFont(g_font_face, g_font_size))
         self.lineView_clone.setReadOnly(True)  # 읽기 전용
         #self.lineView_clone.fileDropped.connect(self.load_dropped_file)
-        self.lineView_clone.cursorPositionChanged.connect(self.highlight_current_line_clone)
-        # 북마크 변경 시그널 연결 추가
-        self.lineView_clone.cursorPositionChanged.connect(self.update_bookmark_labels)
+        self.lineView_clone.cursorPositionChanged.connect(self.on_line_view_clone_cursor_changed)
 
         lineView_clone_layout.addWidget(self.lineView_clone)
 
@@ -494,6 +573,13 @@ class TabContent(QtWidgets.QWidget):
         self.lineView.highlightCurrentLine()
         self.lineView_clone.highlightCurrentLine()
 
+        # 보기 전용 모드: 커서 이동 갱신을 VIEW_MODE_CURSOR_REFRESH_MS 간격으로 1회만
+        self._cursor_refresh_timer = QtCore.QTimer(self)
+        self._cursor_refresh_timer.setSingleShot(True)
+        self._cursor_refresh_timer.setInterval(VIEW_MODE_CURSOR_REFRESH_MS)
+        self._cursor_refresh_timer.timeout.connect(self.flush_cursor_refresh)
+        self._pending_cursor_views = set()
+
         # 가로 splitter에 컨테이너 추가
         splitter_horizontal.addWidget(lineView_container)
         splitter_horizontal.addWidget(lineView_clone_container)
@@ -510,12 +596,15 @@ class TabContent(QtWidgets.QWidget):
         self.tblResults.setAlternatingRowColors(True)
         self.tblResults.setWordWrap(False)
         self.tblResults.setTextElideMode(Qt.ElideNone)
-        self.tblResults.setItemDelegateForColumn(1, NoWrapDelegate(self.tblResults))
+        self.tblResults.setItemDelegateForColumn(1, ResultSnippetDelegate(self.tblResults))
         self.tblResults.setShowGrid(False)
 
         self.resultsModel = ResultsModel()
         self.tblResults.setModel(self.resultsModel)
         self.tblResults.doubleClicked.connect(self.on_table_double_clicked)
+        # fetchMore로 노출 row가 늘어나면 결과 건수 라벨 갱신
+        self.resultsModel.rowsInserted.connect(self.update_bookmark_labels)
+        self.resultsModel.modelReset.connect(self.update_bookmark_labels)
 
         # 초기 헤더 width 설정
         header = self.tblResults.horizontalHeader()
@@ -523,9 +612,47 @@ class TabContent(QtWidgets.QWidget):
         header.setSectionResizeMode(1, QtWidgets.QHeaderView.Interactive)
         self.tblResults.setColumnWidth(1, 1300)
 
+        # 결과 필터 바 (tblResults 상단)
+        results_container = QtWidgets.QWidget()
+        results_layout = QtWidgets.QVBoxLayout(results_container)
+        results_layout.setContentsMargins(0, 0, 0, 0)
+        results_layout.setSpacing(2)
+
+        filter_layout = QtWidgets.QHBoxLayout()
+        filter_layout.addWidget(QtWidgets.QLabel("필터:"))
+        self.cmb_filter_mode = QtWidgets.QComboBox()
+        self.cmb_filter_mode.addItem("텍스트", 'text')
+        self.cmb_filter_mode.addItem("정규식", 'regex')
+        self.cmb_filter_mode.addItem("필드", 'field')
+        self.cmb_filter_mode.setToolTip(
+            "텍스트/정규식: 검색결과 내용 기준 (대소문자 무시)\n"
+            "필드: line>=1000 pid=1234 level>=W tag=ActivityManager msg~\"am_.*proc\" (AND)"
+        )
+        filter_layout.addWidget(self.cmb_filter_mode)
+
+        self.edt_result_filter = QtWidgets.QLineEdit()
+        self.edt_result_filter.setPlaceholderText("검색 결과 필터... (결과/마킹은 유지됨)")
+        self.edt_result_filter.setClearButtonEnabled(True)
+        filter_layout.addWidget(self.edt_result_filter, 1)
+
+        self.lbl_result_filter_status = QtWidgets.QLabel("")
+        self.lbl_result_filter_status.setStyleSheet("color: #404040;")
+        filter_layout.addWidget(self.lbl_result_filter_status)
+        results_layout.addLayout(filter_layout)
+        results_layout.addWidget(self.tblResults, 1)
+
+        # 입력 중에는 마지막 입력 후 한 번만 필터링
+        self._result_filter_timer = QtCore.QTimer(self)
+        self._result_filter_timer.setSingleShot(True)
+        self._result_filter_timer.setInterval(200)
+        self._result_filter_timer.timeout.connect(self.apply_result_filter)
+        self.edt_result_filter.textChanged.connect(self._result_filter_timer.start)
+        self.edt_result_filter.returnPressed.connect(self.apply_result_filter)
+        self.cmb_filter_mode.currentIndexChanged.connect(self.apply_result_filter)
+
         # 세로 splitter에 추가
         splitter_vertical.addWidget(splitter_horizontal)
-        splitter_vertical.addWidget(self.tblResults)
+        splitter_vertical.addWidget(results_container)
         splitter_vertical.setStretchFactor(0, 3)
         splitter_vertical.setStretchFactor(1, 1)
 
@@ -636,9 +763,78 @@ class TabContent(QtWidgets.QWidget):
         else:
             QtWidgets.QMessageBox.warning(self, "경고", "선택한 항목의 값이 없습니다.")
 
+    def on_line_view_cursor_changed(self):
+        if self.view_mode:
+            self._schedule_cursor_refresh(self.lineView)
+            return
+        self.highlight_current_line()
+        self.update_bookmark_labels()
+
+    def on_line_view_clone_cursor_changed(self):
+        if self.view_mode:
+            self._schedule_cursor_refresh(self.lineView_clone)
+            return
+        self.highlight_current_line_clone()
+        self.update_bookmark_labels()
+
+    def _schedule_cursor_refresh(self, view):
+        # 타이머가 돌고 있으면 다시 시작하지 않음 (연속 이동 중에도 주기적으로 갱신)
+        self._pending_cursor_views.add(view)
+        if not self._cursor_refresh_timer.isActive():
+            self._cursor_refresh_timer.start()
+
+    def flush_cursor_refresh(self):
+        """보기 전용 모드에서 묶어 둔 커서 이동 갱신을 1회 처리"""
+        pending = self._pending_cursor_views
+        self._pending_cursor_views = set()
+        if self.lineView in pending:
+            self.highlight_current_line()
+        if self.lineView_clone in pending:
+            self.highlight_current_line_clone()
+        if pending:
+            self.update_bookmark_labels()
+
+    def set_view_mode(self, enabled: bool):
+        """보기 전용 모드 전환 - lineView 읽기 전용 + undo/redo 기록 해제"""
+        enabled = bool(enabled)
+        if enabled != self.chk_view_mode.isChecked():
+            # 체크박스 toggled로 다시 들어옴
+            self.chk_view_mode.setChecked(enabled)
+            return
+        if enabled == self.view_mode:
+            return
+
+        document = self.lineView.document()
+        undo_steps = document.availableUndoSteps() + document.availableRedoSteps()
+        rss_before = process_rss()
+
+        self.view_mode = enabled
+        self.lineView.setReadOnly(enabled)
+        # setUndoRedoEnabled(False)는 쌓인 undo/redo 기록을 비움
+        self.lineView.setUndoRedoEnabled(not enabled)
+        self.lineView_clone.setUndoRedoEnabled(not enabled)
+
+        self._cursor_refresh_timer.stop()
+        self._pending_cursor_views = set()
+        self.highlight_current_line()
+        self.highlight_current_line_clone()
+
+        if not enabled:
+            self.show_status_message("보기 전용 모드 해제 (편집/undo 기록 사용)", 3000)
+            return
+        rss_after = process_rss()
+        saved = ""
+        if rss_before is not None and rss_after is not None:
+            saved = f", 메모리 {format_bytes(max(0, rss_before - rss_after))} 절감"
+        self.show_status_message(f"보기 전용 모드: undo {undo_steps}단계 해제{saved}", 5000)
+
     def highlight_current_line(self):
+        if self.lineView.isReadOnly():
+            # 보기 전용 모드: lineView_clone과 같은 연한 green
+            self.lineView.highlightCurrentLine()
+            return
+
         extra_selections = []
-        extra_selections.extend(self.lineView.color_highlight_selections)
 
         if not self.lineView.isReadOnly():
             selection = QtWidgets.QTextEdit.ExtraSelection()
@@ -657,7 +853,6 @@ class TabContent(QtWidgets.QWidget):
     def highlight_current_line_clone(self):
         """lineView_clone의 current line을 연한 green으로 하이라이트"""
         extraSelections = []
-        extraSelections.extend(self.lineView_clone.color_highlight_selections)
 
         # lineView_clone은 read-only이므로 항상 연한 green 배경 표시
         selection = QtWidgets.QTextEdit.ExtraSelection()
@@ -702,24 +897,21 @@ class TabContent(QtWidgets.QWidget):
         start_line = min(line1, line2)
         end_line = max(line1, line2)
 
-        # 텍스트 가져오기
-        content = self.lineView.toPlainText()
-        lines = content.split('\n')
+        # 캐시된 스냅샷의 라인 시작 오프셋으로 범위만 잘라냄
+        snapshot = self.snapshot()
 
-        if start_line < 1 or end_line > len(lines):
+        if start_line < 1 or end_line > snapshot.line_count:
             QtWidgets.QMessageBox.warning(self, "경고", "라인 번호가 범위를 벗어났습니다.")
             return
 
-        # 사이의 내용 추출
-        selected_lines = lines[start_line - 1:end_line]
-        selected_text = '\n'.join(selected_lines)
+        selected_text = snapshot.text_range(start_line - 1, end_line - 1)
 
         # 클립보드에 복사
         clipboard = QtWidgets.QApplication.clipboard()
         clipboard.setText(selected_text)
 
         self.show_status_message(
-            f"라인 {start_line}~{end_line} 복사됨 ({len(selected_lines)}줄)",
+            f"라인 {start_line}~{end_line} 복사됨 ({end_line - start_line + 1}줄)",
             3000
         )
 
@@ -734,6 +926,7 @@ class TabContent(QtWidgets.QWidget):
         next_row = self.resultsModel.get_next_marked_row(current_row if current_row is not None else -1)
 
         if next_row >= 0:
+            self.resultsModel.ensure_loaded(next_row)
             index = self.resultsModel.index(next_row, 0)
             self.tblResults.setCurrentIndex(index)
             self.tblResults.scrollTo(index, QtWidgets.QAbstractItemView.PositionAtCenter)
@@ -757,11 +950,12 @@ class TabContent(QtWidgets.QWidget):
 
         current_row = self.tblResults.currentIndex().row()
         if current_row is None or current_row < 0:
-            prev_row = max(self.resultsModel.marked_rows) if self.resultsModel.marked_rows else -1
+            prev_row = self.resultsModel.get_prev_marked_row(self.resultsModel.total_count())
         else:
             prev_row = self.resultsModel.get_prev_marked_row(current_row)
 
         if prev_row >= 0:
+            self.resultsModel.ensure_loaded(prev_row)
             index = self.resultsModel.index(prev_row, 0)
             self.tblResults.setCurrentIndex(index)
             self.tblResults.scrollTo(index, QtWidgets.QAbstractItemView.PositionAtCenter)
@@ -777,6 +971,72 @@ class TabContent(QtWidgets.QWidget):
         else:
             self.show_status_message("이전 마킹된 항목이 없습니다", 2000)
 
+    def show_goto_result_dialog(self):
+        """tblResults에서 Ctrl+G: N번째 결과로 이동"""
+        total = self.resultsModel.total_count()
+        if total == 0:
+            self.show_status_message("검색 결과가 없습니다", 2000)
+            return
+        current = max(0, self.tblResults.currentIndex().row()) + 1
+        number, ok = QtWidgets.QInputDialog.getInt(
+            self, "Go to result", f"결과 번호 (1 ~ {total:,}):", current, 1, total
+        )
+        if ok:
+            self.goto_result_number(number)
+
+    def goto_result_number(self, number: int):
+        """1-based 결과 번호로 이동 (필요한 row까지만 뷰에 로드)"""
+        row = number - 1
+        if not self.resultsModel.ensure_loaded(row):
+            return
+        self.current_result_index = row
+        self.goto_result(self.resultsModel.get(row))
+        self.tblResults.setFocus()
+
+    # 일괄 마킹
+    def mark_results_matching(self, pattern: str = ""):
+        """검색결과 중 정규식(기본: 결과내 검색어)과 일치하는 항목을 모두 마킹"""
+        pattern = pattern or self.edt_result_search.text().strip()
+        if not pattern:
+            self.show_status_message("검색결과에서 검색 입력란에 정규식을 입력하세요", 3000)
+            return
+        try:
+            rx = re.compile(pattern, re.IGNORECASE)
+        except re.error as e:
+            self.show_status_message(f"정규식 오류: {e}", 3000)
+            return
+
+        search = rx.search
+        results = self.current_results
+        rows = [idx for idx in self.resultsModel.visible_source_rows()
+                if search(results[idx].snippet) or search(str(results[idx].line + 1))]
+        before = len(self.resultsModel.marked_rows)
+        self.resultsModel.mark_rows(rows)
+        self.update_bookmark_labels()
+        added = len(self.resultsModel.marked_rows) - before
+        self.show_status_message(f"일치 {len(rows)}건 중 {added}건 마킹 추가", 3000)
+
+    def invert_result_marks(self):
+        self.resultsModel.invert_marks()
+        self.update_bookmark_labels()
+        self.show_status_message(f"마킹 반전: {len(self.resultsModel.marked_rows)}건", 2000)
+
+    def clear_result_marks(self):
+        self.resultsModel.clear_marks()
+        self.update_bookmark_labels()
+        self.show_status_message("마킹 모두 해제", 2000)
+
+    def marks_to_bookmarks(self):
+        """마킹된 결과의 라인을 lineView 북마크로 추가"""
+        rows = self.resultsModel.rows
+        lines = {rows[r].line + 1 for r in self.resultsModel.marked_rows}
+        if not lines:
+            self.show_status_message("마킹된 항목이 없습니다", 2000)
+            return
+        self.lineView.add_bookmarks(lines)
+        self.update_bookmark_labels()
+        self.show_status_message(f"마킹 {len(lines)}건을 북마크로 추가", 3000)
+
     def on_table_double_clicked(self, index: QModelIndex):
         """테이블 왼쪽 더블클릭: lineView로 이동만"""
         self.goto_result_from_table(index)
@@ -826,6 +1086,8 @@ class TabContent(QtWidgets.QWidget):
     def _open_favorites_with_quick_add(self, title: str, json_path: str, base_value: str,
                                        target_lineedit: QtWidgets.QLineEdit):
         """즐겨찾기 빠른 추가 + 관리 다이얼로그"""
+        from andyfinder.dialogs.favorite_dialogs import FavoriteDialog, FavoriteAddDialog
+
         # 1) 빠른 추가 UX
         add_dlg = FavoriteAddDialog(current_value=base_value, parent=self)
         if add_dlg.exec() == QtWidgets.QDialog.Accepted:
@@ -873,6 +1135,9 @@ class TabContent(QtWidgets.QWidget):
             self.chk_case.setEnabled(False)
 
     def on_text_changed(self):
+        if self.view_mode:
+            # 보기 전용 모드에서는 편집 추적하지 않음 (파일 로딩 시 setPlainText 포함)
+            return
         self.is_modified = True
         # 탭 제목에 * 표시 (MainWindow에서 처리)
         main_window = self.window()
@@ -886,11 +1151,9 @@ class TabContent(QtWidgets.QWidget):
             QtWidgets.QMessageBox.warning(self, "경고", "올바른 파일이 아닙니다.")
 
     def load_file(self, path):
-        global debug_measuretime_start, debug_measuretime_snapshot
-        debug_measuretime_start = time.time()
-
         self.close_current_file()
         self.current_file_path = path
+        self._load_span = self.tracer.begin('load file', 'load', path=path)
 
         self.lbl_file.setText("로딩 중: " + path)
         self.prog.setValue(0)
@@ -898,7 +1161,7 @@ class TabContent(QtWidgets.QWidget):
         self.lineView_clone.setEnabled(False)
 
         self.file_thread = QtCore.QThread(self)
-        self.file_loader = FileLoader(path)
+        self.file_loader = FileLoader(path, self.tracer)
         self.file_loader.moveToThread(self.file_thread)
         self.file_thread.started.connect(self.file_loader.run)
         self.file_loader.progress.connect(self.prog.setValue)
@@ -917,22 +1180,90 @@ class TabContent(QtWidgets.QWidget):
             QtWidgets.QMessageBox.information(self, "안내", "저장할 파일이 없습니다.")
             return
 
-        try:
-            content = self.lineView.toPlainText()
-            with open(self.current_file_path, 'w', encoding=self.encoding, errors='replace') as f:
-                f.write(content)
+        if self.save_thread is not None:
+            self.show_status_message("저장 중입니다...", 2000)
+            return
 
+        # 스냅샷(불변)을 워커에 넘기고, 임시 파일에 기록 후 원본과 교체
+        snapshot = None
+        if self.snapshot_cache.is_cached():
+            snapshot = self.snapshot()
+        else:
+            # 편집 직후(스냅샷 없음)에는 toPlainText 전체 복사 대신 문서 블록을 타이머로 나눠 넘김
+            # 넘기는 동안 문서가 바뀌지 않도록 저장이 끝날 때까지 편집 잠금
+            self.save_feeder = DocumentChunkFeeder(self.lineView.document(), self.snapshot_cache.revision, self)
+            self.lineView.setReadOnly(True)
+        self.save_thread = QtCore.QThread(self)
+        self.save_worker = SaveWorker(self.current_file_path, snapshot, self.encoding, self.save_feeder)
+        self.save_worker.moveToThread(self.save_thread)
+        self.save_thread.started.connect(self.save_worker.run)
+        self.save_worker.progress.connect(self.prog.setValue)
+        self.save_worker.finished.connect(self.on_save_finished)
+        self.save_worker.failed.connect(self.on_save_failed)
+        self.save_worker.cancelled.connect(self.stop_save)
+        self.prog.setValue(0)
+        self.show_status_message("파일 저장 중: " + self.current_file_path, 3000)
+        self.save_thread.start()
+        if self.save_feeder is not None:
+            self.save_feeder.start()
+
+    def stop_save(self):
+        if self.save_worker:
+            self.save_worker.stop()
+        if self.save_feeder:
+            self.save_feeder.stop()
+        self.wait_save_finished()
+
+    def wait_save_finished(self) -> Optional[str]:
+        """진행 중인 저장이 끝날 때까지 대기 (종료 시 사용, 중지하지 않음) - 저장 실패 시 오류 메시지 반환"""
+        worker = self.save_worker
+        feeder = self.save_feeder
+        if feeder is not None:
+            # 워커는 끝 표시를 받아야 끝나므로 남은 블록을 마저 넘김 (이미 실패했으면 중지)
+            if worker is not None and worker.error is not None:
+                feeder.stop()
+            else:
+                feeder.drain()
+        if self.save_thread:
+            self.save_thread.quit()
+            self.save_thread.wait()
+        self.save_worker = None
+        self.save_thread = None
+        if feeder is not None:
+            self.save_feeder = None
+            feeder.deleteLater()
+            self.lineView.setReadOnly(self.view_mode)
+        # 실패 시그널(queued)은 save_worker를 비운 뒤 도착해 무시되므로 여기서 결과를 돌려줌
+        return worker.error if worker is not None else None
+
+    def on_save_failed(self, msg: str):
+        if self.save_worker is None or self.sender() is not self.save_worker:
+            return
+        self.wait_save_finished()
+        self.prog.setValue(0)
+        QtWidgets.QMessageBox.critical(self, "저장 실패", f"파일 저장 중 오류가 발생했습니다: {msg}")
+
+    def on_save_finished(self, path: str, revision: int, written: int, duration: float):
+        if self.save_worker is None or self.sender() is not self.save_worker:
+            return
+        self.wait_save_finished()
+
+        # 저장 중에 편집되었으면 수정 표시 유지
+        if revision == self.snapshot_cache.revision:
             self.is_modified = False
             # 탭 제목에서 * 제거 (MainWindow에서 처리)
             main_window = self.window()
             if main_window.__class__.__name__ == 'MainWindow':
                 main_window.unmark_tab_modified(self)
 
-            self.show_status_message("파일 저장 완료: " + self.current_file_path, 3000)
-        except Exception as e:
-            QtWidgets.QMessageBox.critical(self, "저장 실패", f"파일 저장 중 오류가 발생했습니다: {str(e)}")
+        self.show_status_message(
+            f"파일 저장 완료: {path} ({written / (1024 * 1024):,.1f} MB, {duration:.2f} sec(s))", 3000
+        )
 
     def on_file_failed(self, msg: str):
+        self._restore_session = None
+        self.tracer.end(self._load_span, error=msg)
+        self._load_span = None
         QtWidgets.QMessageBox.critical(self, "파일 열기 실패", msg)
         self.lbl_file.setText("파일 없음")
         self.prog.setValue(0)
@@ -951,23 +1282,36 @@ class TabContent(QtWidgets.QWidget):
         self.content = content
         self.encoding = encoding
 
-        global debug_measuretime_start, debug_measuretime_snapshot
-        debug_measuretime_snapshot = time.time()
-        print(f"debug_measuretime_duration(on_file_loaded) : {debug_measuretime_snapshot - debug_measuretime_start:.4f} sec")
+        try:
+            self.file_size = os.path.getsize(self.current_file_path)
+        except OSError:
+            self.file_size = len(content)
+
+        # 큰 파일은 보기 전용 모드로 로딩 (setPlainText가 undo 기록/편집 추적을 거치지 않도록 먼저 적용)
+        try:
+            self.set_view_mode(os.path.getsize(self.current_file_path) >= VIEW_MODE_MIN_FILE_SIZE)
+        except OSError:
+            pass
 
         # lineView와 lineView_clone 모두에 내용 설정
-        self.lineView.setPlainText(content)
-        self.lineView_clone.setPlainText(content)  # clone에도 동일 내용 loading
+        with self.tracer.span('setPlainText', 'load', bytes=self.file_size) as span:
+            self.lineView.setPlainText(content)
+            self.lineView_clone.setPlainText(content)  # clone에도 동일 내용 loading
+            span.args['lines'] = self.lineView.blockCount()
+        # 로딩한 문자열을 그대로 스냅샷으로 등록 (toPlainText 복사 방지)
+        self.lineView.set_snapshot_text(content)
+        self.lineView_clone.set_snapshot_text(content)
 
         self.lineView.setEnabled(True)
         self.lineView_clone.setEnabled(True)
 
-        debug_measuretime_snapshot = time.time()
-        print(f"debug_measuretime_duration(lineView.setPlainText) : {debug_measuretime_snapshot - debug_measuretime_start:.4f} sec")
+        with self.tracer.span('line index', 'load', bytes=self.file_size) as span:
+            line_count = self.snapshot().line_count
+            span.args['lines'] = line_count
 
         # 변경: lbl_file에 파일명 표시
         file_name = os.path.basename(self.current_file_path) if self.current_file_path else "Unknown"
-        self.lbl_file.setText(f"파일명: {file_name} | {len(content)} chars, 인코딩: {encoding}, 라인: {len(content.split(chr(10)))}")
+        self.lbl_file.setText(f"파일명: {file_name} | {len(content)} chars, 인코딩: {encoding}, 라인: {line_count}")
 
         # lbl_status에 로딩 시간 표시
         self.lbl_status.setText(f"Loading duration : {duration:.2f} sec(s)")
@@ -978,10 +1322,8 @@ class TabContent(QtWidgets.QWidget):
         self.current_result_index = -1
         self.prog.setValue(0)
 
-        self.result_search_query = ""
-        self.result_search_index = -1
-        self.result_search_matches = []
-        self.lbl_result_search_status.setText("")
+        self.reset_result_search()
+        self.reset_result_filter()
 
         self.is_modified = False
 
@@ -993,7 +1335,74 @@ class TabContent(QtWidgets.QWidget):
         if self.color_keywords:
             self.apply_color_highlights()
 
+        self.tracer.end(self._load_span, bytes=self.file_size, lines=line_count)
+        self._load_span = None
+
+        session, self._restore_session = self._restore_session, None
+        if session:
+            self._resume_session(session)
+
+    # 세션 복원
+    def get_session(self) -> Optional[dict]:
+        """latest_config에 기록할 세션 (열린 파일 + 지문 + 검색 조건 + 마킹) - 검색결과 캐시는 검색 완료 시 이미 기록됨"""
+        path = self.current_file_path
+        if not path or not os.path.isfile(path):
+            return None
+        try:
+            fingerprint = file_fingerprint(path)
+        except OSError:
+            return None
+        session = {'file_path': path, 'fingerprint': fingerprint, 'search': None, 'marked_rows': []}
+
+        # 편집 후 저장하지 않은 문서는 디스크 파일과 달라서 결과/마킹을 이어 쓸 수 없음
+        if self.current_search and not self.is_modified:
+            session['search'] = self.current_search
+            session['marked_rows'] = list(self.resultsModel.marked_rows)
+        return session
+
+    def restore_session(self, session: dict) -> bool:
+        """이전 세션의 파일을 백그라운드로 다시 열기 (로딩 완료 후 _resume_session)"""
+        path = session.get('file_path')
+        if not path or not os.path.isfile(path):
+            return False
+        self._restore_session = session
+        self.load_file(path)
+        return True
+
+    def _resume_session(self, session: dict):
+        """파일 로딩 후: 지문이 같으면 결과 캐시 + 마킹 복원, 다르면 같은 조건으로 다시 검색"""
+        search = session.get('search')
+        if not search:
+            return
+        self.edt_query.setText(search['query'])
+        self.cmb_mode.setCurrentIndex(self.cmb_mode.findText("정규식" if search['mode'] == 'regex' else "일반"))
+        if search['mode'] == 'plain':
+            self.chk_case.setChecked(bool(search['case_sensitive']))
+
+        snapshot = self.snapshot()
+        fingerprint = session.get('fingerprint')
+        if fingerprint_matches(self.current_file_path, fingerprint):
+            self._restore_marks = session.get('marked_rows') or None
+            worker = ResultCacheWorker(snapshot, search, fingerprint)
+        else:
+            worker = SearchWorker(snapshot, search['query'], search['mode'], search['case_sensitive'])
+        self.show_status_message("이전 세션 검색결과 복원 중...")
+        self._start_search_worker(worker, search)
+
     def close_current_file(self):
+        if self.triage_dialog is not None:
+            self.triage_dialog.stop_triage()
+        if self.export_dialog is not None:
+            self.export_dialog.stop_export()
+        if self.group_dialog is not None:
+            self.group_dialog.stop_group_by()
+        self.wait_save_finished()
+        self.stop_result_cache()
+        self.lineView.overview_ruler.stop_overview()
+        self.lineView_clone.overview_ruler.stop_overview()
+        self.lineView.reset_internal_search()
+        self.lineView_clone.reset_internal_search()
+        self.reset_result_filter()
         self.resultsModel.set_results([])
         self.current_results = []
         self.current_result_index = -1
@@ -1004,10 +1413,9 @@ class TabContent(QtWidgets.QWidget):
         self.lineView_clone.bookmarks.clear()
         self.current_file_path = ""
         self.is_modified = False
-        self.result_search_query = ""
-        self.result_search_index = -1
-        self.result_search_matches = []
-        self.lbl_result_search_status.setText("")
+        self.current_search = None
+        self._restore_marks = None
+        self.reset_result_search()
 
     def get_context_counts(self) -> Tuple[int, int]:
         def to_int(s: str) -> int:
@@ -1022,9 +1430,10 @@ class TabContent(QtWidgets.QWidget):
         """현재 결과 리스트의 snippet을 prev/next 라인 포함하여 업데이트"""
         if not self.current_results:
             return
-        lines = self.lineView.toPlainText().split('\n')
+        lines = self.snapshot().lines
         total = len(lines)
         prev_n, next_n = self.get_context_counts()
+        self.resultsModel.context_prev = prev_n
 
         for r in self.current_results:
             start = max(0, r.line - prev_n)
@@ -1038,38 +1447,46 @@ class TabContent(QtWidgets.QWidget):
         top_left = self.resultsModel.index(0, 1)
         bottom_right = self.resultsModel.index(self.resultsModel.rowCount() - 1, 1)
         self.resultsModel.dataChanged.emit(top_left, bottom_right)
-        self.tblResults.resizeRowsToContents()
+        self.tblResults.row_sizer.reset(sum(self.get_context_counts()))
 
     def on_context_lines_changed(self):
         """previous/next lines 값 변경 시 현재 결과에 즉시 반영"""
         if not self.current_results:
             return
+        self.reset_result_search()
+        self.reset_result_filter()
         self.apply_context_snippets_to_current_results()
         self.refresh_results_view_after_context_change()
+        # snippet이 바뀌었으므로 필터 재적용
+        if self.edt_result_filter.text():
+            self.apply_result_filter()
 
     def do_search(self):
-        if not self.lineView.toPlainText():
+        snapshot = self.snapshot()
+        if not snapshot:
             QtWidgets.QMessageBox.information(self, "안내", "먼저 (dumpstate) 파일을 여세요.")
             return
 
-        global debug_measuretime_start, debug_measuretime_snapshot
-        debug_measuretime_start = time.time()
-
         query = self.edt_query.text()
         if not query.strip():
             QtWidgets.QMessageBox.information(self, "안내", "검색어를 입력하세요.")
             return
 
-        self.stop_search()
-
         mode_map = {'일반': 'plain', '정규식': 'regex'}
         mode = mode_map[self.cmb_mode.currentText()]
         case = self.chk_case.isChecked() if mode == 'plain' else False
 
-        current_content = self.lineView.toPlainText()
+        search = {'query': query, 'mode': mode, 'case_sensitive': case}
+        self._start_search_worker(SearchWorker(snapshot, query, mode, case), search)
 
+    def _start_search_worker(self, worker: SearchWorker, search: dict):
+        """검색 워커 실행 (완료 시 on_search_finished, 결과는 search 조건과 함께 기록)"""
+        self.stop_search()
+
+        self._running_search = search
+        self._search_span = self.tracer.begin('search', 'search', bytes=self.file_size, **search)
         self.search_thread = QtCore.QThread(self)
-        self.search_worker = SearchWorker(current_content, query, mode, case)
+        self.search_worker = worker
         self.search_worker.moveToThread(self.search_thread)
         self.search_thread.started.connect(self.search_worker.run)
         self.search_worker.progress.connect(self.prog.setValue)
@@ -1092,35 +1509,270 @@ class TabContent(QtWidgets.QWidget):
 
     def on_search_failed(self, msg: str):
         self.stop_search()
+        self.tracer.end(self._search_span, error=msg)
+        self._search_span = None
         QtWidgets.QMessageBox.critical(self, "검색 실패", msg)
         self.show_status_message("검색 실패: " + msg, 5000)
 
     def on_search_finished(self, results: List[SearchResult], duration: float):
         """검색 완료"""
+        from_cache = getattr(self.sender(), 'from_cache', False)
         self.stop_search()
+        self.present_results(results, f"검색 결과 : {len(results)}개 | Searching duration : {duration:.2f} sec(s)")
+        self.current_search = self._running_search
+        self.tracer.end(self._search_span, lines=self.snapshot().line_count, results=len(results),
+                        worker_sec=round(duration, 4))
+        self._search_span = None
+
+        # 세션 복원: 같은 파일/검색이면 저장된 마킹 복원
+        marks, self._restore_marks = self._restore_marks, None
+        if marks:
+            self.resultsModel.set_marked_rows([row for row in marks if row < len(results)])
+            self.update_bookmark_labels()
+
+        # 세션 복원용 검색결과 캐시는 종료 시가 아니라 지금 백그라운드로 기록
+        # (편집 후 저장하지 않은 문서는 디스크 파일과 달라서 캐시하지 않음)
+        if not from_cache and not self.is_modified and self.current_file_path:
+            self.start_result_cache_save(self.current_search, results)
+
+    def start_result_cache_save(self, search: dict, results: List[SearchResult]):
+        """검색결과 캐시 기록 워커 실행 (이전 기록은 중지)"""
+        self.stop_result_cache()
+        self.result_cache_thread = QtCore.QThread(self)
+        self.result_cache_worker = ResultCacheSaveWorker(self.current_file_path, search, results)
+        self.result_cache_worker.moveToThread(self.result_cache_thread)
+        self.result_cache_thread.started.connect(self.result_cache_worker.run)
+        self.result_cache_worker.finished.connect(self.on_result_cache_finished)
+        self.result_cache_worker.failed.connect(self.on_result_cache_failed)
+        self.result_cache_thread.start()
+
+    def stop_result_cache(self):
+        """진행 중인 캐시 기록 중지 (끝나지 않은 캐시는 남기지 않고, 복원 시 다시 검색)"""
+        if self.result_cache_worker:
+            self.result_cache_worker.stop()
+        if self.result_cache_thread:
+            self.result_cache_thread.quit()
+            self.result_cache_thread.wait()
+        self.result_cache_worker = None
+        self.result_cache_thread = None
+
+    def on_result_cache_finished(self, saved: bool):
+        if self.result_cache_worker is None or self.sender() is not self.result_cache_worker:
+            return
+        self.stop_result_cache()
+
+    def on_result_cache_failed(self, msg: str):
+        if self.result_cache_worker is None or self.sender() is not self.result_cache_worker:
+            return
+        self.stop_result_cache()
+        self.show_status_message(f"검색결과 캐시 저장 실패: {msg}", 5000)
+
+    def present_results(self, results: List[SearchResult], status_text: str):
+        """결과 리스트를 tblResults에 표시하고 첫 결과로 이동"""
         self.current_results = results
+        self.current_search = None
 
-        self.apply_context_snippets_to_current_results()
-        self.resultsModel.set_results(results)
+        with self.tracer.span('result model ingest', 'results', lines=len(results)):
+            self.apply_context_snippets_to_current_results()
+            self.resultsModel.set_results(results)
 
-        self.tblResults.resizeRowsToContents()
+        with self.tracer.span('row resize', 'results', lines=len(results)):
+            self.tblResults.row_sizer.reset(sum(self.get_context_counts()), new_results=True)
 
-        self.result_search_query = ""
-        self.result_search_index = -1
-        self.result_search_matches = []
-        self.lbl_result_search_status.setText("")
+        self.reset_result_search()
+        self.reset_result_filter()
 
         # 좌측 하단 라벨에 검색 결과 건수 + 검색 시간 표시
-        self.lbl_status.setText(f"검색 결과 : {len(results)}개 | Searching duration : {duration:.2f} sec(s)")
+        self.lbl_status.setText(status_text)
 
         if results:
             self.current_result_index = 0
-            self.goto_result(results[0])
+            with self.tracer.span('highlight', 'results', lines=1):
+                self.goto_result(results[0])
             self.show_status_message(f"검색 완료: {len(results)}건", 8000)
         else:
             self.current_result_index = -1
             self.show_status_message("검색 결과 없음", 5000)
 
+        # 필터 입력이 있으면 새 결과에도 그대로 적용
+        if results and self.edt_result_filter.text():
+            self.apply_result_filter()
+
+    # 즐겨찾기 일괄 실행(Triage)
+    def show_favorite_triage(self):
+        """즐겨찾기 일괄 실행 다이얼로그 표시"""
+        if not self.snapshot():
+            QtWidgets.QMessageBox.information(self, "안내", "먼저 (dumpstate) 파일을 여세요.")
+            return
+        if self.triage_dialog is None:
+            from andyfinder.dialogs.triage_dialog import FavoriteTriageDialog
+            self.triage_dialog = FavoriteTriageDialog(self, self)
+        self.triage_dialog.refresh_scopes()
+        self.triage_dialog.show()
+        self.triage_dialog.raise_()
+        self.triage_dialog.activateWindow()
+
+    def show_triage_results(self, summary):
+        """Triage 요약의 한 즐겨찾기를 일반 검색 결과로 표시 (drill-down)"""
+        self.stop_search()
+        lines = self.snapshot().lines
+        rx = compile_favorite_pattern(summary.pattern)
+        results = [
+            SearchResult(line=idx, snippet=lines[idx],
+                         matches=[(m.start(), m.end()) for m in rx.finditer(lines[idx])])
+            for idx in summary.lines if idx < len(lines)
+        ]
+
+        # 같은 검색을 F5로 재실행할 수 있도록 검색어/모드도 맞춰 둠
+        self.edt_query.setText(summary.pattern)
+        self.cmb_mode.setCurrentIndex(self.cmb_mode.findText("정규식"))
+
+        self.present_results(results, f"Triage [{summary.name}] : {len(results)}개")
+
+    # 검색결과 내보내기
+    def show_export_dialog(self, scope: str = 'all'):
+        """검색결과 내보내기 다이얼로그 표시"""
+        if not self.current_results:
+            QtWidgets.QMessageBox.information(self, "안내", "내보낼 검색 결과가 없습니다.")
+            return
+        if self.export_dialog is None:
+            from andyfinder.dialogs.export_dialog import ExportDialog
+            self.export_dialog = ExportDialog(self, self)
+        self.export_dialog.prepare(scope)
+        self.export_dialog.show()
+        self.export_dialog.raise_()
+        self.export_dialog.activateWindow()
+
+    def export_rows(self, scope: str) -> Optional[List[int]]:
+        """내보내기 범위의 결과 row 리스트 (오름차순), 전체면 None"""
+        model = self.resultsModel
+        if scope == 'marked':
+            return list(model.marked_rows)
+        if scope == 'selected':
+            sel_model = self.tblResults.selectionModel()
+            if sel_model is None:
+                return []
+            return sorted({model.source_row(idx.row()) for idx in sel_model.selectedIndexes()})
+        if scope == 'filter' and model.is_filtered():
+            return list(model.visible_source_rows())
+        return None
+
+    # 타이밍 패널
+    def show_timing_panel(self):
+        """타이밍 패널 표시 (이 탭의 Tracer 구간)"""
+        if self.timing_dialog is None:
+            from andyfinder.dialogs.timing_dialog import TimingDialog
+            self.timing_dialog = TimingDialog(self, self)
+        self.timing_dialog.show()
+        self.timing_dialog.raise_()
+        self.timing_dialog.activateWindow()
+
+    # 메모리 사용량
+    def memory_breakdown(self) -> List[Tuple[str, int, str]]:
+        """탭 메모리 사용량 추정 [(항목, 바이트, 상세)] - 여러 구조가 공유하는 객체는 한 번만 계산"""
+        seen: set = set()
+        views = (("lineView", self.lineView), ("lineView_clone", self.lineView_clone))
+        rows = [("원본 텍스트 (content)", estimate_size(self.content, seen), f"{len(self.content):,} chars")]
+
+        for name, view in views:
+            doc = view.document()
+            rows.append((f"{name} 문서", estimate_document_size(doc.characterCount(), doc.blockCount()),
+                         f"{doc.blockCount():,} 블록, undo {doc.availableUndoSteps():,}단계"))
+
+        # 스냅샷 텍스트는 보통 content와 같은 객체 (로딩 시 그대로 등록)
+        main_lines = None
+        for name, view in views:
+            if not view.snapshot_cache.is_cached():
+                rows.append((f"{name} 스냅샷 (라인 리스트)", 0, "없음"))
+                continue
+            snapshot = view.snapshot_cache.snapshot()
+            lines, starts = snapshot.cached_index()
+            size = estimate_size(snapshot.text, seen) + estimate_size(lines, seen) + estimate_size(starts, seen)
+            if view is self.lineView:
+                main_lines = lines
+            detail = f"라인 {len(lines):,}개" if lines is not None else "라인 리스트 없음"
+            rows.append((f"{name} 스냅샷 (라인 리스트)", size, detail))
+
+        objects, snippets, shared = estimate_results_size(self.current_results, main_lines)
+        rows.append(("검색결과 (current_results)", objects, f"{len(self.current_results):,}건"))
+        rows.append(("검색결과 snippet", snippets, f"라인 리스트와 공유 {shared:,}건 제외"))
+        if self.search_worker is not None:
+            # 끝난 워커도 다음 검색 전까지 스냅샷을 잡고 있음 (파일을 다시 열었으면 이전 텍스트 전체)
+            snapshot = self.search_worker.snapshot
+            running = self.search_thread is not None and self.search_thread.isRunning()
+            rows.append(("검색 워커 스냅샷",
+                         estimate_size(snapshot.text, seen) + sum(estimate_size(part, seen)
+                                                                  for part in snapshot.cached_index()),
+                         "실행 중" if running else "마지막 검색 워커가 보관 중 (현재 스냅샷과 공유분 제외)"))
+
+        model = self.resultsModel
+        rows.append(("결과 필터/마킹",
+                     estimate_size(model.marked_rows, seen) + estimate_size(model.visible_source_rows(), seen),
+                     f"마킹 {len(model.marked_rows):,}건, 표시 {model.total_count():,}건"))
+
+        selections = sum(len(view.extraSelections()) for _, view in views)
+        rows.append(("Extra selections", selections * QT_EXTRA_SELECTION_SIZE, f"{selections:,}개"))
+
+        rows.append(("캐시: 결과 내 검색/필터",
+                     estimate_size(self.result_search_cache, seen) + estimate_size(self.result_filter_cache, seen),
+                     f"{len(self.result_search_cache) + len(self.result_filter_cache):,}개"))
+        rows.append(("캐시: 에디터 찾기 (Ctrl+F)", sum(estimate_size(view.find_cache, seen) for _, view in views),
+                     f"{sum(len(view.find_cache) for _, view in views):,}개"))
+        rows.append(("캐시: 오버뷰 룰러", sum(view.overview_ruler.cache_size(seen) for _, view in views), ""))
+        delegate = self.tblResults.itemDelegateForColumn(1)
+        rows.append(("캐시: 결과 snippet 레이아웃", delegate.cache_size(seen),
+                     f"{delegate.cache_count():,}개 (Qt 내부 글리프 캐시 제외)"))
+        return rows
+
+    def free_caches(self) -> Optional[int]:
+        """다시 만들 수 있는 캐시 해제 - 결과 내 검색/필터 인덱스, 에디터 찾기, 오버뷰 룰러,
+        snippet 레이아웃, 스냅샷 라인 리스트 (다음 사용 시 다시 생성), 끝난 검색 워커. 줄어든 RSS 반환 (측정 불가면 None)"""
+        before = process_rss()
+        self.result_search_cache.clear()
+        self.result_filter_cache.clear()
+        for view in (self.lineView, self.lineView_clone):
+            view.find_cache.clear()
+            view.overview_ruler.clear_cache()
+            if view.snapshot_cache.is_cached():
+                view.snapshot_cache.snapshot().drop_index()
+        self.tblResults.itemDelegateForColumn(1).clear_cache()
+        if self.search_thread is not None and not self.search_thread.isRunning():
+            self.search_worker = None
+            self.search_thread = None
+        gc.collect()
+
+        after = process_rss()
+        freed = before - after if before is not None and after is not None else None
+        message = "캐시 해제" + (f" (RSS {format_bytes(freed)} 감소)" if freed is not None else "")
+        self.show_status_message(message, 5000)
+        return freed
+
+    # 검색결과 그룹 집계
+    def show_group_by(self):
+        """검색결과 그룹 집계 다이얼로그 표시"""
+        if not self.current_results:
+            QtWidgets.QMessageBox.information(self, "안내", "집계할 검색 결과가 없습니다.")
+            return
+        if self.group_dialog is None:
+            from andyfinder.dialogs.group_dialog import GroupByDialog
+            self.group_dialog = GroupByDialog(self, self)
+        self.group_dialog.show()
+        self.group_dialog.raise_()
+        self.group_dialog.activateWindow()
+
+    def goto_source_result(self, source: int):
+        """결과 인덱스로 이동 (필터에 걸러진 결과면 lineView만 이동)"""
+        if source < 0 or source >= len(self.current_results):
+            return
+        row = self.resultsModel.view_row(source)
+        if row >= 0:
+            self.goto_result_number(row + 1)
+            return
+        r = self.current_results[source]
+        self.lineView.gotoLine(r.line + 1)
+        self.update_all_highlights(r)
+        self.show_status_message("필터에 걸러진 결과입니다 (lineView만 이동)", 3000)
+
     def goto_result_from_table(self, index: QModelIndex):
         r = self.resultsModel.get(index.row())
         self.current_result_index = index.row()
@@ -1140,14 +1792,14 @@ class TabContent(QtWidgets.QWidget):
         self.tblResults.setFocus()
 
     def goto_result(self, r: SearchResult):
-        if not self.lineView.toPlainText():
+        if self.lineView.document().isEmpty():
             return
 
         line_number = r.line + 1
         self.lineView.gotoLine(line_number)
         self.update_all_highlights(r)
 
-        if self.current_result_index >= 0 and self.current_result_index < self.resultsModel.rowCount():
+        if self.resultsModel.ensure_loaded(self.current_result_index):
             tidx = self.resultsModel.index(self.current_result_index, 0)
             self.tblResults.selectRow(tidx.row())
             self.tblResults.scrollTo(tidx, QtWidgets.QAbstractItemView.PositionAtCenter)
@@ -1181,11 +1833,12 @@ class TabContent(QtWidgets.QWidget):
     def on_color_clear_clicked(self):
         self.color_keywords = []
         self.edt_color_keywords.clear()
-        self.lineView.color_highlight_selections = []
-        self.lineView_clone.color_highlight_selections = []
+        self.lineView.keyword_highlighter.clear()
+        self.lineView_clone.keyword_highlighter.clear()
+        self.update_overview_rulers()
 
-        if self.current_result_index >= 0 and self.current_result_index < len(self.current_results):
-            result = self.current_results[self.current_result_index]
+        if 0 <= self.current_result_index < self.resultsModel.total_count():
+            result = self.resultsModel.get(self.current_result_index)
             self.update_all_highlights(result)
         else:
             self.lineView.highlightCurrentLine()
@@ -1193,44 +1846,17 @@ class TabContent(QtWidgets.QWidget):
         self.show_status_message("Color 설정 초기화", 3000)
 
     def apply_color_highlights(self):
-        """lineView와 lineView_clone 모두에 color highlight 적용"""
-        if not self.lineView.toPlainText():
+        """lineView와 lineView_clone 모두에 color highlight 적용 (보이는 블록만 즉시, 나머지는 스크롤 시)"""
+        if not self.snapshot():
             return
 
-        color_selections = []
-        color_selections_clone = []
+        with self.tracer.span('highlight keywords', 'highlight', keywords=len(self.color_keywords)):
+            self.lineView.keyword_highlighter.set_keywords(self.color_keywords)
+            self.lineView_clone.keyword_highlighter.set_keywords(self.color_keywords)
+        self.update_overview_rulers()
 
-        if self.color_keywords:
-            content = self.lineView.toPlainText()
-            for keyword, color in self.color_keywords:
-                try:
-                    pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-                    for match in pattern.finditer(content):
-                        # lineView용
-                        selection = QtWidgets.QTextEdit.ExtraSelection()
-                        selection.format.setBackground(color)
-                        cursor = QtGui.QTextCursor(self.lineView.document())
-                        cursor.setPosition(match.start())
-                        cursor.setPosition(match.end(), QtGui.QTextCursor.KeepAnchor)
-                        selection.cursor = cursor
-                        color_selections.append(selection)
-
-                        # lineView_clone용
-                        selection_clone = QtWidgets.QTextEdit.ExtraSelection()
-                        selection_clone.format.setBackground(color)
-                        cursor_clone = QtGui.QTextCursor(self.lineView_clone.document())
-                        cursor_clone.setPosition(match.start())
-                        cursor_clone.setPosition(match.end(), QtGui.QTextCursor.KeepAnchor)
-                        selection_clone.cursor = cursor_clone
-                        color_selections_clone.append(selection_clone)
-                except re.error:
-                    pass
-
-        self.lineView.color_highlight_selections = color_selections
-        self.lineView_clone.color_highlight_selections = color_selections_clone
-
-        if self.current_result_index >= 0 and self.current_result_index < len(self.current_results):
-            result = self.current_results[self.current_result_index]
+        if 0 <= self.current_result_index < self.resultsModel.total_count():
+            result = self.resultsModel.get(self.current_result_index)
             self.update_all_highlights(result)
         else:
             self.lineView.highlightCurrentLine()
@@ -1238,6 +1864,13 @@ class TabContent(QtWidgets.QWidget):
             self.lineView_clone.highlightCurrentLine()
 
     def search_in_results_next(self):
+        self._search_in_results(forward=True)
+
+    def search_in_results_prev(self):
+        self._search_in_results(forward=False)
+
+    def _search_in_results(self, forward: bool):
+        """결과 내 검색: (결과 세대, 검색어)별 캐시된 인덱스로 이동, 없으면 백그라운드 생성"""
         query = self.edt_result_search.text().strip()
         if not query:
             return
@@ -1246,126 +1879,229 @@ class TabContent(QtWidgets.QWidget):
             self.lbl_result_search_status.setText("검색 결과가 없습니다")
             return
 
-        # 검색어가 바뀌면 매칭 리스트 재생성
-        if query != self.result_search_query:
-            self.result_search_query = query
-            self.result_search_matches = []
-
+        matches = self.result_search_cache.get((self.results_generation, query))
+        if matches is None:
             try:
-                pattern = re.compile(query, re.IGNORECASE)
-
-                for idx, result in enumerate(self.current_results):
-                    line_str = str(result.line + 1)
-                    snippet = result.snippet
-
-                    if pattern.search(line_str) or pattern.search(snippet):
-                        self.result_search_matches.append(idx)
-
+                re.compile(query, re.IGNORECASE)
             except re.error as e:
                 self.lbl_result_search_status.setText(f"정규식 오류: {e}")
                 return
+            self._start_result_search(query, forward)
+            return
+
+        self.result_search_cache.move_to_end((self.results_generation, query))
+        self.result_search_query = query
+        self.result_search_matches = matches
+        self._goto_result_search_match(forward)
 
-        if not self.result_search_matches:
+    def _goto_result_search_match(self, forward: bool):
+        """현재 row 기준 이전/다음 매칭으로 이동 (bisect, O(log n))"""
+        matches = self.result_search_matches
+        if not matches:
             self.lbl_result_search_status.setText("일치하는 항목 없음")
             return
 
         is_recursive = self.chk_recursive_search.isChecked()
-
         current_row = self.tblResults.currentIndex().row()
-        if current_row < 0:
-            current_row = -1
-
-        # 다음 매칭 찾기
-        next_match_idx = None
-        for idx in self.result_search_matches:
-            if idx > current_row:
-                next_match_idx = idx
-                break
-
-        if next_match_idx is None:
-            if is_recursive and self.result_search_matches:
-                next_match_idx = self.result_search_matches[0]
-            else:
-                self.lbl_result_search_status.setText(
-                    f"마지막 매칭 (전체 {len(self.result_search_matches)}개)"
-                )
-                return
+
+        if forward:
+            pos = bisect_right(matches, current_row if current_row >= 0 else -1)
+            if pos >= len(matches):
+                if not is_recursive:
+                    self.lbl_result_search_status.setText(f"마지막 매칭 (전체 {len(matches)}개)")
+                    return
+                pos = 0
+        else:
+            pos = bisect_left(matches, current_row if current_row >= 0 else self.resultsModel.total_count()) - 1
+            if pos < 0:
+                if not is_recursive:
+                    self.lbl_result_search_status.setText(f"첫 번째 매칭 (전체 {len(matches)}개)")
+                    return
+                pos = len(matches) - 1
 
         # 이동
-        self.current_result_index = next_match_idx
-        result = self.current_results[next_match_idx]
-        self.goto_result(result)
-
-        # 현재 매칭의 순서 계산
-        match_position = self.result_search_matches.index(next_match_idx) + 1
-        self.lbl_result_search_status.setText(
-            f"{match_position} / {len(self.result_search_matches)}"
+        self.result_search_index = pos
+        self.current_result_index = matches[pos]
+        self.goto_result(self.resultsModel.get(matches[pos]))
+        self.lbl_result_search_status.setText(f"{pos + 1} / {len(matches)}")
+
+    def _start_result_search(self, query: str, forward: bool):
+        """결과 내 검색 인덱스를 워커 스레드에서 생성 (완료 후 forward 방향으로 이동)"""
+        self._result_search_forward = forward
+        if self.result_search_worker and self.result_search_worker.query == query \
+                and self.result_search_worker.generation == self.results_generation:
+            return  # 같은 인덱스를 이미 생성 중
+
+        self.stop_result_search()
+
+        self.result_search_thread = QtCore.QThread(self)
+        # 필터 중이면 표시 중인 결과(인덱스 = 뷰 row)만 대상으로 인덱스 생성
+        self.result_search_worker = ResultSearchWorker(
+            self.resultsModel.visible_results(), query, self.results_generation
         )
+        self.result_search_worker.moveToThread(self.result_search_thread)
+        self.result_search_thread.started.connect(self.result_search_worker.run)
+        self.result_search_worker.progress.connect(self.on_result_search_progress)
+        self.result_search_worker.failed.connect(self.on_result_search_failed)
+        self.result_search_worker.finished.connect(self.on_result_search_finished)
+        self.lbl_result_search_status.setText("인덱싱 중... 0%")
+        self.result_search_thread.start()
+
+    def stop_result_search(self):
+        if self.result_search_worker:
+            self.result_search_worker.stop()
+        if self.result_search_thread:
+            self.result_search_thread.quit()
+            self.result_search_thread.wait()
+        self.result_search_worker = None
+        self.result_search_thread = None
+
+    def on_result_search_progress(self, value: int):
+        if self.result_search_worker:
+            self.lbl_result_search_status.setText(f"인덱싱 중... {value}%")
+
+    def on_result_search_failed(self, msg: str):
+        self.stop_result_search()
+        self.lbl_result_search_status.setText(f"결과 내 검색 실패: {msg}")
+
+    def on_result_search_finished(self, matches: List[int], query: str, generation: int, duration: float):
+        self.stop_result_search()
+        if generation != self.results_generation:
+            return  # 그 사이 결과가 바뀜
+
+        self.result_search_cache[(generation, query)] = matches
+        while len(self.result_search_cache) > self.RESULT_SEARCH_CACHE_SIZE:
+            self.result_search_cache.popitem(last=False)
+
+        # 그 사이 검색어가 바뀌지 않았으면 요청했던 방향으로 이동
+        if self.edt_result_search.text().strip() == query:
+            self.result_search_query = query
+            self.result_search_matches = matches
+            self._goto_result_search_match(self._result_search_forward)
+
+    def reset_result_search(self):
+        """결과 세트/snippet이 바뀌면 결과 내 검색 상태와 캐시 초기화"""
+        self.stop_result_search()
+        self.results_generation += 1
+        self.result_search_cache.clear()
+        self.result_search_query = ""
+        self.result_search_index = -1
+        self.result_search_matches = []
+        self.lbl_result_search_status.setText("")
 
-    def search_in_results_prev(self):
-        query = self.edt_result_search.text().strip()
-        if not query:
+    # 결과 필터
+    def apply_result_filter(self):
+        """필터 바 입력으로 결과 필터링 (캐시 -> 이전 필터 결과 내 점진적 필터링 -> 전체)"""
+        self._result_filter_timer.stop()
+        mode = self.cmb_filter_mode.currentData()
+        query = self.edt_result_filter.text().strip()
+
+        if not query or not self.current_results:
+            self.stop_result_filter()
+            if self.resultsModel.is_filtered():
+                self._set_result_filter(None)
+            self.lbl_result_filter_status.setText("")
             return
 
-        if not self.current_results:
-            self.lbl_result_search_status.setText("검색 결과가 없습니다")
+        rows = self.result_filter_cache.get((mode, query))
+        if rows is not None:
+            self.result_filter_cache.move_to_end((mode, query))
+            self._set_result_filter(rows)
+            self.lbl_result_filter_status.setText(f"{len(rows):,} / {len(self.current_results):,}")
             return
 
-        # 검색어가 바뀌면 매칭 리스트 재생성
-        if query != self.result_search_query:
-            self.result_search_query = query
-            self.result_search_matches = []
-
-            try:
-                pattern = re.compile(query, re.IGNORECASE)
-
-                for idx, result in enumerate(self.current_results):
-                    line_str = str(result.line + 1)
-                    snippet = result.snippet
-
-                    if pattern.search(line_str) or pattern.search(snippet):
-                        self.result_search_matches.append(idx)
-
-            except re.error as e:
-                self.lbl_result_search_status.setText(f"정규식 오류: {e}")
-                return
-
-        if not self.result_search_matches:
-            self.lbl_result_search_status.setText("일치하는 항목 없음")
+        # 텍스트 모드에서 필터어를 늘린 경우, 가장 긴 이전 필터 결과 안에서만 다시 거름
+        candidates = None
+        base = ""
+        for (cached_mode, cached_query), cached_rows in self.result_filter_cache.items():
+            if cached_mode == mode and len(cached_query) > len(base) \
+                    and is_incremental_extension(mode, cached_query, query):
+                base, candidates = cached_query, cached_rows
+
+        self.stop_result_filter()
+
+        lines = self.snapshot().lines if mode == 'field' else []
+        self.result_filter_thread = QtCore.QThread(self)
+        self.result_filter_worker = ResultFilterWorker(
+            self.current_results, candidates, mode, query, lines, self.result_filter_generation,
+            self.result_columns
+        )
+        self.result_filter_worker.moveToThread(self.result_filter_thread)
+        self.result_filter_thread.started.connect(self.result_filter_worker.run)
+        self.result_filter_worker.progress.connect(self.on_result_filter_progress)
+        self.result_filter_worker.columns_built.connect(self.on_result_columns_built)
+        self.result_filter_worker.failed.connect(self.on_result_filter_failed)
+        self.result_filter_worker.finished.connect(self.on_result_filter_finished)
+        self.lbl_result_filter_status.setText("필터링 중... 0%")
+        self.result_filter_thread.start()
+
+    def stop_result_filter(self):
+        if self.result_filter_worker:
+            self.result_filter_worker.stop()
+        if self.result_filter_thread:
+            self.result_filter_thread.quit()
+            self.result_filter_thread.wait()
+        self.result_filter_worker = None
+        self.result_filter_thread = None
+
+    def on_result_filter_progress(self, value: int):
+        if self.result_filter_worker:
+            self.lbl_result_filter_status.setText(f"필터링 중... {value}%")
+
+    def on_result_columns_built(self, columns, generation: int):
+        if generation == self.result_filter_generation:
+            self.result_columns = columns
+
+    def on_result_filter_failed(self, msg: str):
+        self.stop_result_filter()
+        self.lbl_result_filter_status.setText(f"필터 오류: {msg}")
+
+    def on_result_filter_finished(self, rows: List[int], mode: str, query: str, generation: int, duration: float):
+        self.stop_result_filter()
+        if generation != self.result_filter_generation:
+            return  # 그 사이 결과가 바뀜
+
+        self.result_filter_cache[(mode, query)] = rows
+        while len(self.result_filter_cache) > self.RESULT_FILTER_CACHE_SIZE:
+            self.result_filter_cache.popitem(last=False)
+
+        # 그 사이 필터가 바뀌었으면 최신 입력으로 다시 실행 (방금 결과는 점진적 필터링에 재사용)
+        if (self.cmb_filter_mode.currentData(), self.edt_result_filter.text().strip()) != (mode, query):
+            self.apply_result_filter()
             return
 
-        is_recursive = self.chk_recursive_search.isChecked()
+        self._set_result_filter(rows)
+        self.lbl_result_filter_status.setText(
+            f"{len(rows):,} / {len(self.current_results):,} | {duration:.2f} sec(s)"
+        )
 
+    def _set_result_filter(self, rows: Optional[List[int]]):
+        """필터 결과를 모델에 적용하고, 현재 결과가 남아 있으면 선택 유지"""
+        model = self.resultsModel
         current_row = self.tblResults.currentIndex().row()
-        if current_row < 0:
-            current_row = len(self.current_results)
-
-        # 이전 매칭 찾기
-        prev_match_idx = None
-        for idx in reversed(self.result_search_matches):
-            if idx < current_row:
-                prev_match_idx = idx
-                break
-
-        if prev_match_idx is None:
-            if is_recursive and self.result_search_matches:
-                prev_match_idx = self.result_search_matches[-1]
-            else:
-                self.lbl_result_search_status.setText(
-                    f"첫 번째 매칭 (전체 {len(self.result_search_matches)}개)"
-                )
-                return
+        current_source = model.source_row(current_row) if current_row >= 0 else -1
 
-        # 이동
-        self.current_result_index = prev_match_idx
-        result = self.current_results[prev_match_idx]
-        self.goto_result(result)
-
-        # 현재 매칭의 순서 계산
-        match_position = self.result_search_matches.index(prev_match_idx) + 1
-        self.lbl_result_search_status.setText(
-            f"{match_position} / {len(self.result_search_matches)}"
-        )
+        model.set_filter(rows)
+        self.tblResults.row_sizer.reset(new_results=True)
+        # 결과 내 검색 인덱스는 뷰 row 기준이므로 다시 만들어야 함
+        self.reset_result_search()
+
+        row = model.view_row(current_source) if current_source >= 0 else -1
+        if row >= 0 and model.ensure_loaded(row):
+            self.current_result_index = row
+            index = model.index(row, 0)
+            self.tblResults.setCurrentIndex(index)
+            self.tblResults.scrollTo(index, QtWidgets.QAbstractItemView.PositionAtCenter)
+        else:
+            self.current_result_index = -1
+
+    def reset_result_filter(self):
+        """결과 세트/snippet이 바뀌면 필터 캐시 초기화 (필터 입력은 유지)"""
+        self.stop_result_filter()
+        self.result_filter_generation += 1
+        self.result_filter_cache.clear()
+        self.result_columns = None
+        self.lbl_result_filter_status.setText("")
 
     # 설정 저장/불러오기를 위한 메서드
     def get_config(self) -> dict:
@@ -1433,13 +2169,7 @@ class TabContent(QtWidgets.QWidget):
 
             # 마킹된 행
             marked_rows = config.get('marked_rows', [])
-            self.resultsModel.marked_rows = set(marked_rows)
-            if marked_rows:
-                self.resultsModel.dataChanged.emit(
-                    self.resultsModel.index(0, 0),
-                    self.resultsModel.index(self.resultsModel.rowCount() - 1,
-                                            self.resultsModel.columnCount() - 1)
-                )
+            self.resultsModel.set_marked_rows(marked_rows)
 
         except Exception as e:
             QtWidgets.QMessageBox.warning(self, "경고", f"설정 적용 중 일부 오류가 발생했습니다: {e}")
@@ -1450,33 +2180,17 @@ class TabContent(QtWidgets.QWidget):
         NUL 문자를 제거하여 복사
         (start_line, end_line 모두 포함)
         """
-        if start_line == end_line:
-            # 한 줄만 복사
-            content = self.lineView.toPlainText()
-            lines = content.split('\n')
-
-            if start_line < 1 or start_line > len(lines):
-                QtWidgets.QMessageBox.warning(self, "경고", "라인 번호가 범위를 벗어났습니다.")
-                return
-
-            selected_text = lines[start_line - 1]
-        else:
-            # 범위 복사
-            if start_line > end_line:
-                start_line, end_line = end_line, start_line
+        if start_line > end_line:
+            start_line, end_line = end_line, start_line
 
-            content = self.lineView.toPlainText()
-            lines = content.split('\n')
+        snapshot = self.snapshot()
 
-            if start_line < 1 or end_line > len(lines):
-                QtWidgets.QMessageBox.warning(self, "경고", "라인 번호가 범위를 벗어났습니다.")
-                return
-
-            selected_lines = lines[start_line - 1:end_line]
-            selected_text = '\n'.join(selected_lines)
+        if start_line < 1 or end_line > snapshot.line_count:
+            QtWidgets.QMessageBox.warning(self, "경고", "라인 번호가 범위를 벗어났습니다.")
+            return
 
-        # NUL 문자 제거
-        selected_text = selected_text.replace('\x00', '')
+        # 범위만 잘라낸 뒤 replace 1회로 NUL 문자 제거
+        selected_text = snapshot.text_range(start_line - 1, end_line - 1).replace('\x00', '')
 
         try:
             # 클립보드에 복사
@@ -1496,26 +2210,22 @@ class TabContent(QtWidgets.QWidget):
         start_line부터 파일 끝까지의 내용을 클립보드에 복사
         NUL 문자를 제거하여 복사
         """
-        content = self.lineView.toPlainText()
-        lines = content.split('\n')
+        snapshot = self.snapshot()
+        last_line = snapshot.line_count
 
-        if start_line < 1 or start_line > len(lines):
+        if start_line < 1 or start_line > last_line:
             QtWidgets.QMessageBox.warning(self, "경고", "라인 번호가 범위를 벗어났습니다.")
             return
 
-        # start_line부터 끝까지 추출
-        selected_lines = lines[start_line - 1:]
-        selected_text = '\n'.join(selected_lines)
-
-        # NUL 문자 제거
-        selected_text = selected_text.replace('\x00', '')
+        # start_line부터 끝까지 잘라낸 뒤 replace 1회로 NUL 문자 제거
+        selected_text = snapshot.text_range(start_line - 1, last_line - 1).replace('\x00', '')
 
         try:
             # 클립보드에 복사
             clipboard = QtWidgets.QApplication.clipboard()
             clipboard.setText(selected_text)
 
-            line_count = len(selected_lines)
+            line_count = last_line - start_line + 1
             self.show_status_message(
                 f"라인 {start_line}~끝 복사됨 ({line_count}줄) [NUL 문자 제거됨]",
                 3000
@@ -1528,6 +2238,11 @@ class TabContent(QtWidgets.QWidget):
         lineview_bookmarks = len(self.lineView.bookmarks)
         lineview_clone_bookmarks = len(self.lineView_clone.bookmarks)
         tblresults_marks = len(self.resultsModel.marked_rows)
+        total = self.resultsModel.total_count()
+        loaded = self.resultsModel.loaded_count()
+        results_text = f"{total:,}건" if loaded >= total else f"{total:,}건, 표시 {loaded:,}"
+        if self.resultsModel.is_filtered():
+            results_text = f"{results_text} / 전체 {self.resultsModel.source_count():,}건"
 
         # lable_lineView: lineView 북마크 개수 표시
         self.lable_lineView.setText(f"Left Viewer (BM:{lineview_bookmarks}) | {self.lineView.font().pointSize()}pt")
@@ -1536,7 +2251,40 @@ class TabContent(QtWidgets.QWidget):
         self.lable_lineView_clone.setText(f"Right Viewer (BM:{lineview_clone_bookmarks}) | {self.lineView_clone.font().pointSize()}pt")
 
         # lable_tblResults: tblResults 마킹 개수 표시
-        self.lable_tblResults.setText(f"Results (Mark:{tblresults_marks}) | {self.tblResults.font().pointSize()}pt")
+        self.lable_tblResults.setText(f"Results {results_text} (Mark:{tblresults_marks}) | {self.tblResults.font().pointSize()}pt")
+
+        self.update_overview_rulers()
+
+    def update_overview_rulers(self):
+        """lineView/lineView_clone 오버뷰 룰러의 라인 소스 갱신 (키가 바뀐 소스만 다시 계산)"""
+        results = self.resultsModel.rows
+        marks = self.resultsModel.marked_rows
+        for editor in (self.lineView, self.lineView_clone):
+            ruler = editor.overview_ruler
+            ruler.set_source('results', (id(results), self.result_filter_generation),
+                             (lambda: result_lines_job(results)) if results else None)
+            ruler.set_source('marks', marks.version,
+                             (lambda: row_lines_job(results, marks)) if marks else None)
+            bookmarks = editor.bookmarks
+            ruler.set_source('bookmarks', bookmarks.version,
+                             (lambda b=bookmarks: bookmark_lines_job(b)) if bookmarks else None)
+            highlighter = editor.keyword_highlighter
+            pattern = highlighter.pattern
+            cache = editor.snapshot_cache
+            current = ruler.source_key('keywords')
+            if pattern and not cache.is_cached() and current is not None and current[1] == highlighter.generation:
+                # 편집 후 스냅샷이 없으면 이전 키워드 분포 유지 (스냅샷이 다시 만들어진 뒤 갱신)
+                continue
+            ruler.set_source('keywords', (cache.revision, highlighter.generation),
+                             (lambda c=cache, r=cache.revision, p=pattern: self._keyword_job(c, r, p))
+                             if pattern else None)
+
+    @staticmethod
+    def _keyword_job(cache: SnapshotCache, revision: int, pattern):
+        """키워드 분포 job - 스냅샷이 없거나 바뀌었으면 GUI 스레드에서 toPlainText 복사를 하지 않도록 None"""
+        if revision != cache.revision or not cache.is_cached():
+            return None
+        return keyword_lines_job(cache.snapshot(), pattern)
 
     def update_lineview_font_label(self, size: int):
         """폰트 변경 시 라벨 업데이트"""
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+텍스트 파일 로딩 (인코딩 감지 + 읽기 + 디코딩) - Qt 비의존
+
+GUI의 FileLoader 워커와 명령줄 검색(cli)이 같은 경로로 파일을 읽는다.
+"""
+import io
+import os
+from typing import Callable, Optional, Tuple
+
+from andyfinder.tracing import Tracer
+
+# 인코딩 감지에 사용하는 앞부분 크기
+MIN_BUF_LOAD_SIZE = 1 * 1024 * 1024
+
+# '\n' 외에 QTextDocument가 새 블록(라인)으로 나누는 문자 - 스냅샷 라인 번호가 에디터 블록과 같도록 '\n'으로 변환
+BLOCK_SEPARATORS = ('\u2029', '\ufdd0', '\ufdd1')
+
+
+def detect_encoding(sample: bytes) -> str:
+    """파일의 인코딩을 감지"""
+    try:
+        import chardet  # 처음 파일을 열 때 import (시작 시간 단축)
+        guess = chardet.detect(sample)
+        enc = guess.get('encoding') or 'utf-8'
+        if enc and enc.lower() in ('ascii',):
+            return 'utf-8'
+        return enc or 'utf-8'
+    except Exception:
+        return 'utf-8'
+
+
+def read_text(path: str, tracer: Optional[Tracer] = None,
+              progress: Optional[Callable[[int], None]] = None) -> Tuple[str, str]:
+    """파일 전체를 읽어 (텍스트, 인코딩) 반환 - 디코딩 실패 문자는 대체, 줄바꿈(BLOCK_SEPARATORS 포함)은 '\\n'으로 통일"""
+    tracer = tracer or Tracer()
+    size = os.path.getsize(path)
+    sample_size = min(MIN_BUF_LOAD_SIZE, size)
+    with tracer.span('detect encoding', 'load', bytes=sample_size):
+        with open(path, 'rb') as f:
+            sample = f.read(sample_size)
+        encoding = detect_encoding(sample)
+    if progress:
+        progress(10)
+
+    with tracer.span('read', 'load', bytes=size):
+        with open(path, 'rb') as f:
+            raw = f.read()
+    if progress:
+        progress(50)
+
+    # 텍스트 모드 open과 같은 디코딩/줄바꿈 변환 (\r\n, \r -> \n)
+    with tracer.span('decode', 'load', bytes=len(raw), encoding=encoding) as span:
+        content = io.TextIOWrapper(io.BytesIO(raw), encoding=encoding, errors='replace').read()
+        for sep in BLOCK_SEPARATORS:
+            if sep in content:
+                content = content.replace(sep, '\n')
+        span.args['chars'] = len(content)
+    del raw
+
+    if progress:
+        progress(100)
+    return content, encoding
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+"""
+구간(span) 타이밍 기록 - Qt 비의존, 스레드 안전
+
+- with tracer.span('search', lines=n, bytes=b): 같은 스레드 안에서 중첩되는 구간 (depth 자동)
+- tracer.begin(...) / tracer.end(span, ...): 시그널을 사이에 두고 끝나는 구간 (예: 파일 로딩 전체)
+- 각 구간은 처리한 bytes/lines를 기록하고, 끝난 순서대로 MAX_SPANS개까지 보관
+- to_chrome_trace(): chrome://tracing / Perfetto에서 열 수 있는 Trace Event JSON ('X' 이벤트)
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional
+
+
+class Span:
+    """기록된 구간 1개 (시간 단위: perf_counter 초)"""
+
+    __slots__ = ('name', 'category', 'start', 'end', 'thread', 'depth', 'args')
+
+    def __init__(self, name: str, category: str, depth: int, args: Dict):
+        self.name = name
+        self.category = category
+        self.start = time.perf_counter()
+        self.end = 0.0
+        self.thread = threading.current_thread().name
+        self.depth = depth
+        self.args = args
+
+    @property
+    def duration(self) -> float:
+        return (self.end or time.perf_counter()) - self.start
+
+    @property
+    def bytes(self) -> int:
+        return int(self.args.get('bytes', 0))
+
+    @property
+    def lines(self) -> int:
+        return int(self.args.get('lines', 0))
+
+    def throughput(self) -> float:
+        """MB/s (bytes가 없거나 너무 짧으면 0)"""
+        if not self.bytes or self.duration <= 0:
+            return 0.0
+        return self.bytes / (1024 * 1024) / self.duration
+
+
+class Tracer:
+    """탭 단위 구간 기록기 (워커 스레드에서도 호출 가능)"""
+    MAX_SPANS = 5000
+
+    def __init__(self, process_name: str = 'AndyFinder'):
+        self.process_name = process_name
+        self._spans: "deque[Span]" = deque(maxlen=self.MAX_SPANS)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.origin = time.perf_counter()
+        self.generation = 0  # 기록이 추가/삭제될 때마다 증가 (패널 갱신 판단용)
+
+    def _stack(self) -> List[Span]:
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def begin(self, name: str, category: str = 'tab', **args) -> Span:
+        """구간 시작 (end()를 호출해야 기록됨)"""
+        return Span(name, category, len(self._stack()), args)
+
+    def end(self, span: Optional[Span], **args):
+        """구간 종료 - args는 기존 값에 추가 (처리량은 끝날 때 알게 되는 경우가 많음)"""
+        if span is None:
+            return
+        span.end = time.perf_counter()
+        span.args.update(args)
+        with self._lock:
+            self._spans.append(span)
+            self.generation += 1
+
+    @contextmanager
+    def span(self, name: str, category: str = 'tab', **args) -> Iterator[Span]:
+        """중첩 구간 - yield된 Span의 args에 처리량을 채워 넣을 수 있음"""
+        s = self.begin(name, category, **args)
+        stack = self._stack()
+        stack.append(s)
+        try:
+            yield s
+        finally:
+            stack.pop()
+            self.end(s)
+
+    def spans(self) -> List[Span]:
+        """기록된 구간 (시작 시각 순)"""
+        with self._lock:
+            spans = list(self._spans)
+        spans.sort(key=lambda s: s.start)
+        return spans
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+            self.generation += 1
+
+    def to_chrome_trace(self) -> dict:
+        """Chrome Trace Event 형식 (ts/dur 단위: 마이크로초)"""
+        pid = os.getpid()
+        tids: Dict[str, int] = {}
+        events = [{'name': 'process_name', 'ph': 'M', 'pid': pid, 'args': {'name': self.process_name}}]
+        for s in self.spans():
+            tid = tids.setdefault(s.thread, len(tids) + 1)
+            events.append({
+                'name': s.name,
+                'cat': s.category,
+                'ph': 'X',
+                'ts': round((s.start - self.origin) * 1e6, 1),
+                'dur': round(s.duration * 1e6, 1),
+                'pid': pid,
+                'tid': tid,
+                'args': dict(s.args),
+            })
+        for thread, tid in tids.items():
+            events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': tid, 'args': {'name': thread}})
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, path: str) -> int:
+        """Chrome trace JSON 파일로 저장, 기록한 구간 수 반환"""
+        trace = self.to_chrome_trace()
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(trace, f, ensure_ascii=False)
+        return sum(1 for e in trace['traceEvents'] if e['ph'] == 'X')
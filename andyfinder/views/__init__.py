@@ -6,11 +6,20 @@ AndyFinder의 UI 뷰 컴포넌트들을 포함합니다.
 """
 
 from .drag_table_view import DragTableView
-from .results_model import NoWrapDelegate, ResultsModel, SearchResult
+from .results_model import ResultsModel, SearchResult
+from .result_delegate import ResultSnippetDelegate
+from .triage_model import TriageSummaryModel
+from .row_sizer import LazyRowSizer
+from .group_model import GroupResultsModel
+from .line_hits_model import LineHitsModel
 
 __all__ = [
     'DragTableView',
-    'NoWrapDelegate',
+    'ResultSnippetDelegate',
     'ResultsModel',
     'SearchResult',
+    'TriageSummaryModel',
+    'LazyRowSizer',
+    'GroupResultsModel',
+    'LineHitsModel',
 ]
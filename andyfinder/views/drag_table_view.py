@@ -4,12 +4,16 @@ from typing import TYPE_CHECKING
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt, Signal, QModelIndex, QTimer
 
+from andyfinder.views.row_sizer import LazyRowSizer
+
 if TYPE_CHECKING:
-    from AndyFinderTab import TabContent
+    from andyfinder.tab_content import TabContent
 
 # Global 상수
 g_MIN_FONT_SIZE = 1
 g_MAX_FONT_SIZE = 70
+# 이 행 수를 넘는 선택은 클립보드 대신 파일 내보내기를 권장
+g_CLIPBOARD_ROW_LIMIT = 50000
 
 
 class DragTableView(QtWidgets.QTableView):
@@ -52,6 +56,13 @@ class DragTableView(QtWidgets.QTableView):
         # 드래그 이미지 설정용
         self._drag_pixmap_size = QtCore.QSize(100, 30)
 
+        # 행 높이: resizeRowsToContents 대신 기본 높이 + 보이는 행만 보정
+        self.row_sizer = LazyRowSizer(self)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.row_sizer.schedule()
+
     def setModel(self, model):
         """모델 설정 시 선택 변경 시그널 연결"""
         super().setModel(model)
@@ -233,7 +244,7 @@ class DragTableView(QtWidgets.QTableView):
     def _refresh_layout_after_font_change(self):
         # 행 높이/열 너비 갱신
         try:
-            self.resizeRowsToContents()
+            self.row_sizer.reset()
             self.resizeColumnToContents(0)
             self.resizeColumnToContents(1)
         except Exception:
@@ -257,6 +268,10 @@ class DragTableView(QtWidgets.QTableView):
 
         current_row = current_index.row()
 
+        # 다음 행이 아직 fetchMore로 노출되지 않았을 수 있으므로 먼저 로드
+        if hasattr(model, 'ensure_loaded'):
+            model.ensure_loaded(current_row + 1)
+
         # 현재 행의 LineNumber (0번째 컬럼)
         start_line_data = model.data(model.index(current_row, 0), Qt.DisplayRole)
 
@@ -298,6 +313,17 @@ class DragTableView(QtWidgets.QTableView):
             event.accept()
             return
 
+        # tblResults에 focus가 있을 때 Ctrl+G로 N번째 결과로 이동
+        if self.hasFocus() and event.key() == Qt.Key_G and event.modifiers() == Qt.ControlModifier:
+            parent = self.parent()
+            while parent:
+                if hasattr(parent, 'show_goto_result_dialog'):
+                    parent.show_goto_result_dialog()
+                    break
+                parent = parent.parent()
+            event.accept()
+            return
+
         # tblResults에 focus가 있을 때 F2/Shift+F2로 마킹된 row 이동
         if self.hasFocus() and event.key() == Qt.Key_F2:
             if event.modifiers() == Qt.ShiftModifier:
@@ -360,6 +386,24 @@ class DragTableView(QtWidgets.QTableView):
         if not rows:
             return
 
+        if len(rows) > g_CLIPBOARD_ROW_LIMIT:
+            ret = QtWidgets.QMessageBox.question(
+                self, "복사",
+                f"{len(rows)}개 행은 클립보드로 복사하기에 너무 많습니다.\n"
+                f"파일로 내보내시겠습니까? (아니오: 그대로 복사)",
+                QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No | QtWidgets.QMessageBox.Cancel,
+                QtWidgets.QMessageBox.Yes
+            )
+            if ret == QtWidgets.QMessageBox.Cancel:
+                return
+            if ret == QtWidgets.QMessageBox.Yes:
+                parent = self.parent()
+                while parent:
+                    if hasattr(parent, 'show_export_dialog'):
+                        parent.show_export_dialog('selected')
+                        return
+                    parent = parent.parent()
+
         lines = []
         for r in rows:
             c0 = model.data(model.index(r, 0), Qt.DisplayRole)
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, List, Sequence
+
+from PySide6 import QtCore
+from PySide6.QtCore import Qt, QModelIndex
+
+from andyfinder.models import GroupSummary, SearchResult
+
+
+# ------------------------------ 그룹 집계 트리 모델 ------------------------------
+
+class GroupResultsModel(QtCore.QAbstractItemModel):
+    """
+    검색결과 그룹 집계 모델 (2단계 트리)
+
+    - 최상위: 그룹 (키, 개수, 비율, 처음/마지막 라인)
+    - 하위: 그룹에 속한 결과 라인 - 펼칠 때 CHILD_BATCH 단위로 fetchMore
+    - internalId: 그룹 0, 하위 항목은 (그룹 row + 1)
+    """
+    HEADERS = ["Key", "Count", "%", "First", "Last"]
+    CHILD_BATCH = 1000
+
+    def __init__(self):
+        super().__init__()
+        self.groups: List[GroupSummary] = []
+        self.results: List[SearchResult] = []
+        self.lines: Sequence[str] = []
+        self.total = 0
+        self._loaded: Dict[int, int] = {}  # 그룹 row -> 노출된 하위 row 수
+
+    def set_groups(self, groups: List[GroupSummary], total: int, results: List[SearchResult],
+                   lines: Sequence[str]):
+        self.beginResetModel()
+        self.groups = groups
+        self.total = total
+        self.results = results
+        self.lines = lines
+        self._loaded = {}
+        self.endResetModel()
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index=QModelIndex()):
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.groups)
+        if parent.internalId() == 0 and parent.column() == 0:
+            return self._loaded.get(parent.row(), 0)
+        return 0
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return bool(self.groups)
+        return parent.internalId() == 0 and parent.column() == 0 and self.groups[parent.row()].count > 0
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if not parent.isValid() or parent.internalId() != 0:
+            return False
+        return self._loaded.get(parent.row(), 0) < self.groups[parent.row()].count
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        group_row = parent.row()
+        loaded = self._loaded.get(group_row, 0)
+        count = min(loaded + self.CHILD_BATCH, self.groups[group_row].count)
+        self.beginInsertRows(parent.siblingAtColumn(0), loaded, count - 1)
+        self._loaded[group_row] = count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        c = index.column()
+        if index.internalId() == 0:
+            g = self.groups[index.row()]
+            if role == Qt.DisplayRole:
+                if c == 0:
+                    return g.key
+                elif c == 1:
+                    return str(g.count)
+                elif c == 2:
+                    return f"{g.count * 100.0 / max(1, self.total):.1f}"
+                elif c == 3:
+                    return str(g.first_line + 1)
+                elif c == 4:
+                    return str(g.last_line + 1)
+            elif role == Qt.TextAlignmentRole and c > 0:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            elif role == Qt.ToolTipRole and c == 0:
+                return g.key
+            elif role == Qt.UserRole:
+                return g
+            return None
+
+        g = self.groups[index.internalId() - 1]
+        source = g.rows[index.row()]
+        r = self.results[source]
+        if role == Qt.DisplayRole:
+            if c == 0:
+                return self.lines[r.line] if r.line < len(self.lines) else r.snippet
+            elif c == 3:
+                return str(r.line + 1)
+        elif role == Qt.TextAlignmentRole and c == 3:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == Qt.UserRole:
+            return source
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def is_group(self, index: QModelIndex) -> bool:
+        return index.isValid() and index.internalId() == 0
+
+    def group_at(self, index: QModelIndex) -> GroupSummary:
+        """그룹 또는 하위 항목이 속한 그룹"""
+        if index.internalId() == 0:
+            return self.groups[index.row()]
+        return self.groups[index.internalId() - 1]
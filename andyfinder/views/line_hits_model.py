@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+from typing import List
+
+from PySide6 import QtCore
+from PySide6.QtCore import Qt, QModelIndex
+
+from andyfinder.models import SearchResult
+
+
+# ------------------------------ 에디터 전체검색 결과 모델 ------------------------------
+
+class LineHitsModel(QtCore.QAbstractTableModel):
+    """
+    LineViewSearchDialog 전체검색 결과 모델 (SearchResult 리스트 기반, QStandardItem 없음)
+
+    - append_results(batch): SearchWorker.partial 묶음을 뒤에 추가 (검색 중 스트리밍 표시)
+    - 뷰에는 FETCH_BATCH 단위로 노출 (ResultsModel과 같은 canFetchMore/fetchMore 페이징)
+    """
+    HEADERS = ["LineNumber", "내용"]
+    FETCH_BATCH = 5000
+    MAX_DISPLAY_CHARS = 2000  # 표시용으로만 자름 (원본 라인은 그대로)
+
+    def __init__(self):
+        super().__init__()
+        self.rows: List[SearchResult] = []
+        self._loaded = 0  # 뷰에 노출된 row 수
+
+    def clear(self):
+        self.beginResetModel()
+        self.rows = []
+        self._loaded = 0
+        self.endResetModel()
+
+    def append_results(self, batch: List[SearchResult]):
+        """결과 추가 - 첫 배치 범위 안이면 바로 노출, 나머지는 스크롤 시 fetchMore"""
+        self.rows.extend(batch)
+        self._load_until(self.FETCH_BATCH)
+
+    def total_count(self) -> int:
+        return len(self.rows)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < len(self.rows)
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        self._load_until(self._loaded + self.FETCH_BATCH)
+
+    def _load_until(self, count: int):
+        count = min(count, len(self.rows))
+        if count <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, count - 1)
+        self._loaded = count
+        self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        r = self.rows[index.row()]
+        c = index.column()
+
+        if role == Qt.DisplayRole:
+            if c == 0:
+                return str(r.line + 1)
+            elif c == 1:
+                if len(r.snippet) > self.MAX_DISPLAY_CHARS:
+                    return r.snippet[:self.MAX_DISPLAY_CHARS] + '…'
+                return r.snippet
+        elif role == Qt.TextAlignmentRole and c == 0:
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == Qt.UserRole:
+            return r
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def line_at(self, row: int) -> int:
+        """row의 0-based 라인 번호"""
+        return self.rows[row].line
@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6.QtCore import Qt
+
+from andyfinder.memory import estimate_size
+from andyfinder.views.results_model import SPAN_ROLE
+
+
+# ------------------------------ ResultSnippetDelegate (tblResults 1열 전용) ------------------------------
+
+class _SnippetLayout:
+    """한 결과 snippet의 측정/배치 캐시 (폰트 1개 기준)"""
+    __slots__ = ('result', 'snippet', 'lines', 'spans', 'width')
+
+    def __init__(self, result, snippet: str, lines: List[QtGui.QStaticText], spans: List[Tuple[int, int, int]],
+                 width: int):
+        self.result = result  # 참조를 잡아 두어 id() 재사용으로 인한 오인 방지
+        self.snippet = snippet  # 같은 객체일 때만 캐시 사용 (컨텍스트 변경 시 새 문자열)
+        self.lines = lines
+        self.spans = spans  # (줄 번호, x, width) 하이라이트 사각형
+        self.width = width
+
+
+class ResultSnippetDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    검색결과 snippet 직접 그리기 delegate (NoWrapDelegate 대체)
+
+    - 줄바꿈 없이 각 줄을 그대로 그리고, 검색 라인의 매칭 구간(SearchResult.matches)을 배경색으로 강조
+    - 한 줄이 MAX_LINE_CHARS를 넘으면 잘라서 '…'를 붙임 (거대한 라인 전체 측정 방지)
+    - 줄별 QStaticText, 매칭 위치, 최대 폭을 (결과, 폰트)별로 LRU 캐시 (CACHE_SIZE 초과 시 오래된 것부터 제거)
+    - sizeHint도 캐시된 폭/줄 수를 사용
+    """
+    PADDING_W = 12
+    PADDING_H = 8  # LazyRowSizer.PADDING_H와 동일
+    TEXT_MARGIN = 4
+    MAX_LINE_CHARS = 2000
+    CACHE_SIZE = 4000
+    MATCH_COLOR = QtGui.QColor(255, 200, 0, 160)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cache: "OrderedDict[Tuple[int, str], _SnippetLayout]" = OrderedDict()
+
+    def clear_cache(self):
+        self._cache.clear()
+
+    def cache_count(self) -> int:
+        return len(self._cache)
+
+    def cache_size(self, seen: Optional[set] = None) -> int:
+        """레이아웃 캐시 추정 크기 (QStaticText 내부 글리프 캐시는 제외)"""
+        return estimate_size(self._cache, seen)
+
+    def _layout(self, index, font: QtGui.QFont) -> _SnippetLayout:
+        snippet = index.data(Qt.DisplayRole)
+        if not isinstance(snippet, str):
+            snippet = ""
+        result = index.data(Qt.UserRole)
+        key = (id(result), font.key())
+
+        cached = self._cache.get(key)
+        if cached is not None and cached.result is result and cached.snippet is snippet:
+            self._cache.move_to_end(key)
+            return cached
+
+        fm = QtGui.QFontMetrics(font)
+        raw_lines = snippet.split('\n')
+        texts = []
+        width = 0
+        for line in raw_lines:
+            if len(line) > self.MAX_LINE_CHARS:
+                line = line[:self.MAX_LINE_CHARS] + '…'
+            static = QtGui.QStaticText(line)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(QtGui.QTransform(), font)
+            texts.append(static)
+            width = max(width, fm.horizontalAdvance(line))
+
+        # 매칭 구간 -> (줄 번호, x, width), 잘린 부분 밖의 매칭은 생략
+        spans = []
+        span_info = index.data(SPAN_ROLE)
+        if span_info:
+            line_no, matches = span_info
+            if 0 <= line_no < len(raw_lines):
+                line = raw_lines[line_no]
+                limit = min(len(line), self.MAX_LINE_CHARS)
+                for start, end in matches:
+                    if start >= limit:
+                        continue
+                    end = min(end, limit)
+                    x = fm.horizontalAdvance(line[:start])
+                    spans.append((line_no, x, max(1, fm.horizontalAdvance(line[start:end]))))
+
+        layout = _SnippetLayout(result, snippet, texts, spans, width)
+        self._cache[key] = layout
+        while len(self._cache) > self.CACHE_SIZE:
+            self._cache.popitem(last=False)
+        return layout
+
+    def paint(self, painter, option, index):
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        # 배경/선택/포커스만 스타일로 그리고 텍스트는 직접 그림
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+        layout = self._layout(index, opt.font)
+        rect = opt.rect
+        line_h = QtGui.QFontMetrics(opt.font).lineSpacing()
+        x0 = rect.left() + self.TEXT_MARGIN
+        y0 = rect.top() + (rect.height() - line_h * len(layout.lines)) // 2
+
+        painter.save()
+        painter.setClipRect(rect)
+        painter.setFont(opt.font)
+
+        for line_no, x, w in layout.spans:
+            painter.fillRect(QtCore.QRect(x0 + x, y0 + line_no * line_h, w, line_h), self.MATCH_COLOR)
+
+        selected = bool(opt.state & QtWidgets.QStyle.State_Selected)
+        color_role = QtGui.QPalette.HighlightedText if selected else QtGui.QPalette.Text
+        painter.setPen(opt.palette.color(color_role))
+
+        for i, static in enumerate(layout.lines):
+            y = y0 + i * line_h
+            if y > rect.bottom():
+                break
+            painter.drawStaticText(x0, y, static)
+
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        layout = self._layout(index, option.font)
+        fm = option.fontMetrics
+        if len(layout.lines) <= 1:
+            height = fm.height() + self.PADDING_H
+        else:
+            # 줄간격(lineSpacing)을 사용하면 자간이 포함된 높이를 얻을 수 있음
+            height = fm.lineSpacing() * len(layout.lines) + self.PADDING_H
+        return QtCore.QSize(layout.width + self.PADDING_W, height)
@@ -1,9 +1,12 @@
 # -*- coding: utf-8 -*-
-from typing import List, Tuple
+from bisect import bisect_left
+from typing import List, Optional, Sequence, Tuple
 
-from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6 import QtCore, QtGui
 from PySide6.QtCore import Qt, QModelIndex
 
+from andyfinder.marks import SortedIndexSet
+
 
 # ------------------------------ 데이터 구조 ------------------------------
 from dataclasses import dataclass
@@ -16,96 +19,194 @@ class SearchResult:
     matches: List[Tuple[int, int]]  # (start, end) in snippet string
 
 
-# ------------------------------ NoWrapDelegate (tblResults 1열 전용) ------------------------------
-
-class NoWrapDelegate(QtWidgets.QStyledItemDelegate):
-    """
-    - 줄바꿈 문자가 없는 텍스트: 반드시 한 줄로 표시되도록 sizeHint를 1줄 높이로 계산
-    - 줄바꿈 문자가 있는 텍스트: 각 줄을 그대로 표시하되, 최대 폭/줄 수에 맞게 크기 계산
-    - 너비는 텍스트의 실제 픽셀 폭을 기준으로 계산하여, 헤더가 ResizeToContents일 때
-      열 너비가 컨텐츠 폭만큼 넓어지고, 가로 스크롤로 전체를 확인할 수 있음
-    """
-
-    def sizeHint(self, option, index):
-        value = index.data(Qt.DisplayRole)
-        if not isinstance(value, str):
-            return super().sizeHint(option, index)
-
-        fm = option.fontMetrics
-        padding_w = 12
-        padding_h = 8
-
-        lines = value.split('\n')
-        if len(lines) == 1:
-            width = fm.horizontalAdvance(lines[0]) + padding_w
-            height = fm.height() + padding_h
-        else:
-            width = max(fm.horizontalAdvance(line) for line in lines) + padding_w
-            # 줄간격(lineSpacing)을 사용하면 자간이 포함된 높이를 얻을 수 있음
-            height = fm.lineSpacing() * len(lines) + padding_h
-
-        return QtCore.QSize(width, height)
+# data(index, SPAN_ROLE) -> (snippet 내 검색 라인의 줄 번호, 매칭 구간 리스트)
+SPAN_ROLE = Qt.UserRole + 1
 
 
 # ------------------------------ Results Model (마킹 기능 추가) ------------------------------
 
 class ResultsModel(QtCore.QAbstractTableModel):
+    """
+    검색 결과 테이블 모델 (canFetchMore/fetchMore 페이징)
+
+    - rows: 전체 결과 (backing store)
+    - 뷰에는 FETCH_BATCH 단위로 노출하며, 스크롤이 끝에 닿으면 Qt가 fetchMore 호출
+    - 특정 결과로 이동할 때는 ensure_loaded(row)로 해당 row까지 노출
+    - set_filter(rows)로 결과 중 일부(오름차순 결과 인덱스)만 표시 가능
+      뷰 row <-> 결과 인덱스 변환은 source_row/view_row, 마킹은 항상 결과 인덱스 기준으로 유지
+    """
     HEADERS = ["LineNumber", "검색결과"]
+    FETCH_BATCH = 5000
 
     def __init__(self):
         super().__init__()
         self.rows: List[SearchResult] = []
-        self.marked_rows: set = set()  # 마킹된 row 인덱스들
+        self.marked_rows = SortedIndexSet()  # 마킹된 row 인덱스들 (정렬 유지)
+        self._loaded = 0  # 뷰에 노출된 row 수
+        self._view: Optional[List[int]] = None  # 필터 통과 결과 인덱스 (None: 필터 없음)
+        self.context_prev = 0  # snippet에 포함된 이전 컨텍스트 라인 수 (매칭 구간 위치 계산용)
 
     def set_results(self, rows: List[SearchResult]):
         self.beginResetModel()
         self.rows = rows
+        self._view = None
+        self._loaded = min(len(rows), self.FETCH_BATCH)
         self.marked_rows.clear()  # 결과가 바뀌면 마킹 초기화
         self.endResetModel()
 
+    def set_filter(self, rows: Optional[List[int]]):
+        """필터 적용 (rows: 오름차순 결과 인덱스, None이면 해제) - 결과/마킹은 그대로 유지"""
+        self.beginResetModel()
+        self._view = rows
+        self._loaded = min(self.total_count(), self.FETCH_BATCH)
+        self.endResetModel()
+
+    def is_filtered(self) -> bool:
+        return self._view is not None
+
+    def total_count(self) -> int:
+        """노출 여부와 관계없는 (필터 적용 후) 전체 결과 수"""
+        return len(self._view) if self._view is not None else len(self.rows)
+
+    def source_count(self) -> int:
+        """필터와 관계없는 전체 결과 수"""
+        return len(self.rows)
+
+    def source_row(self, row: int) -> int:
+        """뷰 row -> 결과 인덱스"""
+        return self._view[row] if self._view is not None else row
+
+    def view_row(self, source: int) -> int:
+        """결과 인덱스 -> 뷰 row, 필터에 걸러졌으면 -1"""
+        if self._view is None:
+            return source if 0 <= source < len(self.rows) else -1
+        i = bisect_left(self._view, source)
+        return i if i < len(self._view) and self._view[i] == source else -1
+
+    def visible_source_rows(self) -> Sequence[int]:
+        """표시 중인 결과 인덱스 (오름차순)"""
+        return self._view if self._view is not None else range(len(self.rows))
+
+    def visible_results(self) -> List[SearchResult]:
+        """표시 중인 결과 리스트 (인덱스 = 뷰 row)"""
+        if self._view is None:
+            return self.rows
+        rows = self.rows
+        return [rows[i] for i in self._view]
+
+    def loaded_count(self) -> int:
+        return self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < self.total_count()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        self._load_until(self._loaded + self.FETCH_BATCH)
+
+    def ensure_loaded(self, row: int) -> bool:
+        """row가 뷰에 노출되도록 필요한 만큼 추가 로드 (jump to result N)"""
+        if row < 0 or row >= self.total_count():
+            return False
+        if row >= self._loaded:
+            # 배치 경계까지 올림하여 다음 스크롤에 바로 fetchMore가 일어나지 않도록 함
+            self._load_until((row // self.FETCH_BATCH + 1) * self.FETCH_BATCH)
+        return True
+
+    def _load_until(self, count: int):
+        count = min(count, self.total_count())
+        if count <= self._loaded:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, count - 1)
+        self._loaded = count
+        self.endInsertRows()
+
     def toggle_mark(self, row: int):
-        """row 마킹 토글 - 변경 시 부모에 알림"""
-        if row < 0 or row >= len(self.rows):
+        """(뷰) row 마킹 토글 - 변경 시 부모에 알림"""
+        if row < 0 or row >= self.total_count():
             return
 
-        if row in self.marked_rows:
-            self.marked_rows.remove(row)
+        source = self.source_row(row)
+        if source in self.marked_rows:
+            self.marked_rows.remove(source)
         else:
-            self.marked_rows.add(row)
+            self.marked_rows.add(source)
 
-        # 해당 row 업데이트
+        # 해당 row 업데이트 (아직 노출되지 않은 row는 갱신 불필요)
+        if row >= self._loaded:
+            return
         self.dataChanged.emit(
             self.index(row, 0),
             self.index(row, self.columnCount() - 1)
         )
 
     def is_marked(self, row: int) -> bool:
-        return row in self.marked_rows
+        return self.source_row(row) in self.marked_rows
 
-    def get_next_marked_row(self, current_row: int) -> int:
-        """현재 row 다음의 마킹된 row 반환, 없으면 -1"""
-        if not self.marked_rows:
+    def _source_bound(self, row: int) -> int:
+        """뷰 row를 결과 인덱스로 변환 (범위 밖이면 양 끝 바깥 값)"""
+        if row < 0:
             return -1
+        if row >= self.total_count():
+            return len(self.rows)
+        return self.source_row(row)
 
-        marked_list = sorted(self.marked_rows)
-        for row in marked_list:
-            if row > current_row:
+    def get_next_marked_row(self, current_row: int) -> int:
+        """현재 (뷰) row 다음의 표시 중인 마킹 row 반환, 없으면 -1"""
+        source = self.marked_rows.next_after(self._source_bound(current_row))
+        while source >= 0:
+            row = self.view_row(source)
+            if row >= 0:
                 return row
+            source = self.marked_rows.next_after(source)
         return -1
 
     def get_prev_marked_row(self, current_row: int) -> int:
-        """현재 row 이전의 마킹된 row 반환, 없으면 -1"""
-        if not self.marked_rows:
-            return -1
-
-        marked_list = sorted(self.marked_rows, reverse=True)
-        for row in marked_list:
-            if row < current_row:
+        """현재 (뷰) row 이전의 표시 중인 마킹 row 반환, 없으면 -1"""
+        source = self.marked_rows.prev_before(self._source_bound(current_row))
+        while source >= 0:
+            row = self.view_row(source)
+            if row >= 0:
                 return row
+            source = self.marked_rows.prev_before(source)
         return -1
 
+    # ---- 일괄 마킹: 집합 연산 후 dataChanged는 1회만 발생 ----
+    def set_marked_rows(self, rows):
+        """마킹 전체 교체 (결과 인덱스 기준)"""
+        self.marked_rows = SortedIndexSet(r for r in rows if 0 <= r < len(self.rows))
+        self._emit_marks_changed()
+
+    def mark_rows(self, rows):
+        """여러 결과 인덱스를 한 번에 마킹"""
+        self.marked_rows.update(r for r in rows if 0 <= r < len(self.rows))
+        self._emit_marks_changed()
+
+    def invert_marks(self):
+        """표시 중인 결과에 대해 마킹 반전 (필터에 걸러진 결과의 마킹은 유지)"""
+        self.marked_rows = SortedIndexSet(self.marked_rows.as_set().symmetric_difference(self.visible_source_rows()))
+        self._emit_marks_changed()
+
+    def clear_marks(self):
+        self.marked_rows.clear()
+        self._emit_marks_changed()
+
+    def _emit_marks_changed(self):
+        if self._loaded == 0:
+            return
+        self.dataChanged.emit(
+            self.index(0, 0),
+            self.index(self._loaded - 1, self.columnCount() - 1),
+            [Qt.BackgroundRole]
+        )
+
     def rowCount(self, parent=QModelIndex()):
-        return len(self.rows)
+        if parent.isValid():
+            return 0
+        return self._loaded
 
     def columnCount(self, parent=QModelIndex()):
         return 2
@@ -114,7 +215,8 @@ class ResultsModel(QtCore.QAbstractTableModel):
         if not index.isValid():
             return None
 
-        r = self.rows[index.row()]
+        source = self.source_row(index.row())
+        r = self.rows[source]
         c = index.column()
 
         if role == Qt.DisplayRole:
@@ -124,10 +226,13 @@ class ResultsModel(QtCore.QAbstractTableModel):
                 return r.snippet
         elif role == Qt.BackgroundRole:
             # 마킹된 row는 light green 배경
-            if index.row() in self.marked_rows:
+            if source in self.marked_rows:
                 return QtGui.QColor(144, 238, 144)  # light green
         elif role == Qt.UserRole:
             return r
+        elif role == SPAN_ROLE and c == 1:
+            # 파일 앞부분은 이전 컨텍스트가 모자랄 수 있음
+            return min(self.context_prev, r.line), r.matches
 
         return None
 
@@ -139,4 +244,5 @@ class ResultsModel(QtCore.QAbstractTableModel):
         return str(section + 1)
 
     def get(self, row: int) -> SearchResult:
-        return self.rows[row]
+        """뷰 row의 결과"""
+        return self.rows[self.source_row(row)]
@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+from typing import Dict, Optional, Tuple
+
+from PySide6 import QtCore
+from PySide6.QtCore import Qt
+
+
+# ------------------------------ LazyRowSizer (tblResults 행 높이) ------------------------------
+
+class LazyRowSizer(QtCore.QObject):
+    """
+    resizeRowsToContents() 대신 사용하는 행 높이 전략
+
+    - 모든 행의 기본 높이는 (컨텍스트 라인 수 + 1)줄 높이로 한 번에 설정 (O(1))
+    - 컨텍스트가 있을 때만, 화면에 보이는 행의 실제 줄 수를 세어 높이를 보정
+      (파일 처음/끝 근처처럼 snippet 줄 수가 기본값과 다른 행)
+    - 보정한 높이는 (컨텍스트 라인 수, 폰트 크기)별로 행 단위 캐시
+    - 폰트 측정(horizontalAdvance)은 하지 않고 줄 수만 센다
+    """
+    PADDING_H = 8  # ResultSnippetDelegate.sizeHint와 동일
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+        self.context_lines = 0
+        self._cache: Dict[Tuple[int, int], Dict[int, int]] = {}
+        self._heights: Dict[int, int] = {}
+        self._line_height = 0
+
+        # 스크롤/리사이즈가 연속으로 발생해도 이벤트 루프당 1회만 계산
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self.size_visible_rows)
+        view.verticalScrollBar().valueChanged.connect(self.schedule)
+
+    def row_height(self, line_count: int) -> int:
+        fm = self.view.fontMetrics()
+        if line_count <= 1:
+            return fm.height() + self.PADDING_H
+        return fm.lineSpacing() * line_count + self.PADDING_H
+
+    def reset(self, context_lines: Optional[int] = None, new_results: bool = False):
+        """결과/컨텍스트/폰트 변경 시 호출 - 기본 높이 설정 후 보이는 행만 보정"""
+        if new_results:
+            self._cache.clear()
+        if context_lines is not None:
+            self.context_lines = context_lines
+
+        key = (self.context_lines, self.view.font().pointSize())
+        self._heights = self._cache.setdefault(key, {})
+        self._line_height = self.view.fontMetrics().lineSpacing()
+
+        # 기본 높이를 바꾸면 명시적으로 조정되지 않은 모든 section에 일괄 적용됨
+        self.view.verticalHeader().setDefaultSectionSize(self.row_height(self.context_lines + 1))
+        self.schedule()
+
+    def schedule(self):
+        if self.context_lines > 0:
+            self._timer.start()
+
+    def size_visible_rows(self):
+        """현재 viewport에 보이는 행만 실제 줄 수에 맞춰 높이 보정"""
+        model = self.view.model()
+        if model is None or self.context_lines <= 0:
+            return
+        row = self.view.rowAt(0)
+        if row < 0:
+            return
+
+        header = self.view.verticalHeader()
+        viewport_h = self.view.viewport().height()
+        total = model.rowCount()
+
+        while row < total and header.sectionViewportPosition(row) < viewport_h:
+            height = self._heights.get(row)
+            if height is None:
+                text = model.data(model.index(row, 1), Qt.DisplayRole) or ""
+                height = self.PADDING_H + (
+                    self._line_height * (text.count('\n') + 1) if '\n' in text
+                    else self.view.fontMetrics().height()
+                )
+                self._heights[row] = height
+            if header.sectionSize(row) != height:
+                header.resizeSection(row, height)
+            row += 1
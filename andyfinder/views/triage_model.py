@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+from typing import List
+
+from PySide6 import QtCore, QtGui
+from PySide6.QtCore import Qt, QModelIndex
+
+from andyfinder.models import TriageSummary
+
+
+# ------------------------------ Triage 요약 모델 ------------------------------
+
+class TriageSummaryModel(QtCore.QAbstractTableModel):
+    """즐겨찾기 일괄 실행 결과 요약 (즐겨찾기당 1행)"""
+    HEADERS = ["즐겨찾기", "Hits", "First", "Last", "Sample"]
+
+    def __init__(self):
+        super().__init__()
+        self.rows: List[TriageSummary] = []
+
+    def set_summaries(self, rows: List[TriageSummary]):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        r = self.rows[index.row()]
+        c = index.column()
+
+        if role == Qt.DisplayRole:
+            if c == 0:
+                return r.name
+            elif c == 1:
+                return r.error if r.error else str(r.hit_count)
+            elif c == 2:
+                return str(r.first_line + 1) if r.lines else ""
+            elif c == 3:
+                return str(r.last_line + 1) if r.lines else ""
+            elif c == 4:
+                return r.sample
+        elif role == Qt.TextAlignmentRole and c in (1, 2, 3):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        elif role == Qt.ToolTipRole and c == 0:
+            return r.pattern
+        elif role == Qt.ForegroundRole:
+            if r.error:
+                return QtGui.QColor(200, 0, 0)
+            if not r.lines:
+                return QtGui.QColor(150, 150, 150)
+        elif role == Qt.UserRole:
+            return r
+
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return str(section + 1)
+
+    def get(self, row: int) -> TriageSummary:
+        return self.rows[row]
@@ -0,0 +1,174 @@
+# -*- coding: utf-8 -*-
+"""
+GUI 스레드 멈춤(stall) 감시
+
+- GUI 스레드: HEARTBEAT_MS마다 QTimer로 마지막 응답 시각 갱신
+- 감시 스레드: 마지막 응답 후 threshold 이상 지나면 GUI(메인) 스레드의 Python 스택을 1회 캡처
+- GUI 스레드가 다시 응답하면 실제 멈춘 시간을 채워 링 버퍼(MAX_EVENTS개)에 기록하고 stallDetected 시그널
+
+이벤트 루프가 호출한 첫 andyfinder 함수(슬롯/이벤트 핸들러)를 멈춤을 일으킨 동작(trigger)으로 기록한다.
+GUI 스레드가 긴 C 호출(str.split, re, str.translate 등)로 GIL을 잡고 있으면 감시 스레드가 스택을 캡처하지 못하므로,
+이 경우에도 응답 간격이 threshold 이상이면 '스택 없음'으로 기록한다.
+컴퓨터 절전은 절전 중에도 흐르는 시계와 perf_counter의 차이로 구분해 멈춤으로 기록하지 않는다.
+"""
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+@dataclass
+class StallEvent:
+    """GUI 스레드 멈춤 1건"""
+    started_at: datetime
+    duration: float  # 초 (GUI 스레드가 다시 응답한 시점에 확정)
+    trigger: str  # 이벤트 루프가 호출한 첫 andyfinder 함수
+    location: str  # 캡처 시점에 실행 중이던 가장 안쪽 andyfinder 위치
+    stack: List[str] = field(default_factory=list)
+
+    def format(self) -> str:
+        stamp = self.started_at.strftime('%Y-%m-%d %H:%M:%S.%f')[:-3]
+        header = f"[{stamp}] {self.duration * 1000:,.0f} ms - {self.trigger} ({self.location})"
+        return header + "\n" + "".join(self.stack)
+
+
+def _suspend_offset() -> float:
+    """절전 중에도 흐르는 시계 - perf_counter (값이 늘어난 만큼 절전 또는 시계 조정)"""
+    if hasattr(time, 'CLOCK_BOOTTIME'):
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - time.perf_counter()
+    return time.time() - time.perf_counter()
+
+
+def _code_name(frame) -> str:
+    code = frame.f_code
+    return getattr(code, 'co_qualname', code.co_name)
+
+
+def _describe_stack(frame) -> tuple:
+    """(trigger, location) - andyfinder 패키지 안의 가장 바깥/안쪽 프레임"""
+    frames = []
+    while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+    ours = [f for f in reversed(frames)
+            if os.path.abspath(f.f_code.co_filename).startswith(_PACKAGE_DIR) and f.f_code.co_name != '<lambda>']
+    if not ours:
+        return "(알 수 없음)", "(andyfinder 밖)"
+    inner = ours[-1]
+    location = f"{os.path.basename(inner.f_code.co_filename)}:{inner.f_lineno} {_code_name(inner)}"
+    return _code_name(ours[0]), location
+
+
+class StallWatchdog(QObject):
+    """GUI 스레드 멈춤 감지기 (GUI 스레드에서 생성, start()/stop())"""
+    stallDetected = Signal(object)  # StallEvent
+
+    HEARTBEAT_MS = 25
+    MAX_EVENTS = 200
+
+    def __init__(self, threshold_ms: int = 100, parent=None):
+        super().__init__(parent)
+        self.threshold = threshold_ms / 1000.0
+        self.events: "deque[StallEvent]" = deque(maxlen=self.MAX_EVENTS)
+        self._main_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._last_offset = _suspend_offset()  # 마지막 응답 시점의 절전 판단 기준
+        self._captured_beat = 0.0  # 이미 캡처한 멈춤의 마지막 응답 시각 (멈춤 1건당 1회 캡처)
+        self._pending: Optional[StallEvent] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self._heartbeat = QtCore.QTimer(self)
+        self._heartbeat.setInterval(self.HEARTBEAT_MS)
+        self._heartbeat.timeout.connect(self._beat)
+
+    def start(self):
+        if self._thread is not None:
+            return
+        self._last_beat = time.perf_counter()
+        self._last_offset = _suspend_offset()
+        self._stop.clear()
+        self._heartbeat.start()
+        self._thread = threading.Thread(target=self._watch, name='StallWatchdog', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._heartbeat.stop()
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(1.0)
+            self._thread = None
+
+    def clear(self):
+        self.events.clear()
+
+    # GUI 스레드
+    def _beat(self):
+        now = time.perf_counter()
+        offset = _suspend_offset()
+        gap = now - self._last_beat
+        slept = offset - self._last_offset > self.threshold
+        self._last_beat = now
+        self._last_offset = offset
+        with self._lock:
+            event, self._pending = self._pending, None
+        if slept or gap < self.threshold:
+            return
+        if event is None:
+            # 감시 스레드가 GIL을 얻지 못해 스택을 캡처하지 못한 멈춤
+            event = StallEvent(started_at=datetime.now() - timedelta(seconds=gap), duration=gap,
+                               trigger="(스택 없음)", location="GIL 점유 중 (긴 C 호출) - 스택 캡처 불가")
+        event.duration = gap
+        self.events.append(event)
+        self.stallDetected.emit(event)
+
+    # 감시 스레드
+    def _watch(self):
+        interval = min(self.threshold / 4, self.HEARTBEAT_MS / 1000.0)
+        while not self._stop.wait(interval):
+            now = time.perf_counter()
+            last_beat = self._last_beat
+            if now - last_beat < self.threshold or self._captured_beat == last_beat:
+                continue
+            self._captured_beat = last_beat
+            # 절전에서 깨어난 직후는 GUI 멈춤으로 보지 않음 (_beat에서도 같은 기준으로 버림)
+            if _suspend_offset() - self._last_offset > self.threshold:
+                continue
+            self._capture(last_beat)
+
+    def _capture(self, last_beat: float):
+        frame = sys._current_frames().get(self._main_thread_id)
+        if frame is None:
+            return
+        try:
+            stack = traceback.format_stack(frame)
+            trigger, location = _describe_stack(frame)
+        finally:
+            del frame
+        started_at = datetime.now() - timedelta(seconds=time.perf_counter() - last_beat)
+        event = StallEvent(started_at=started_at, duration=time.perf_counter() - last_beat,
+                           trigger=trigger, location=location, stack=stack)
+        with self._lock:
+            self._pending = event
+
+    def dump(self, path: str) -> int:
+        """기록된 멈춤을 텍스트 파일로 저장, 저장한 건수 반환"""
+        events = list(self.events)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"# AndyFinder GUI stall dump ({datetime.now():%Y-%m-%d %H:%M:%S}), "
+                    f"threshold {self.threshold * 1000:.0f} ms, {len(events)} events\n\n")
+            for event in events:
+                f.write(event.format())
+                f.write("\n")
+        return len(events)
@@ -7,9 +7,30 @@ AndyFinder Workers 모듈
 
 from .file_loader import FileLoader
 from .search_worker import SearchWorker, SearchResult
+from .triage_worker import FavoriteTriageWorker
+from .result_search_worker import ResultSearchWorker
+from .export_worker import ExportWorker
+from .result_filter_worker import ResultFilterWorker
+from .group_worker import GroupByWorker
+from .overview_worker import OverviewWorker
+from .find_count_worker import FindCountWorker
+from .line_index_worker import LineIndexWorker
+from .save_worker import SaveWorker
+from .result_cache_worker import ResultCacheWorker, ResultCacheSaveWorker
 
 __all__ = [
     'FileLoader',
     'SearchWorker',
     'SearchResult',
+    'FavoriteTriageWorker',
+    'ResultSearchWorker',
+    'ExportWorker',
+    'ResultFilterWorker',
+    'GroupByWorker',
+    'OverviewWorker',
+    'FindCountWorker',
+    'LineIndexWorker',
+    'SaveWorker',
+    'ResultCacheWorker',
+    'ResultCacheSaveWorker',
 ]
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+import csv
+import json
+import os
+import time
+from typing import List, Optional, Sequence
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.models import SearchResult
+from andyfinder.snapshot import TextSnapshot
+
+EXPORT_FORMATS = {
+    'csv': 'CSV (*.csv)',
+    'jsonl': 'JSON Lines (*.jsonl)',
+    'txt': 'Text (*.txt)',
+}
+
+
+class ExportWorker(QObject):
+    """검색 결과를 파일로 스트리밍 저장하는 워커 클래스
+
+    - row 단위로 바로 파일에 기록하므로 전체 문자열을 메모리에 만들지 않음
+    - 임시 파일(<path>.part)에 기록 후 완료 시 rename, 취소/실패 시 임시 파일 삭제
+    - 컨텍스트 라인은 스냅샷 라인 리스트에서 prev/next 범위를 잘라서 사용
+    """
+    progress = Signal(int)
+    finished = Signal(str, int, float)  # path, row count, duration
+    failed = Signal(str)
+    cancelled = Signal()
+
+    def __init__(self, path: str, fmt: str, results: List[SearchResult], rows: Optional[Sequence[int]],
+                 snapshot: TextSnapshot, prev_lines: int = 0, next_lines: int = 0):
+        super().__init__()
+        self.path = path
+        self.fmt = fmt
+        self.results = results
+        self.rows = rows  # None이면 전체
+        self.snapshot = snapshot
+        self.prev_lines = prev_lines
+        self.next_lines = next_lines
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    def _text_for(self, r: SearchResult, lines: List[str]) -> str:
+        if not self.prev_lines and not self.next_lines:
+            return lines[r.line] if r.line < len(lines) else r.snippet
+        start = max(0, r.line - self.prev_lines)
+        end = min(len(lines), r.line + self.next_lines + 1)
+        return '\n'.join(lines[start:end])
+
+    @QtCore.Slot()
+    def run(self):
+        """내보내기 실행"""
+        start_time = time.time()
+        tmp_path = self.path + '.part'
+        try:
+            lines = self.snapshot.lines
+            rows = range(len(self.results)) if self.rows is None else self.rows
+            total = len(rows)
+            written = 0
+
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                writer = csv.writer(f) if self.fmt == 'csv' else None
+                if writer:
+                    writer.writerow(['line', 'text'])
+
+                for idx, row in enumerate(rows):
+                    if self._stop:
+                        break
+                    r = self.results[row]
+                    text = self._text_for(r, lines)
+
+                    if self.fmt == 'csv':
+                        writer.writerow([r.line + 1, text])
+                    elif self.fmt == 'jsonl':
+                        f.write(json.dumps({'line': r.line + 1, 'text': text, 'matches': r.matches},
+                                           ensure_ascii=False))
+                        f.write('\n')
+                    else:
+                        f.write(f"{r.line + 1}\t{text}\n")
+                    written += 1
+
+                    if idx % 2000 == 0:
+                        self.progress.emit(int((idx / max(1, total)) * 100))
+
+            if self._stop:
+                os.remove(tmp_path)
+                self.cancelled.emit()
+                return
+
+            os.replace(tmp_path, self.path)
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(self.path, written, duration)
+        except Exception as e:
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except OSError:
+                pass
+            self.failed.emit(str(e))
@@ -1,23 +1,24 @@
 # -*- coding: utf-8 -*-
-import os
 import time
-import chardet
+from typing import Optional
+
 from PySide6 import QtCore
 from PySide6.QtCore import QObject, Signal
 
-# 최소 버퍼 로드 크기
-MIN_BUF_LOAD_SIZE = 1 * 1024 * 1024
+from andyfinder.text_loader import detect_encoding, read_text
+from andyfinder.tracing import Tracer
 
 
 class FileLoader(QObject):
-    """파일을 백그라운드에서 로드하는 워커 클래스"""
+    """파일을 백그라운드에서 로드하는 워커 클래스 (로딩 과정은 text_loader.read_text)"""
     progress = Signal(int)
     finished = Signal(str, str, float)  # content, encoding, duration
     failed = Signal(str)
 
-    def __init__(self, path: str):
+    def __init__(self, path: str, tracer: Optional[Tracer] = None):
         super().__init__()
         self.path = path
+        self.tracer = tracer or Tracer()
         self._stop = False
 
     def stop(self):
@@ -26,31 +27,14 @@ class FileLoader(QObject):
 
     def detect_encoding(self, sample: bytes) -> str:
         """파일의 인코딩을 감지"""
-        try:
-            guess = chardet.detect(sample)
-            enc = guess.get('encoding') or 'utf-8'
-            if enc and enc.lower() in ('ascii',):
-                return 'utf-8'
-            return enc or 'utf-8'
-        except Exception:
-            return 'utf-8'
+        return detect_encoding(sample)
 
     @QtCore.Slot()
     def run(self):
         """파일 로드 실행"""
         start_time = time.time()
         try:
-            size = os.path.getsize(self.path)
-            sample_size = min(MIN_BUF_LOAD_SIZE, size)
-            with open(self.path, 'rb') as f:
-                sample = f.read(sample_size)
-            encoding = self.detect_encoding(sample)
-            self.progress.emit(10)
-
-            with open(self.path, 'r', encoding=encoding, errors='replace') as f:
-                content = f.read()
-
-            self.progress.emit(100)
+            content, encoding = read_text(self.path, self.tracer, self.progress.emit)
             duration = time.time() - start_time
             self.finished.emit(content, encoding, duration)
         except Exception as e:
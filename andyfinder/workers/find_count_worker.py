@@ -0,0 +1,51 @@
+# -*- coding: utf-8 -*-
+import re
+import time
+from array import array
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.snapshot import TextSnapshot
+
+
+class FindCountWorker(QObject):
+    """에디터 내부 검색(F3/F4)의 전체 매칭 위치를 백그라운드에서 구하는 워커 클래스
+
+    결과는 매칭 시작/끝 문자 오프셋의 오름차순 배열 2개이며,
+    에디터는 이를 (문서 revision, 검색어)별로 캐시해 현재 순번/전체 개수와 bisect 이동에 쓴다.
+    """
+    finished = Signal(object, object, str, int, float)  # starts, ends, pattern, revision, duration
+    failed = Signal(str)
+
+    STOP_CHECK_INTERVAL = 4096
+
+    def __init__(self, snapshot: TextSnapshot, pattern: str, regex: re.Pattern):
+        super().__init__()
+        self.snapshot = snapshot
+        self.pattern = pattern
+        self.regex = regex
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        """전체 매칭 위치 계산 실행"""
+        start_time = time.time()
+        try:
+            starts = array('q')
+            ends = array('q')
+            for m in self.regex.finditer(self.snapshot.text):
+                starts.append(m.start())
+                ends.append(m.end())
+                if not (len(starts) % self.STOP_CHECK_INTERVAL) and self._stop:
+                    return
+            if self._stop:
+                return
+            duration = time.time() - start_time
+            self.finished.emit(starts, ends, self.pattern, self.snapshot.revision, duration)
+        except Exception as e:
+            self.failed.emit(str(e))
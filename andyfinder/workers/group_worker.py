@@ -0,0 +1,64 @@
+# -*- coding: utf-8 -*-
+import time
+from typing import List, Optional, Sequence
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.grouping import group_results, needs_columns
+from andyfinder.logcat import LogcatColumns
+from andyfinder.models import SearchResult
+
+
+class GroupByWorker(QObject):
+    """검색결과 그룹 집계 워커 클래스
+
+    field/template 키에서 columns가 없으면 먼저 LogcatColumns를 만들고
+    columns_built로 넘겨 필터와 함께 재사용하게 한다.
+    """
+    progress = Signal(int)
+    columns_built = Signal(object, int)  # LogcatColumns, generation
+    finished = Signal(list, int, int, float)  # groups, unmatched, total, duration
+    failed = Signal(str)
+
+    def __init__(self, results: List[SearchResult], rows: Sequence[int], lines: Sequence[str], key_type: str,
+                 key_arg: str, generation: int, columns: Optional[LogcatColumns] = None):
+        super().__init__()
+        self.results = results
+        self.rows = rows
+        self.lines = lines
+        self.key_type = key_type
+        self.key_arg = key_arg
+        self.generation = generation
+        self.columns = columns
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        """그룹 집계 실행"""
+        start_time = time.time()
+        try:
+            if needs_columns(self.key_type) and self.columns is None:
+                lines = self.lines
+                self.columns = LogcatColumns.build(lines[r.line] for r in self.results)
+                if self._stop:
+                    return
+                self.columns_built.emit(self.columns, self.generation)
+
+            outcome = group_results(
+                self.results, self.rows, self.lines, self.key_type, self.key_arg, self.columns,
+                should_stop=lambda: self._stop, progress=self.progress.emit
+            )
+            if outcome is None:
+                return
+
+            groups, unmatched = outcome
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(groups, unmatched, len(self.rows), duration)
+        except Exception as e:
+            self.failed.emit(str(e))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+
+from PySide6 import QtCore
+from PySide6.QtCore import Signal
+
+from andyfinder.line_buffer import MappedLineBuffer, is_supported_encoding
+from andyfinder.text_loader import MIN_BUF_LOAD_SIZE
+from andyfinder.workers.file_loader import FileLoader
+
+
+class LineIndexWorker(FileLoader):
+    """파일을 mmap 라인 버퍼로 열고 라인 인덱스를 백그라운드에서 만드는 워커 클래스
+
+    파일 내용을 문자열로 읽지 않으므로 (FileLoader와 달리) 메모리 사용량이 파일 크기와 무관하다.
+    인코딩 감지는 FileLoader와 같은 방식 (앞쪽 샘플 chardet).
+    """
+    finished = Signal(object, str, float)  # MappedLineBuffer, encoding, duration
+
+    @QtCore.Slot()
+    def run(self):
+        """라인 인덱스 생성 실행"""
+        start_time = time.time()
+        buffer = None
+        try:
+            size = os.path.getsize(self.path)
+            with open(self.path, 'rb') as f:
+                sample = f.read(min(MIN_BUF_LOAD_SIZE, size))
+            encoding = self.detect_encoding(sample)
+            if not is_supported_encoding(encoding):
+                self.failed.emit(f"읽기 전용 뷰어는 {encoding} 인코딩을 지원하지 않습니다.")
+                return
+
+            buffer = MappedLineBuffer(self.path, encoding)
+            if not buffer.build_index(lambda: self._stop, self.progress.emit):
+                buffer.close()
+                return
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(buffer, encoding, duration)
+        except Exception as e:
+            if buffer is not None:
+                buffer.close()
+            self.failed.emit(str(e))
@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+from typing import List, Sequence, Tuple, Union
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.overview import LinesJob, line_histogram
+
+
+class OverviewWorker(QObject):
+    """오버뷰 룰러 분포 계산 워커 클래스
+
+    jobs: (category, key, 라인 배열 또는 LinesJob) 목록.
+    라인 배열이 이미 있으면(키가 같고 높이만 바뀐 경우) 히스토그램만 다시 센다.
+    결과: {category: (key, 라인 배열, 히스토그램)}
+    """
+    finished = Signal(object, int)  # dict, generation
+    failed = Signal(str)
+
+    def __init__(self, jobs: List[Tuple[str, object, Union[Sequence[int], LinesJob]]], line_count: int,
+                 buckets: int, generation: int):
+        super().__init__()
+        self.jobs = jobs
+        self.line_count = line_count
+        self.buckets = buckets
+        self.generation = generation
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        """분포 계산 실행"""
+        try:
+            out = {}
+            for category, key, source in self.jobs:
+                lines = source(lambda: self._stop) if callable(source) else source
+                if lines is None or self._stop:
+                    return
+                out[category] = (key, lines, line_histogram(lines, self.line_count, self.buckets))
+            self.finished.emit(out, self.generation)
+        except Exception as e:
+            self.failed.emit(str(e))
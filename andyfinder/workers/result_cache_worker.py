@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+import time
+
+from PySide6 import QtCore
+
+from andyfinder.session import file_fingerprint, load_result_cache, save_result_cache
+from andyfinder.snapshot import TextSnapshot
+from andyfinder.workers.search_worker import SearchResult, SearchWorker
+
+
+class ResultCacheWorker(SearchWorker):
+    """세션 복원용 검색 워커 - 저장된 검색결과 캐시가 있으면 검색 없이 결과를 만들고, 없으면 일반 검색
+
+    캐시는 (파일 지문, 검색 조건)이 같을 때만 사용하며, snippet은 다시 읽은 파일의 라인으로 채운다.
+    시그널은 SearchWorker와 같으므로 TabContent.on_search_finished에 그대로 연결한다.
+    """
+
+    def __init__(self, snapshot: TextSnapshot, search: dict, fingerprint: dict):
+        super().__init__(snapshot, search['query'], search['mode'], search['case_sensitive'])
+        self.search = search
+        self.fingerprint = fingerprint
+        self.from_cache = False  # 캐시에서 결과를 만들었으면 True (다시 저장할 필요 없음)
+
+    @QtCore.Slot()
+    def run(self):
+        """캐시 로드 (실패하면 검색 실행)"""
+        start_time = time.time()
+        try:
+            cached = load_result_cache(self.fingerprint, self.search)
+        except Exception:
+            cached = None
+        if cached is None:
+            super().run()
+            return
+
+        try:
+            lines = self.snapshot.lines
+            total = len(lines)
+            results = [SearchResult(line=line, snippet=lines[line], matches=matches)
+                       for line, matches in cached if line < total]
+            if self._stop:
+                return
+            self.from_cache = True
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(results, duration)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+
+class ResultCacheSaveWorker(QtCore.QObject):
+    """검색 완료 후 결과를 캐시 파일로 기록 (종료 시 GUI 스레드에서 직렬화하지 않도록 백그라운드에서 미리 저장)
+
+    지문은 기록 시점의 디스크 파일로 계산하므로, 편집 후 저장하지 않은 문서의 결과는 넘기지 않는다.
+    """
+    finished = QtCore.Signal(bool)  # 저장 여부 (결과가 너무 많거나 중지되면 False)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, path: str, search: dict, results: list):
+        super().__init__()
+        self.path = path
+        self.search = search
+        self.results = results
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        try:
+            fingerprint = file_fingerprint(self.path)
+            saved = save_result_cache(fingerprint, self.search, self.results, lambda: self._stop)
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        if not self._stop:
+            self.finished.emit(saved)
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import time
+from typing import List, Optional, Sequence
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.logcat import LogcatColumns
+from andyfinder.models import SearchResult
+from andyfinder.result_filter import compile_result_filter, needs_columns
+
+
+class ResultFilterWorker(QObject):
+    """검색 결과 필터링 워커 클래스
+
+    candidates가 주어지면(이전 필터 결과) 그 안에서만 다시 거른다 (점진적 필터링).
+    결과는 통과한 결과 row 인덱스의 오름차순 리스트.
+    field 모드에서 columns가 없으면 먼저 LogcatColumns를 만들고 columns_built로 넘겨 재사용하게 한다.
+    """
+    progress = Signal(int)
+    columns_built = Signal(object, int)  # LogcatColumns, generation
+    finished = Signal(list, str, str, int, float)  # rows, mode, query, generation, duration
+    failed = Signal(str)
+
+    CHUNK = 50000
+
+    def __init__(self, results: List[SearchResult], candidates: Optional[Sequence[int]], mode: str,
+                 query: str, lines: Sequence[str], generation: int, columns: Optional[LogcatColumns] = None):
+        super().__init__()
+        self.results = results
+        self.candidates = candidates
+        self.mode = mode
+        self.query = query
+        self.lines = lines
+        self.generation = generation
+        self.columns = columns
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        """필터링 실행"""
+        start_time = time.time()
+        try:
+            rows_filter = compile_result_filter(self.mode, self.query)
+            candidates = range(len(self.results)) if self.candidates is None else self.candidates
+            total = len(candidates)
+            rows: List[int] = []
+
+            if needs_columns(self.mode) and self.columns is None:
+                lines = self.lines
+                self.columns = LogcatColumns.build(lines[r.line] for r in self.results)
+                if self._stop:
+                    return
+                self.columns_built.emit(self.columns, self.generation)
+
+            for start in range(0, total, self.CHUNK):
+                if self._stop:
+                    return
+                rows.extend(rows_filter(self.results, candidates[start:start + self.CHUNK], self.lines, self.columns))
+                self.progress.emit(int((start / max(1, total)) * 100))
+
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(rows, self.mode, self.query, self.generation, duration)
+        except Exception as e:
+            self.failed.emit(str(e))
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+import re
+import time
+from typing import List
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.models import SearchResult
+
+
+class ResultSearchWorker(QObject):
+    """검색 결과 내 검색(F3/F4) 인덱스를 백그라운드에서 만드는 워커 클래스
+
+    결과는 일치하는 결과 row 번호의 오름차순 리스트이며,
+    GUI 쪽에서는 bisect로 현재 row 기준 이전/다음 매칭을 찾는다.
+    """
+    progress = Signal(int)
+    finished = Signal(list, str, int, float)  # matches, query, generation, duration
+    failed = Signal(str)
+
+    def __init__(self, results: List[SearchResult], query: str, generation: int):
+        super().__init__()
+        self.results = results
+        self.query = query
+        self.generation = generation
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        """인덱스 생성 실행"""
+        start_time = time.time()
+        try:
+            search = re.compile(self.query, re.IGNORECASE).search
+            matches: List[int] = []
+            total = len(self.results)
+
+            for idx, result in enumerate(self.results):
+                if self._stop:
+                    return
+                if search(str(result.line + 1)) or search(result.snippet):
+                    matches.append(idx)
+                if idx % 5000 == 0:
+                    self.progress.emit(int((idx / max(1, total)) * 100))
+
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(matches, self.query, self.generation, duration)
+        except Exception as e:
+            self.failed.emit(str(e))
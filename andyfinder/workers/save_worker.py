@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import os
+import queue
+import shutil
+import time
+from typing import Iterator, Optional
+
+from PySide6 import QtCore, QtGui
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.snapshot import TextSnapshot
+
+
+class DocumentChunkFeeder(QObject):
+    """GUI 스레드에서 QTextDocument 블록을 타이머로 조금씩 읽어 SaveWorker에 넘기는 클래스
+
+    편집 직후(스냅샷 없음) 저장할 때 toPlainText()로 문서 전체를 한 번에 복사하지 않기 위해 사용.
+    타이머 1회에 BATCH_MS 동안 CHUNK_CHARS 문자 단위 조각을 큐에 넣고, 끝나면 None을 넣는다.
+    """
+    BATCH_MS = 8
+    CHUNK_CHARS = 64 * 1024
+
+    def __init__(self, document: QtGui.QTextDocument, revision: int, parent=None):
+        super().__init__(parent)
+        self.revision = revision
+        self.total = document.characterCount()  # 진행률용 (블록 구분자 포함 근사치)
+        self.done = False
+        self._queue: "queue.Queue[Optional[str]]" = queue.Queue()
+        self._block = document.firstBlock()
+
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(0)
+        self._timer.timeout.connect(self._feed)
+
+    def chunks(self) -> Iterator[str]:
+        """워커 스레드에서 소비 - 끝 표시(None)까지 대기하며 조각 반환"""
+        return iter(self._queue.get, None)
+
+    def start(self):
+        self._timer.start()
+
+    def stop(self):
+        """넘기기 중지 - 대기 중인 워커가 끝나도록 끝 표시를 넣음"""
+        self._timer.stop()
+        if not self.done:
+            self.done = True
+            self._queue.put(None)
+
+    def drain(self):
+        """남은 블록을 한 번에 넘김 (종료 시 저장 완료를 기다리기 전에 사용 - 블록 단위보다 빠름)"""
+        self._timer.stop()
+        if self.done:
+            return
+        if self._block.isValid():
+            cursor = QtGui.QTextCursor(self._block)
+            cursor.movePosition(QtGui.QTextCursor.End, QtGui.QTextCursor.KeepAnchor)
+            # 선택 텍스트의 블록 구분자는 U+2029
+            self._queue.put(cursor.selectedText().replace('\u2029', '\n'))
+        self.done = True
+        self._queue.put(None)
+
+    def _next_chunk(self) -> Optional[str]:
+        """다음 블록들을 '\\n'으로 이은 조각 (뒤에 블록이 더 있으면 '\\n'으로 끝남), 끝이면 None"""
+        block = self._block
+        if not block.isValid():
+            return None
+        parts = []
+        size = 0
+        while block.isValid() and size < self.CHUNK_CHARS:
+            text = block.text()
+            parts.append(text)
+            size += len(text) + 1
+            block = block.next()
+        self._block = block
+        chunk = '\n'.join(parts)
+        return chunk + '\n' if block.isValid() else chunk
+
+    def _feed(self):
+        self._put_chunks(time.perf_counter() + self.BATCH_MS / 1000.0)
+
+    def _put_chunks(self, deadline: Optional[float]):
+        """deadline(perf_counter)까지 조각을 큐에 넣음, None이면 끝까지"""
+        while not self.done:
+            chunk = self._next_chunk()
+            self._queue.put(chunk)
+            if chunk is None:
+                self.done = True
+                self._timer.stop()
+            elif deadline is not None and time.perf_counter() >= deadline:
+                return
+
+
+class SaveWorker(QObject):
+    """문서 스냅샷을 원본 인코딩으로 저장하는 워커 클래스
+
+    - 스냅샷 텍스트를 WRITE_CHUNK 문자씩 잘라 임시 파일(<path>.part)에 스트리밍 기록
+      (스냅샷이 없으면 DocumentChunkFeeder가 GUI 스레드에서 나눠 넘기는 조각을 기록)
+    - 기록/flush/fsync가 끝난 뒤에만 os.replace로 원본과 교체 → 중간에 죽어도 원본은 그대로
+    - 원본 파일의 권한(mode)을 임시 파일에 복사, 취소/실패 시 임시 파일 삭제
+    """
+    progress = Signal(int)
+    finished = Signal(str, int, int, float)  # path, revision, bytes written, duration
+    failed = Signal(str)
+    cancelled = Signal()
+
+    WRITE_CHUNK = 4 * 1024 * 1024
+
+    def __init__(self, path: str, snapshot: Optional[TextSnapshot], encoding: str,
+                 feeder: Optional[DocumentChunkFeeder] = None):
+        super().__init__()
+        self.path = path
+        self.snapshot = snapshot
+        self.feeder = feeder
+        self.encoding = encoding
+        self.error: Optional[str] = None  # 실패 시 오류 메시지 (failed 시그널 전에 설정)
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        """저장 실행"""
+        start_time = time.time()
+        tmp_path = self.path + '.part'
+        try:
+            if self.feeder is not None:
+                chunks = self.feeder.chunks()
+                total = self.feeder.total
+                revision = self.feeder.revision
+            else:
+                text = self.snapshot.text
+                step = self.WRITE_CHUNK
+                chunks = (text[start:start + step] for start in range(0, len(text), step))
+                total = len(text)
+                revision = self.snapshot.revision
+
+            # 텍스트 모드 writer가 인코더 상태(BOM 등)를 유지하므로 잘라서 써도 한 번에 쓴 것과 같음
+            done = 0
+            with open(tmp_path, 'w', encoding=self.encoding, errors='replace') as f:
+                for chunk in chunks:
+                    if self._stop:
+                        break
+                    f.write(chunk)
+                    done += len(chunk)
+                    self.progress.emit(min(99, int(done * 100 / max(1, total))))
+                f.flush()
+                os.fsync(f.fileno())
+
+            if self._stop:
+                os.remove(tmp_path)
+                self.cancelled.emit()
+                return
+
+            if os.path.exists(self.path):
+                shutil.copymode(self.path, tmp_path)
+            written = os.path.getsize(tmp_path)
+            os.replace(tmp_path, self.path)
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(self.path, revision, written, duration)
+        except Exception as e:
+            try:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+            except OSError:
+                pass
+            self.error = str(e)
+            self.failed.emit(self.error)
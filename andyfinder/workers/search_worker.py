@@ -1,11 +1,13 @@
 # -*- coding: utf-8 -*-
-import re
 import time
 from typing import List, Tuple
 from dataclasses import dataclass
 from PySide6 import QtCore
 from PySide6.QtCore import QObject, Signal
 
+from andyfinder.matcher import build_matcher
+from andyfinder.snapshot import TextSnapshot
+
 
 @dataclass
 class SearchResult:
@@ -16,16 +18,22 @@ class SearchResult:
 
 
 class SearchWorker(QObject):
-    """검색을 백그라운드에서 수행하는 워커 클래스"""
+    """검색을 백그라운드에서 수행하는 워커 클래스
+
+    partial: 검색 도중 PARTIAL_INTERVAL초마다 새로 찾은 결과 묶음 (스트리밍 표시용, 연결은 선택)
+    """
     progress = Signal(int)
+    partial = Signal(list)  # 마지막 partial 이후 새 결과
     finished = Signal(list, float)  # results, duration
     failed = Signal(str)
     message = Signal(str)
 
-    def __init__(self, content: str, query: str, mode: str, case_sensitive: bool):
+    PARTIAL_INTERVAL = 0.2
+
+    def __init__(self, snapshot: TextSnapshot, query: str, mode: str, case_sensitive: bool):
         super().__init__()
-        self.content = content
-        self.lines = content.split('\n')
+        # 라인 분할은 스냅샷에 캐시되며, 최초 분할은 run()에서(워커 스레드) 수행
+        self.snapshot = snapshot
         self.query = query
         self.mode = mode
         self.case_sensitive = case_sensitive
@@ -36,42 +44,8 @@ class SearchWorker(QObject):
         self._stop = True
 
     def build_matcher(self):
-        """검색 모드에 따라 매칭 함수를 생성"""
-        text = self.query.strip()
-        if not text:
-            return None
-
-        flags = 0 if self.case_sensitive else re.IGNORECASE
-
-        if self.mode == 'regex':
-            try:
-                regex = re.compile(text, flags)
-            except re.error as e:
-                raise ValueError(f'정규식 오류: {e}')
-
-            def fn_regex(s, rx=regex):
-                return [(m.start(), m.end()) for m in rx.finditer(s)]
-
-            return fn_regex
-        else:
-            needle = text if self.case_sensitive else text.lower()
-
-            def fn_plain(s, n=needle, cs=self.case_sensitive):
-                hay = s if cs else s.lower()
-                spans = []
-                start = 0
-                ln = len(n)
-                if ln == 0:
-                    return spans
-                while True:
-                    pos = hay.find(n, start)
-                    if pos == -1:
-                        break
-                    spans.append((pos, pos + ln))
-                    start = pos + ln if ln > 0 else pos + 1
-                return spans
-
-            return fn_plain
+        """검색 모드에 따라 매칭 함수를 생성 (andyfinder.matcher, 명령줄 검색과 공용)"""
+        return build_matcher(self.query, self.mode, self.case_sensitive)
 
     @QtCore.Slot()
     def run(self):
@@ -85,20 +59,29 @@ class SearchWorker(QObject):
                 return
 
             results: List[SearchResult] = []
-            total = len(self.lines)
+            lines = self.snapshot.lines
+            total = len(lines)
+            emitted = 0
+            next_partial = time.time() + self.PARTIAL_INTERVAL
 
             for idx, line_idx in enumerate(range(0, total)):
                 if self._stop:
                     break
 
-                s = self.lines[line_idx]
+                s = lines[line_idx]
                 spans = matcher(s)
                 if spans:
                     results.append(SearchResult(line=line_idx, snippet=s, matches=spans))
 
                 if idx % 1000 == 0:
                     self.progress.emit(int((idx / max(1, total)) * 100))
+                    if len(results) > emitted and time.time() >= next_partial:
+                        self.partial.emit(results[emitted:])
+                        emitted = len(results)
+                        next_partial = time.time() + self.PARTIAL_INTERVAL
 
+            if len(results) > emitted:
+                self.partial.emit(results[emitted:])
             self.progress.emit(100)
             duration = time.time() - start_time
             self.finished.emit(results, duration)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+import re
+import time
+from typing import List, Optional, Tuple
+
+from PySide6 import QtCore
+from PySide6.QtCore import QObject, Signal
+
+from andyfinder.models import TriageSummary
+from andyfinder.snapshot import TextSnapshot
+
+
+def compile_favorite_pattern(value: str) -> re.Pattern:
+    """즐겨찾기 값을 정규식으로 컴파일 (정규식 모드와 동일하게 대소문자 무시)"""
+    return re.compile(value, re.IGNORECASE)
+
+
+# 그룹을 참조하는 구문: 번호 역참조(\1 ~ \99), 이름 역참조 (?P=name), 조건 그룹 (?(1)...)/(?(name)...)
+# (앞의 역슬래시가 짝수 개 = 이스케이프된 역슬래시면 구문이 아님)
+_GROUP_REFERENCE = re.compile(r'(?<!\\)(?:\\\\)*(?:\\[1-9][0-9]?|\(\?P=|\(\?\()')
+
+
+def build_prefilter(patterns: List[re.Pattern]) -> Optional[re.Pattern]:
+    """
+    모든 패턴을 하나의 alternation으로 묶은 사전 필터.
+    어떤 즐겨찾기에도 걸리지 않는 라인(대부분)은 1회의 search로 건너뛴다.
+    그룹을 참조하는 패턴(역참조/조건 그룹)은 묶으면 그룹 번호가 바뀌거나 이름이 겹쳐 매칭이 달라지므로 None,
+    중간 인라인 플래그 등으로 결합이 불가능해도 None.
+    """
+    if not patterns or any(p.groups and _GROUP_REFERENCE.search(p.pattern) for p in patterns):
+        return None
+    try:
+        return re.compile('|'.join(f'(?:{p.pattern})' for p in patterns), re.IGNORECASE)
+    except re.error:
+        return None
+
+
+class FavoriteTriageWorker(QObject):
+    """여러 즐겨찾기를 한 번의 파일 스캔으로 실행하는 워커 클래스"""
+    progress = Signal(int)
+    finished = Signal(list, float)  # List[TriageSummary], duration
+    failed = Signal(str)
+
+    def __init__(self, snapshot: TextSnapshot, items: List[Tuple[str, str]]):
+        super().__init__()
+        self.snapshot = snapshot
+        self.items = items
+        self._stop = False
+
+    def stop(self):
+        """작업 중지"""
+        self._stop = True
+
+    @QtCore.Slot()
+    def run(self):
+        """일괄 검색 실행"""
+        start_time = time.time()
+        try:
+            summaries: List[TriageSummary] = []
+            active: List[Tuple[TriageSummary, re.Pattern]] = []
+            for name, value in self.items:
+                summary = TriageSummary(name=name, pattern=value)
+                summaries.append(summary)
+                try:
+                    active.append((summary, compile_favorite_pattern(value)))
+                except re.error as e:
+                    summary.error = f'정규식 오류: {e}'
+
+            prefilter = build_prefilter([rx for _, rx in active])
+            lines = self.snapshot.lines
+            total = len(lines)
+
+            for idx, s in enumerate(lines):
+                if self._stop:
+                    return
+                if idx % 5000 == 0:
+                    self.progress.emit(int((idx / max(1, total)) * 100))
+                if prefilter is not None and prefilter.search(s) is None:
+                    continue
+                for summary, rx in active:
+                    if rx.search(s):
+                        if not summary.lines:
+                            summary.sample = s
+                        summary.lines.append(idx)
+
+            self.progress.emit(100)
+            duration = time.time() - start_time
+            self.finished.emit(summaries, duration)
+        except Exception as e:
+            self.failed.emit(str(e))
@@ -0,0 +1 @@
+"""AndyFinder 헤드리스 벤치마크 (run_benchmarks, dumpstate_gen)"""
@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+"""
+벤치마크용 합성 dumpstate / logcat 파일 생성기 - Qt 비의존
+
+- dumpstate: '== dumpstate:' 헤더, '------ SYSTEM LOG (...) ------' 등 섹션 구분선,
+  logcat(threadtime) / dmesg / 'DUMP OF SERVICE' 블록이 섞인 실제 bugreport와 비슷한 구조
+- NUL: 커널 로그 일부 라인에 NUL 문자 구간 포함 (NUL 제거 복사 경로 측정용)
+- 인코딩 혼합: 대부분 UTF-8(한글 포함), 일부 라인은 CP949 바이트 그대로 (디코딩 시 대체 문자)
+- 같은 (종류, 크기, seed)면 항상 같은 파일 (random.Random(seed))
+
+    python -m benchmarks.dumpstate_gen --kind dumpstate --size 100MB -o /tmp/dumpstate_100MB.txt
+"""
+import argparse
+import os
+import random
+import sys
+from typing import Iterator, List
+
+KINDS = ('dumpstate', 'logcat')
+
+SIZE_UNITS = {'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3}
+
+# 검색 벤치마크에서 찾는 라인 (약 1%)
+ACTIVITY_RESUMED_RATIO = 0.01
+
+TAGS = ['ActivityManager', 'WindowManager', 'PackageManager', 'InputDispatcher', 'SurfaceFlinger',
+        'AudioFlinger', 'ConnectivityService', 'WifiService', 'BatteryService', 'PowerManagerService',
+        'chatty', 'Zygote', 'libc', 'DEBUG', 'KeyguardViewMediator', 'NotificationService']
+LEVELS = 'VDIWE'
+PACKAGES = ['com.android.systemui', 'com.android.settings', 'com.sec.android.app.launcher',
+            'com.google.android.gms', 'com.android.phone', 'com.samsung.android.messaging']
+MESSAGES = [
+    'Start proc {pid}:{pkg}/u0a{uid} for activity {{{pkg}/.MainActivity}}',
+    'Displayed {pkg}/.MainActivity: +{ms}ms',
+    'Finished broadcast android.intent.action.SCREEN_ON to {pkg}',
+    'setAppVisibility(Token{{{hex} ActivityRecord}}, visible=true)',
+    'Killing {pid}:{pkg}/u0a{uid} (adj {adj}): empty #17',
+    'Input event injection from pid {pid} failed.',
+    'Wakelock acquired by {pkg} tag="*job*/{pkg}/.SyncService" uid={uid}',
+    'onResume() 호출 - 화면 켜짐 처리 완료 ({ms}ms)',
+    '배터리 잔량 {adj}% 온도 31.{ms}C',
+    'network: NetworkAgentInfo [WIFI () - {pid}] validation passed',
+]
+KERNEL_MESSAGES = [
+    'binder: {pid}:{uid} transaction failed 29189/-22, size 0-0 line 3119',
+    'healthd: battery l={adj} v=4012 t=31.{ms} h=2 st=3 c=-{pid} fc=4500000 chg=',
+    'lowmemorykiller: Killing \'{pkg}\' ({pid}), adj {adj}',
+    'CPU{adj}: shutdown',
+]
+SECTIONS = ['SYSTEM LOG', 'EVENT LOG', 'RADIO LOG', 'KERNEL LOG']
+SERVICES = ['activity', 'window', 'package', 'power', 'battery', 'connectivity', 'meminfo']
+
+
+def parse_size(text: str) -> int:
+    """'10MB', '1GB', '512KB', '1048576' -> 바이트 수"""
+    text = text.strip().upper()
+    for unit, factor in SIZE_UNITS.items():
+        if text.endswith(unit):
+            return int(float(text[:-len(unit)]) * factor)
+    return int(text)
+
+
+def format_size(size: int) -> str:
+    """parse_size의 역변환 (파일 이름/결과 키용)"""
+    for unit, factor in reversed(list(SIZE_UNITS.items())):
+        if size >= factor and size % factor == 0:
+            return f"{size // factor}{unit}"
+    return str(size)
+
+
+class _LineFactory:
+    """라인 종류별 생성 (모든 라인은 '\\n'으로 끝나는 bytes)"""
+
+    def __init__(self, rng: random.Random):
+        self.rng = rng
+        self.second = 0
+
+    def _fields(self) -> dict:
+        rng = self.rng
+        return {
+            'pid': rng.randint(100, 32000),
+            'uid': rng.randint(10000, 10300),
+            'pkg': rng.choice(PACKAGES),
+            'ms': rng.randint(0, 999),
+            'adj': rng.randint(0, 100),
+            'hex': f"{rng.getrandbits(32):08x}",
+        }
+
+    def _timestamp(self) -> str:
+        self.second += 1
+        s = self.second // 200  # 초당 약 200 라인
+        return f"10-19 {(s // 3600) % 24:02d}:{(s // 60) % 60:02d}:{s % 60:02d}.{self.rng.randint(0, 999):03d}"
+
+    def logcat(self) -> bytes:
+        rng = self.rng
+        fields = self._fields()
+        pid, tid = fields['pid'], fields['pid'] + rng.randint(0, 40)
+        if rng.random() < ACTIVITY_RESUMED_RATIO:
+            line = (f"{self._timestamp()}  {pid:5d} {tid:5d} I wm_on_resume_called: "
+                    f"[{fields['hex']},{fields['pkg']}.MainActivity,type=activity_resumed]")
+        else:
+            message = rng.choice(MESSAGES).format(**fields)
+            line = f"{self._timestamp()}  {pid:5d} {tid:5d} {rng.choice(LEVELS)} {rng.choice(TAGS)}: {message}"
+        if rng.random() < 0.002:
+            # 인코딩 혼합: 일부 라인은 CP949로 기록된 한글
+            return (line + ' 앱 비정상 종료\n').encode('cp949')
+        return (line + '\n').encode('utf-8')
+
+    def kernel(self) -> bytes:
+        rng = self.rng
+        self.second += 1
+        line = f"<6>[{self.second / 200:12.6f}] " + rng.choice(KERNEL_MESSAGES).format(**self._fields())
+        if rng.random() < 0.02:
+            # 커널 로그 버퍼 잔여 영역처럼 NUL 구간 포함
+            line += '\x00' * rng.randint(1, 64) + 'x'
+        return (line + '\n').encode('utf-8')
+
+    def service(self) -> bytes:
+        rng = self.rng
+        fields = self._fields()
+        return (f"    #{rng.randint(0, 99)}: ActivityRecord{{{fields['hex']} u0 {fields['pkg']}/.MainActivity "
+                f"t{rng.randint(1, 500)}}} state=RESUMED visible=true\n").encode('utf-8')
+
+
+def iter_dumpstate_chunks(rng: random.Random) -> Iterator[List[bytes]]:
+    """섹션 단위 라인 묶음 (무한)"""
+    factory = _LineFactory(rng)
+    yield [b"========================================================\n",
+           b"== dumpstate: 2026-10-19 12:00:00\n",
+           b"========================================================\n",
+           b"Build fingerprint: 'samsung/bench/bench:14/UP1A.231005.007/S911NKSU3BXK1:user/release-keys'\n",
+           b"Bootloader: S911NKSU3BXK1\n", b"\n"]
+    while True:
+        section = rng.choice(SECTIONS + ['DUMPSYS'])
+        if section == 'DUMPSYS':
+            service = rng.choice(SERVICES)
+            lines = [b"-------------------------------------------------------------------------------\n",
+                     f"DUMP OF SERVICE {service}:\n".encode('utf-8')]
+            lines += [factory.service() for _ in range(rng.randint(50, 400))]
+            lines.append(f"--------- 0.{rng.randint(10, 999)}s was the duration of dumpsys {service}\n".encode())
+        else:
+            make = factory.kernel if section == 'KERNEL LOG' else factory.logcat
+            lines = [f"------ {section} (logcat -v threadtime -d *:v) ------\n".encode('utf-8'),
+                     b"--------- beginning of main\n"]
+            lines += [make() for _ in range(rng.randint(2000, 8000))]
+            lines.append(f"------ 0.{rng.randint(10, 999)}s was the duration of '{section}' ------\n".encode())
+        yield lines
+
+
+def iter_logcat_chunks(rng: random.Random) -> Iterator[List[bytes]]:
+    """logcat -v threadtime 출력 (무한)"""
+    factory = _LineFactory(rng)
+    yield [b"--------- beginning of main\n"]
+    while True:
+        yield [factory.logcat() for _ in range(5000)]
+
+
+def generate(path: str, kind: str = 'dumpstate', size: int = 10 * 1024 * 1024, seed: int = 0) -> int:
+    """size 바이트 근처(마지막 라인까지 포함)의 합성 파일 생성, 실제 바이트 수 반환"""
+    if kind not in KINDS:
+        raise ValueError(f"알 수 없는 종류: {kind} ({', '.join(KINDS)})")
+    rng = random.Random(f"{kind}:{seed}")
+    chunks = iter_dumpstate_chunks(rng) if kind == 'dumpstate' else iter_logcat_chunks(rng)
+    written = 0
+    tmp_path = path + '.part'
+    with open(tmp_path, 'wb') as f:
+        for lines in chunks:
+            data = b''.join(lines)
+            if written + len(data) >= size:
+                # 마지막 묶음은 라인 단위로 잘라서 크기 맞춤
+                for line in lines:
+                    if written >= size:
+                        break
+                    f.write(line)
+                    written += len(line)
+                break
+            f.write(data)
+            written += len(data)
+    os.replace(tmp_path, path)
+    return written
+
+
+def ensure_generated(data_dir: str, kind: str, size: int, seed: int = 0) -> str:
+    """data_dir에 같은 (종류, 크기, seed) 파일이 없을 때만 생성, 경로 반환"""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, f"{kind}_{format_size(size)}_seed{seed}.txt")
+    if not os.path.isfile(path):
+        generate(path, kind, size, seed)
+    return path
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="벤치마크용 합성 dumpstate/logcat 파일 생성")
+    parser.add_argument('--kind', choices=KINDS, default='dumpstate')
+    parser.add_argument('--size', default='10MB', help="예: 10MB, 100MB, 1GB")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('-o', '--output', required=True)
+    args = parser.parse_args(argv)
+
+    written = generate(args.output, args.kind, parse_size(args.size), args.seed)
+    print(f"{args.output}: {written:,} bytes")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,373 @@
+# -*- coding: utf-8 -*-
+"""
+AndyFinder 헤드리스 벤치마크 (QT_QPA_PLATFORM=offscreen)
+
+합성 dumpstate/logcat 파일(dumpstate_gen)로 아래 단계를 측정하고, 처리량과 최대 메모리를
+JSON 히스토리에 누적한 뒤 기준선(baseline)과 비교한다.
+
+- load: FileLoader (인코딩 감지 + 읽기 + 디코딩)
+- line_index: TextSnapshot 라인 분할 + 라인 시작 오프셋
+- search_plain / search_regex / search_favorite: SearchWorker (즐겨찾기는 큰 alternation 정규식)
+- editor_load: TabContent.on_file_loaded (lineView/lineView_clone setPlainText)
+- results_ingest: TabContent.present_results (ResultsModel 반영 + 행 높이 + 첫 결과 이동)
+- color_highlights: TabContent.apply_color_highlights
+- copy_range / copy_to_end / copy_between: 라인 범위 복사 헬퍼
+
+워커는 스레드 없이 run()을 직접 호출해 작업 자체만 측정한다.
+
+    python -m benchmarks.run_benchmarks --sizes 10MB,100MB
+    python -m benchmarks.run_benchmarks --sizes 10MB --save-baseline
+    python -m benchmarks.run_benchmarks --sizes 1GB --kinds dumpstate --gui-max-size 0
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.dumpstate_gen import KINDS, ensure_generated, format_size, parse_size  # noqa: E402
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_HISTORY_PATH = os.path.join(BENCH_DIR, 'history.json')
+DEFAULT_BASELINE_PATH = os.path.join(BENCH_DIR, 'baseline.json')
+DEFAULT_DATA_DIR = os.path.join(tempfile.gettempdir(), 'andyfinder_bench')
+HISTORY_MAX_RUNS = 200
+RSS_SAMPLE_INTERVAL = 0.005
+
+FAVORITE_NAME = 'dumpstate구조'
+# fav/edit_query.json에 FAVORITE_NAME이 없을 때 쓰는 같은 형태의 alternation
+FALLBACK_FAVORITE = ("^(== dumpstate:|--------- beginning of|------ EVENT LOG |------ SYSTEM LOG |"
+                     "------ RADIO LOG |------ KERNEL LOG |------ |--------- |DUMP OF SERVICE |"
+                     "Build fingerprint:|Bootloader:)")
+PLAIN_QUERY = 'type=activity_resumed'
+REGEX_QUERY = r'wm_on_resume_called: \[[0-9a-f]{8},'
+COLOR_KEYWORDS = ('ActivityManager', 'activity_resumed', 'binder', 'Killing')
+
+
+class PeakRssSampler:
+    """측정 구간 동안 RSS를 주기적으로 읽어 최대값 기록 (psutil 또는 /proc, 측정 불가면 None)"""
+
+    def __init__(self, interval: float = RSS_SAMPLE_INTERVAL):
+        from andyfinder.memory import process_rss
+        self._process_rss = process_rss
+        self.interval = interval
+        self.start_rss = process_rss()
+        self.peak = self.start_rss
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _sample(self):
+        rss = self._process_rss()
+        if rss is not None and (self.peak is None or rss > self.peak):
+            self.peak = rss
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self._sample()
+
+
+class BenchmarkRunner:
+    """케이스별 반복 측정 (최소 시간 채택), 결과는 {'<파일 키>/<케이스>': {...}}"""
+
+    def __init__(self, repeat: int = 1, verbose: bool = True):
+        self.repeat = max(1, repeat)
+        self.verbose = verbose
+        self.results: Dict[str, dict] = {}
+
+    def measure(self, key: str, fn: Callable, size: int = 0, lines: int = 0, **extra):
+        """fn()을 repeat번 실행해 가장 빠른 시간과 전체 구간의 최대 RSS 기록, 마지막 반환값 반환"""
+        best = None
+        value = None
+        gc.collect()
+        with PeakRssSampler() as sampler:
+            for _ in range(self.repeat):
+                start = time.perf_counter()
+                value = fn()
+                duration = time.perf_counter() - start
+                best = duration if best is None else min(best, duration)
+
+        record = {'seconds': round(best, 6)}
+        if size:
+            record['bytes'] = size
+            record['mb_per_s'] = round(size / (1024 * 1024) / best, 2) if best > 0 else None
+        if lines:
+            record['lines'] = lines
+            record['lines_per_s'] = round(lines / best, 1) if best > 0 else None
+        if sampler.peak is not None:
+            record['peak_rss'] = sampler.peak
+            record['rss_delta'] = sampler.peak - sampler.start_rss
+        record.update(extra)
+        self.results[key] = record
+
+        if self.verbose:
+            print(format_record(key, record))
+            sys.stdout.flush()
+        return value
+
+    def skip(self, key: str, reason: str):
+        self.results[key] = {'skipped': reason}
+        if self.verbose:
+            print(f"{key:<40} skipped ({reason})")
+
+
+def format_record(key: str, record: dict) -> str:
+    if 'skipped' in record:
+        return f"{key:<40} skipped ({record['skipped']})"
+    parts = [f"{record['seconds'] * 1000:>10,.1f} ms"]
+    if record.get('mb_per_s') is not None:
+        parts.append(f"{record['mb_per_s']:>9,.1f} MB/s")
+    if record.get('lines_per_s') is not None:
+        parts.append(f"{record['lines_per_s']:>12,.0f} lines/s")
+    if record.get('peak_rss') is not None:
+        parts.append(f"peak {record['peak_rss'] / (1024 * 1024):,.0f} MB (+{record['rss_delta'] / (1024 * 1024):,.0f})")
+    return f"{key:<40} " + "  ".join(parts)
+
+
+def run_worker(worker) -> tuple:
+    """QObject 워커의 run()을 현재 스레드에서 실행하고 finished 인자 반환 (failed면 예외)"""
+    outcome = {}
+    worker.finished.connect(lambda *args: outcome.setdefault('finished', args))
+    worker.failed.connect(lambda message: outcome.setdefault('failed', message))
+    worker.run()
+    if 'failed' in outcome:
+        raise RuntimeError(outcome['failed'])
+    return outcome['finished']
+
+
+def load_favorite_query() -> str:
+    """fav/edit_query.json의 FAVORITE_NAME 값 (없으면 FALLBACK_FAVORITE)"""
+    from andyfinder.favorites import find_favorite, load_favorite_nodes
+    try:
+        value = find_favorite(load_favorite_nodes(os.path.join(REPO_ROOT, 'fav', 'edit_query.json')), FAVORITE_NAME)
+    except (OSError, ValueError):
+        value = None
+    return value or FALLBACK_FAVORITE
+
+
+def bench_file(runner: BenchmarkRunner, app, path: str, file_key: str, gui_max_size: int):
+    from PySide6 import QtGui
+    from andyfinder.snapshot import TextSnapshot
+    from andyfinder.workers.file_loader import FileLoader
+    from andyfinder.workers.search_worker import SearchWorker
+
+    size = os.path.getsize(path)
+
+    content, encoding, _ = runner.measure(f"{file_key}/load", lambda: run_worker(FileLoader(path)), size=size)
+
+    def build_snapshot():
+        snapshot = TextSnapshot(content)
+        snapshot.line_starts  # 라인 분할 + 시작 오프셋
+        return snapshot
+
+    snapshot = runner.measure(f"{file_key}/line_index", build_snapshot, size=size)
+    line_count = snapshot.line_count
+    runner.results[f"{file_key}/line_index"]['lines'] = line_count
+
+    searches = [
+        ('search_plain', PLAIN_QUERY, 'plain'),
+        ('search_regex', REGEX_QUERY, 'regex'),
+        ('search_favorite', load_favorite_query(), 'regex'),
+    ]
+    plain_results = []
+    for name, query, mode in searches:
+        results, _ = runner.measure(
+            f"{file_key}/{name}",
+            lambda: run_worker(SearchWorker(snapshot, query, mode, False)),
+            size=size, lines=line_count,
+        )
+        runner.results[f"{file_key}/{name}"]['hits'] = len(results)
+        if name == 'search_plain':
+            plain_results = results
+        del results
+    del snapshot
+
+    gui_keys = ['editor_load', 'results_ingest', 'color_highlights', 'copy_range', 'copy_to_end', 'copy_between']
+    if size > gui_max_size:
+        for name in gui_keys:
+            runner.skip(f"{file_key}/{name}", f"size > --gui-max-size {format_size(gui_max_size)}")
+        return
+
+    from andyfinder.tab_content import TabContent
+
+    tab = TabContent(1)
+    tab.resize(1400, 900)
+    tab.show()
+    app.processEvents()
+    try:
+        def editor_load():
+            tab.current_file_path = path
+            tab.on_file_loaded(content, encoding, 0.0)
+
+        runner.measure(f"{file_key}/editor_load", editor_load, size=size, lines=line_count)
+        runner.results[f"{file_key}/editor_load"]['view_mode'] = tab.view_mode
+        app.processEvents()
+
+        runner.measure(f"{file_key}/results_ingest", lambda: tab.present_results(plain_results, ""),
+                       lines=len(plain_results))
+
+        colors = [(keyword, QtGui.QColor(255, 200, 0)) for keyword in COLOR_KEYWORDS]
+
+        def color_highlights():
+            tab.color_keywords = list(colors)
+            tab.apply_color_highlights()
+
+        runner.measure(f"{file_key}/color_highlights", color_highlights, lines=line_count,
+                       keywords=len(colors))
+
+        runner.measure(f"{file_key}/copy_range", lambda: tab.copy_lines_range_remove_nul(1, line_count),
+                       size=size, lines=line_count)
+        half = max(1, line_count // 2)
+        runner.measure(f"{file_key}/copy_to_end", lambda: tab.copy_lines_to_end_remove_nul(half),
+                       lines=line_count - half + 1)
+        runner.measure(f"{file_key}/copy_between", lambda: tab.copy_lines_between(1, line_count),
+                       size=size, lines=line_count)
+    finally:
+        tab.close_current_file()
+        tab.close()
+        tab.deleteLater()
+        app.processEvents()
+
+
+# ------------------------------ 히스토리 / 기준선 ------------------------------
+
+def git_commit() -> Optional[str]:
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_ROOT,
+                             capture_output=True, text=True, timeout=10)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def build_run_record(results: Dict[str, dict], repeat: int, label: str = "") -> dict:
+    import PySide6
+    from andyfinder.memory import process_rss
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'label': label,
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'pyside': PySide6.__version__,
+        'platform': platform.platform(),
+        'repeat': repeat,
+        'final_rss': process_rss(),
+        'results': results,
+    }
+
+
+def load_json(path: str, default):
+    if not os.path.isfile(path):
+        return default
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_json(path: str, data):
+    """임시 파일 기록 후 교체"""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = path + '.part'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def append_history(path: str, run: dict, max_runs: int = HISTORY_MAX_RUNS):
+    history = load_json(path, {'runs': []})
+    history['runs'] = (history.get('runs', []) + [run])[-max_runs:]
+    write_json(path, history)
+
+
+def compare_runs(current: dict, baseline: dict, threshold: float) -> List[str]:
+    """기준선 대비 시간/최대 RSS 변화 출력, threshold(%)보다 느려진 케이스 키 목록 반환"""
+    regressions = []
+    base_results = baseline.get('results', {})
+    print(f"\n기준선 비교 (baseline {baseline.get('timestamp', '?')} {baseline.get('commit') or ''}, "
+          f"threshold {threshold:.0f}%)")
+    for key, record in current['results'].items():
+        base = base_results.get(key)
+        if not base or 'seconds' not in base or 'seconds' not in record:
+            continue
+        change = (record['seconds'] - base['seconds']) / base['seconds'] * 100 if base['seconds'] else 0.0
+        line = f"{key:<40} {base['seconds'] * 1000:>10,.1f} -> {record['seconds'] * 1000:>10,.1f} ms ({change:+6.1f}%)"
+        if record.get('peak_rss') is not None and base.get('peak_rss') is not None:
+            rss_change = (record['peak_rss'] - base['peak_rss']) / (1024 * 1024)
+            line += f"  peak {rss_change:+,.0f} MB"
+        if change > threshold:
+            line += "  << REGRESSION"
+            regressions.append(key)
+        print(line)
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="AndyFinder 헤드리스 벤치마크")
+    parser.add_argument('--sizes', default='10MB,100MB', help="쉼표 구분 (예: 10MB,100MB,1GB)")
+    parser.add_argument('--kinds', default=','.join(KINDS), help="쉼표 구분 (dumpstate,logcat)")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1, help="케이스별 반복 횟수 (가장 빠른 시간 기록)")
+    parser.add_argument('--data-dir', default=DEFAULT_DATA_DIR, help="생성 파일 보관 위치 (재사용)")
+    parser.add_argument('--gui-max-size', default='200MB',
+                        help="이보다 큰 파일은 에디터/결과/복사 케이스 생략 (0: 항상 생략)")
+    parser.add_argument('--history', default=DEFAULT_HISTORY_PATH)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE_PATH)
+    parser.add_argument('--save-baseline', action='store_true', help="이번 결과를 기준선으로 저장")
+    parser.add_argument('--threshold', type=float, default=10.0, help="회귀로 판단할 시간 증가율(%%)")
+    parser.add_argument('--label', default="", help="히스토리에 함께 기록할 설명")
+    args = parser.parse_args(argv)
+
+    sizes = [parse_size(s) for s in args.sizes.split(',') if s.strip()]
+    kinds = [k.strip() for k in args.kinds.split(',') if k.strip()]
+    for kind in kinds:
+        if kind not in KINDS:
+            parser.error(f"알 수 없는 종류: {kind}")
+
+    from PySide6 import QtWidgets
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+    runner = BenchmarkRunner(args.repeat)
+    for kind in kinds:
+        for size in sizes:
+            path = ensure_generated(args.data_dir, kind, size, args.seed)
+            bench_file(runner, app, path, f"{kind}_{format_size(size)}", parse_size(args.gui_max_size))
+
+    run = build_run_record(runner.results, runner.repeat, args.label)
+    append_history(args.history, run)
+    print(f"\n히스토리 기록: {args.history}")
+
+    regressions = []
+    if args.save_baseline:
+        write_json(args.baseline, run)
+        print(f"기준선 저장: {args.baseline}")
+    elif os.path.isfile(args.baseline):
+        regressions = compare_runs(run, load_json(args.baseline, {}), args.threshold)
+
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    code = main()
+    sys.stdout.flush()
+    # PySide 종료 시 위젯 정리 순서 문제를 피하기 위해 바로 종료
+    os._exit(code)
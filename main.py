@@ -4,23 +4,49 @@ AndyFinder - 대용량 텍스트 파일 검색 및 분석 도구
 
 PySide6 기반의 데스크톱 애플리케이션으로,
 정규식 검색, 북마크, 즐겨찾기 등 다양한 기능을 제공합니다.
+
+    python main.py                      # GUI
+    python main.py search [옵션] ...    # 명령줄 검색 (Qt 없이 실행, python main.py search -h)
 """
 
+import time
+g_startup_time = time.perf_counter()  # 시작 시간 측정 기준 (다른 import보다 먼저)
+
 import sys
-from PySide6 import QtWidgets
-from andyfinder import MainWindow, apply_light_theme
+from andyfinder.constants import STARTUP_BUDGET_SEC
+
+
+def report_startup_time(win):
+    """첫 이벤트 루프 진입 시점(창이 입력 가능해진 시점)까지 걸린 시간을 상태바에 표시, 예산 초과 시 경고"""
+    duration = time.perf_counter() - g_startup_time
+    if duration > STARTUP_BUDGET_SEC:
+        win.statusBar().showMessage(
+            f"시작 시간 {duration:.2f} sec - 예산 {STARTUP_BUDGET_SEC:.1f} sec 초과", 5000
+        )
+    else:
+        win.statusBar().showMessage(f"시작 시간 {duration:.2f} sec", 3000)
 
 
 def main():
     """메인 애플리케이션 진입점"""
+    # Qt는 GUI 실행 시에만 import (명령줄 검색은 Qt 없이 실행)
+    from PySide6 import QtCore, QtWidgets
+    from andyfinder import MainWindow, apply_light_theme
+
     app = QtWidgets.QApplication(sys.argv)
     apply_light_theme(app)
 
     win = MainWindow()
     win.show()
+    QtCore.QTimer.singleShot(0, lambda: report_startup_time(win))
+    # 시작 과정(첫 화면 표시 전)은 제외하고 이벤트 루프 진입 후부터 멈춤 감시
+    QtCore.QTimer.singleShot(0, win.stall_watchdog.start)
 
     sys.exit(app.exec())
 
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ['search']:
+        from andyfinder.cli import main as cli_main
+        sys.exit(cli_main(sys.argv[2:]))
     main()
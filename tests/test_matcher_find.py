@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""에디터 내부 검색(F3/F4)의 지연 검색(find_next/find_prev)이 전체 finditer 결과와 같은지 확인"""
+import re
+
+import pytest
+
+from andyfinder.matcher import find_next, find_prev, is_line_local
+
+CHUNK = 7
+
+TEXTS = [
+    'xxxxxxxa\nyyyy',
+    'xxxxxxb\na',
+    '\nb\nab',
+    'abc\nxxab\n\nab abab\nzzzzzzzzzzzzzzab\nb\na\n',
+]
+
+PATTERNS = [r'a$', r'b\na', r'ab', r'a.', r'\d+|b', r'b\s*a', r'^a', r'(?m)a$', r'[^x]b', r'b\Z', r'\bab\b']
+
+
+def _cases():
+    for text in TEXTS:
+        for pattern in PATTERNS:
+            yield text, re.compile(pattern, re.IGNORECASE)
+
+
+def _span(m):
+    return (m.start(), m.end()) if m else None
+
+
+@pytest.mark.parametrize('text,regex', list(_cases()))
+def test_find_next_matches_finditer(text, regex):
+    spans = [(m.start(), m.end()) for m in regex.finditer(text)]
+    # F3 연속 이동: 직전 매칭 끝에서 다음 매칭
+    pos = 0
+    for expected in spans:
+        assert _span(find_next(regex, text, pos, len(text))) == expected
+        pos = max(expected[1], expected[0] + 1)
+    assert find_next(regex, text, pos, len(text)) is None
+
+
+@pytest.mark.parametrize('text,regex', list(_cases()))
+def test_find_prev_matches_finditer(text, regex):
+    spans = [(m.start(), m.end()) for m in regex.finditer(text)]
+    # F4 연속 이동: 현재 매칭 시작 앞의 마지막 매칭
+    for i, (start, _) in enumerate(spans):
+        expected = spans[i - 1] if i else None
+        assert _span(find_prev(regex, text, start, chunk=CHUNK)) == expected
+    expected = spans[-1] if spans else None
+    assert _span(find_prev(regex, text, len(text) + 1, chunk=CHUNK)) == expected
+
+
+def test_reported_chunk_boundary_cases():
+    assert find_next(re.compile(r'a$'), 'xxxxxxxa\nyyyy', 0, 13) is None
+    assert _span(find_next(re.compile(r'b\na'), 'xxxxxxb\na', 0, 9)) == (6, 9)
+    assert _span(find_prev(re.compile(r'b\na'), '\nb\nab', 2, chunk=CHUNK)) == (1, 4)
+
+
+def test_is_line_local():
+    assert is_line_local(re.compile(r'type=activity_\w+ \d+\.'))
+    for pattern in (r'a$', r'b\na', r'b\s', r'[^x]', r'(?s)a.', r'a(?=b)', r'a\Z'):
+        assert not is_line_local(re.compile(pattern))
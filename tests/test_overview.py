@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+"""오버뷰 룰러 키워드 분포: 창 단위 검색이 라인별 검색과 같은 라인을 찾는지 확인"""
+import re
+
+from andyfinder import overview
+from andyfinder.overview import keyword_lines_job
+from andyfinder.snapshot import TextSnapshot
+
+TEXT = "\n".join(f"line {i} {'ERROR' if i % 7 == 0 else 'ok'} {'am_crash' if i % 11 == 3 else ''}" for i in range(200))
+
+
+def _expected(pattern):
+    return [i for i, s in enumerate(TEXT.split('\n')) if pattern.search(s)]
+
+
+def test_windowed_keyword_lines(monkeypatch):
+    monkeypatch.setattr(overview, '_KEYWORD_WINDOW', 5)
+    pattern = re.compile('(' + re.escape('am_crash') + ')|(' + re.escape('error') + ')', re.IGNORECASE)
+    lines = keyword_lines_job(TextSnapshot(TEXT), pattern)(lambda: False)
+    assert list(lines) == _expected(pattern)
+
+
+def test_keyword_job_stops():
+    pattern = re.compile(re.escape('never'))
+    assert keyword_lines_job(TextSnapshot(TEXT), pattern)(lambda: True) is None
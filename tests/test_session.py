@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""검색결과 캐시 기록/복원과 기록 중지 확인"""
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from andyfinder import session
+
+FINGERPRINT = {'size': 10, 'mtime_ns': 1, 'sample': 'abc'}
+SEARCH = {'query': 'ab', 'mode': 'plain', 'case_sensitive': False}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(session, 'RESULT_CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+
+def _results(n):
+    return [SimpleNamespace(line=i, matches=[(0, 2), (5, 7)]) for i in range(n)]
+
+
+def test_save_and_load_result_cache():
+    assert session.save_result_cache(FINGERPRINT, SEARCH, _results(3))
+    assert session.load_result_cache(FINGERPRINT, SEARCH) == [(i, [(0, 2), (5, 7)]) for i in range(3)]
+    assert session.load_result_cache(FINGERPRINT, dict(SEARCH, query='x')) is None
+
+
+def test_save_in_batches_matches_single_json(cache_dir, monkeypatch):
+    monkeypatch.setattr(session, '_WRITE_BATCH', 3)
+    results = _results(10)
+    assert session.save_result_cache(FINGERPRINT, SEARCH, results)
+    with open(session.result_cache_path(FINGERPRINT, SEARCH), encoding='utf-8') as f:
+        data = json.load(f)
+    assert data == {
+        'fingerprint': FINGERPRINT,
+        'search': SEARCH,
+        'lines': list(range(10)),
+        'matches': [[0, 2, 5, 7]] * 10,
+    }
+
+
+def test_stopped_save_keeps_previous_cache(cache_dir):
+    assert session.save_result_cache(FINGERPRINT, SEARCH, _results(1))
+    assert not session.save_result_cache(FINGERPRINT, SEARCH, _results(10000), should_stop=lambda: True)
+    assert not [name for name in os.listdir(cache_dir) if name.endswith('.part')]
+    assert session.load_result_cache(FINGERPRINT, SEARCH) == [(0, [(0, 2), (5, 7)])]
@@ -0,0 +1,10 @@
+# -*- coding: utf-8 -*-
+"""파일 로더: 스냅샷 라인이 QTextDocument 블록과 같도록 줄바꿈 통일"""
+from andyfinder.text_loader import read_text
+
+
+def test_block_separators_become_newlines(tmp_path):
+    path = tmp_path / 'sample.log'
+    path.write_bytes('a\u2029b\nc\r\nd\re\ufdd0f\ufdd1g'.encode('utf-8'))
+    content, _ = read_text(str(path))
+    assert content.split('\n') == ['a', 'b', 'c', 'd', 'e', 'f', 'g']
@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+"""즐겨찾기 일괄 실행 사전 필터: 통과시키지 않은 라인은 어떤 즐겨찾기에도 매칭되지 않아야 함"""
+from andyfinder.workers.triage_worker import build_prefilter, compile_favorite_pattern
+
+
+def test_prefilter_keeps_every_hit():
+    patterns = [compile_favorite_pattern(p) for p in ('am_crash', r'type=\w+', 'FATAL')]
+    prefilter = build_prefilter(patterns)
+    assert prefilter is not None
+    for line in ('x am_crash y', 'type=resumed', 'fatal error', 'nothing here'):
+        assert (prefilter.search(line) is not None) == any(p.search(line) for p in patterns)
+
+
+def test_numbered_backreference_disables_prefilter():
+    patterns = [compile_favorite_pattern(p) for p in ('(a)x', r'(b)\1')]
+    assert patterns[1].search('bb')
+    assert build_prefilter(patterns) is None
+
+
+def test_group_references_disable_prefilter():
+    for value, line in ((r'(?P<w>b)(?P=w)', 'bb'),
+                        (r'(a)?(?(1)x|y)', 'y'),
+                        (r'(?P<q>a)?(?(q)x|y)', 'y'),
+                        (r'(a)(b)(c)(d)(e)(f)(g)(h)(i)(j)\10', 'abcdefghijj')):
+        patterns = [compile_favorite_pattern(p) for p in ('(z)x', value)]
+        assert patterns[1].search(line), value
+        assert build_prefilter(patterns) is None, value
+
+
+def test_escaped_backslash_is_not_backreference():
+    assert build_prefilter([compile_favorite_pattern(r'path\\1')]) is not None